@@ -11,15 +11,24 @@ import os
 import sys
 import yaml
 import shutil
+import sqlite3
 import hashlib
 import argparse
+import codecs
+import io
+import mmap
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Iterable
 from enum import Enum
 import json
 import re
 import time
+import math
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 
 class AgentMode(Enum):
     """Agent operation modes"""
@@ -64,6 +73,46 @@ class ChunkingStrategy(Enum):
     SECTION = "section"         # Section/header-based chunking
     HYBRID = "hybrid"          # Combined approach
     PHASED = "phased"          # Phased approach for large docs
+    TOKEN_BUDGET = "token_budget"  # Lines packed up to a token budget
+
+@contextmanager
+def mapped_view(file_path: Path, min_size: int = 0) -> Iterator[Optional[memoryview]]:
+    """
+    Yield a read-only mmap-backed memoryview of a file
+    Pages come from the OS page cache shared between processes; yields None
+    for small, empty or unmappable files so callers fall back to read()
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        mapping = None
+        if size and size >= min_size:
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+    
+    if mapping is None:
+        yield None
+        return
+    
+    view = memoryview(mapping)
+    try:
+        yield view
+    finally:
+        view.release()
+        mapping.close()
+
+# Process-local processor used by phase pipeline workers, set by the pool initializer
+_phase_processor = None
+
+def _init_phase_worker(processor: 'PhasedDocumentProcessor'):
+    """Pool initializer: keep one processor per worker process"""
+    global _phase_processor
+    _phase_processor = processor
+
+def _phase_worker_process(doc_path: str) -> Optional[Dict]:
+    """Discover, score and extract one document inside a worker process"""
+    return _phase_processor._process_document(Path(doc_path))
 
 class PhasedDocumentProcessor:
     """
@@ -71,10 +120,23 @@ class PhasedDocumentProcessor:
     Based on mixed-documentation-agent specification
     """
     
+    # Documents at least this large are decoded straight from an mmap view
+    MMAP_THRESHOLD = 16 * 1024 * 1024
+    # Characters (or mapped bytes) scanned per block during extraction
+    TEXT_BLOCK_SIZE = 1024 * 1024
+    # One pass finds "X is/has/contains Y" (zero-width, so relations may chain
+    # and the source may itself be an entity) and capitalised entity words
+    KNOWLEDGE_SCANNER = re.compile(
+        r'\b(?:(?=(?P<src>\w+)\s+(?P<verb>(?i:is|has|contains))\s+(?P<target>\w+))'
+        r'(?P<entity>[A-Z][a-z]+\b)?|(?P<name>[A-Z][a-z]+\b))'
+    )
+    WORD_RUN = re.compile(r'\w+')
+    
     def __init__(self, agent_path: Path):
         self.agent_path = agent_path
         self.processing_path = agent_path / "processing"
         self.phases_path = self.processing_path / "phases"
+        self.results_db = self.processing_path / "phase_results.db"
         self.metrics_path = self.processing_path / "metrics"
         
         # Create processing directories
@@ -126,32 +188,8 @@ class PhasedDocumentProcessor:
             if not doc_path.exists():
                 continue
             
-            # Analyze document
-            file_ext = doc_path.suffix.lower()
-            file_size = doc_path.stat().st_size
-            
-            # Update format distribution
-            discovery_results["format_distribution"][file_ext] = \
-                discovery_results["format_distribution"].get(file_ext, 0) + 1
-            
-            # Classify by size
-            size_category = self._classify_size(file_size)
-            discovery_results["size_distribution"][size_category] = \
-                discovery_results["size_distribution"].get(size_category, 0) + 1
-            
-            # Document inventory
-            doc_info = {
-                "path": str(doc_path),
-                "format": file_ext,
-                "size": file_size,
-                "size_category": size_category,
-                "discovered_at": datetime.now().isoformat()
-            }
-            discovery_results["document_inventory"].append(doc_info)
-            
-            # Initial classification
-            doc_class = self._classify_document(doc_path)
-            discovery_results["classification"][str(doc_path)] = doc_class
+            doc_info, doc_class = self._discover_document(doc_path)
+            self._record_discovery(discovery_results, doc_info, doc_class)
         
         # Save phase results
         self._save_phase_results(ProcessingPhase.DISCOVERY, discovery_results)
@@ -184,26 +222,7 @@ class PhasedDocumentProcessor:
             
             # Calculate quality score
             quality_score = self._assess_quality(doc_path, doc_info)
-            quality_results["quality_scores"][str(doc_path)] = quality_score
-            
-            # Quality-based filtering
-            if quality_score < 0.3:
-                quality_results["filtered_documents"].append(str(doc_path))
-                continue
-            
-            # Prioritization
-            if quality_score >= 0.8:
-                quality_results["high_priority"].append(str(doc_path))
-            elif quality_score >= 0.5:
-                quality_results["medium_priority"].append(str(doc_path))
-            else:
-                quality_results["low_priority"].append(str(doc_path))
-            
-            quality_results["assessed_documents"].append({
-                "path": str(doc_path),
-                "quality_score": quality_score,
-                "priority": self._get_priority_level(quality_score)
-            })
+            self._record_quality(quality_results, str(doc_path), quality_score)
         
         # Save phase results
         self._save_phase_results(ProcessingPhase.QUALITY_ASSESSMENT, quality_results)
@@ -243,27 +262,331 @@ class PhasedDocumentProcessor:
                 
                 # Extract knowledge
                 extracted = self._extract_knowledge(doc_path)
+                self._record_extraction(extraction_results, doc_path_str, extracted)
+        
+        self._finish_extraction(extraction_results)
+        
+        return extraction_results
+    
+    def phases1to3_pipelined(self, doc_paths: List[Path], workers: int = 1,
+                             resume: bool = False) -> Dict:
+        """
+        Phases 1-3 as a per-document pipeline over a worker pool
+        Each worker discovers, scores and extracts one document at a time, so
+        documents stream through all three phases instead of waiting for the
+        whole batch at every phase boundary. Results are merged afterwards in
+        input and priority order, matching the sequential phase methods.
+        
+        Every processed document is appended to a checkpoint log keyed by
+        content hash. With resume=True, documents whose content was already
+        checkpointed are reused instead of re-extracted, so an interrupted or
+        incremental ingestion only processes new and changed documents.
+        Checkpoints of documents outside doc_paths are kept while their files
+        exist, so a run over just the new documents keeps the others resumable.
+        """
+        print(f"🚀 Phases 1-3: Pipelined discovery, quality and extraction ({workers} workers)")
+        
+        previous = self.load_checkpoints()
+        checkpoints = previous if resume else {}
+        by_path = {record["path"]: record for record in checkpoints.values()}
+        self.phase_status["completed_phases"] = []
+        
+        processed = [None] * len(doc_paths)
+        counts = {"extracted": 0, "resumed": 0}
+        kept = {}
+        pending = {}
+        executor = None
+        in_flight = {}
+        
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers,
+                                           initializer=_init_phase_worker,
+                                           initargs=(self,))
+        max_in_flight = max(1, workers) * 4
+        
+        def record(index, result, log):
+            processed[index] = result
+            if result is None:
+                return
+            content_hash, stat_result = pending.pop(index)
+            entry = self._checkpoint_record(content_hash, stat_result, result)
+            kept[content_hash] = entry
+            counts["extracted"] += 1
+            log.write(json.dumps(entry) + "\n")
+            log.flush()
+        
+        def drain(futures, log):
+            for future in futures:
+                index = in_flight.pop(future)
+                try:
+                    record(index, future.result(), log)
+                except Exception as e:
+                    print(f"    Warning: Error processing {doc_paths[index]}: {e}")
+        
+        self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.checkpoint_file, 'a', encoding='utf-8') as log:
+                for index, doc_path in enumerate(doc_paths):
+                    try:
+                        stat_result = doc_path.stat()
+                        content_hash = self._checkpoint_hash(doc_path, stat_result, by_path)
+                    except OSError:
+                        continue
+                    
+                    # Reuse checkpointed results for content seen before
+                    entry = checkpoints.get(content_hash) or kept.get(content_hash)
+                    if entry is not None:
+                        processed[index] = self._relocate_result(entry["result"], doc_path)
+                        kept[content_hash] = self._checkpoint_record(content_hash, stat_result,
+                                                                     processed[index])
+                        counts["resumed"] += 1
+                        continue
+                    
+                    pending[index] = (content_hash, stat_result)
+                    if executor is None:
+                        try:
+                            record(index, self._process_document(doc_path), log)
+                        except Exception as e:
+                            print(f"    Warning: Error processing {doc_path}: {e}")
+                        continue
+                    
+                    in_flight[executor.submit(_phase_worker_process, str(doc_path))] = index
+                    if len(in_flight) >= max_in_flight:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        drain(done, log)
                 
-                # Store entities
-                extraction_results["extracted_entities"].extend(extracted["entities"])
-                
-                # Store relationships
-                extraction_results["extracted_relationships"].extend(extracted["relationships"])
-                
-                # Update knowledge graph
-                self._update_knowledge_graph(
-                    extraction_results["knowledge_graph"],
-                    extracted
-                )
-                
-                # Maintain source mapping
-                extraction_results["source_mapping"][doc_path_str] = {
-                    "entities": len(extracted["entities"]),
-                    "relationships": len(extracted["relationships"]),
-                    "extraction_time": datetime.now().isoformat()
-                }
+                drain(as_completed(list(in_flight)), log)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        
+        self._compact_checkpoints(previous, kept)
+        self.phase_status["checkpoint"] = counts
+        if resume:
+            print(f"   Resumed {counts['resumed']} checkpointed documents, "
+                  f"extracted {counts['extracted']}")
+        
+        return self._merge_pipelined(doc_paths, processed)
+    
+    @property
+    def checkpoint_file(self) -> Path:
+        """Append-only log of per-document phase 1-3 results"""
+        return self.processing_path / "checkpoints.jsonl"
+    
+    def load_checkpoints(self) -> Dict[str, Dict]:
+        """Load per-document checkpoints keyed by content hash"""
+        checkpoints = {}
+        if not self.checkpoint_file.exists():
+            return checkpoints
+        
+        with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by an interrupted run
+                    continue
+                checkpoints[entry["hash"]] = entry
         
-        # Calculate metrics
+        return checkpoints
+    
+    def _checkpoint_hash(self, doc_path: Path, stat_result: os.stat_result,
+                         by_path: Dict[str, Dict]) -> str:
+        """Content hash of a document, reusing the checkpointed hash if size and mtime match"""
+        entry = by_path.get(str(doc_path))
+        if (entry is not None and entry["size"] == stat_result.st_size
+                and entry["mtime_ns"] == stat_result.st_mtime_ns):
+            return entry["hash"]
+        
+        digest = hashlib.sha256()
+        with mapped_view(doc_path, min_size=self.MMAP_THRESHOLD) as view:
+            if view is not None:
+                digest.update(view)
+                return digest.hexdigest()
+        
+        with open(doc_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _checkpoint_record(self, content_hash: str, stat_result: os.stat_result,
+                           result: Dict) -> Dict:
+        """Checkpoint entry for one processed document"""
+        return {
+            "hash": content_hash,
+            "path": result["info"]["path"],
+            "size": stat_result.st_size,
+            "mtime_ns": stat_result.st_mtime_ns,
+            "result": result
+        }
+    
+    def _relocate_result(self, result: Dict, doc_path: Path) -> Dict:
+        """Point a checkpointed result at the path its content is now found at"""
+        old_path, new_path = result["info"]["path"], str(doc_path)
+        if old_path == new_path:
+            return result
+        
+        relocated = dict(result, info=dict(result["info"], path=new_path))
+        if result["extracted"] is not None:
+            relocated["extracted"] = {
+                "entities": [dict(e, source=new_path) for e in result["extracted"]["entities"]],
+                "relationships": result["extracted"]["relationships"]
+            }
+        return relocated
+    
+    def _compact_checkpoints(self, previous: Dict[str, Dict], kept: Dict[str, Dict]):
+        """
+        Rewrite the checkpoint log with one entry per existing document
+        Entries from earlier runs survive unless their file is gone or the
+        last run checkpointed the same path or content again
+        """
+        paths = {entry["path"] for entry in kept.values()}
+        merged = {
+            content_hash: entry for content_hash, entry in previous.items()
+            if content_hash not in kept and entry["path"] not in paths
+            and Path(entry["path"]).exists()
+        }
+        merged.update(kept)
+        
+        temp_file = self.checkpoint_file.with_suffix(".jsonl.tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            for entry in merged.values():
+                f.write(json.dumps(entry) + "\n")
+        os.replace(temp_file, self.checkpoint_file)
+    
+    def _process_document(self, doc_path: Path) -> Optional[Dict]:
+        """Run discovery, quality assessment and extraction for one document"""
+        if not doc_path.exists():
+            return None
+        
+        doc_info, doc_class = self._discover_document(doc_path)
+        quality_score = self._assess_quality(doc_path, doc_info)
+        extracted = self._extract_knowledge(doc_path) if quality_score >= 0.3 else None
+        
+        return {
+            "info": doc_info,
+            "classification": doc_class,
+            "quality_score": quality_score,
+            "extracted": extracted
+        }
+    
+    def _merge_pipelined(self, doc_paths: List[Path], processed: List[Optional[Dict]]) -> Dict:
+        """Assemble and save phase 1-3 results from per-document pipeline output"""
+        discovery_results = {
+            "total_documents": len(doc_paths),
+            "format_distribution": {},
+            "size_distribution": {},
+            "document_inventory": [],
+            "classification": {}
+        }
+        quality_results = {
+            "assessed_documents": [],
+            "quality_scores": {},
+            "filtered_documents": [],
+            "high_priority": [],
+            "medium_priority": [],
+            "low_priority": []
+        }
+        extraction_results = {
+            "extracted_entities": [],
+            "extracted_relationships": [],
+            "knowledge_graph": {},
+            "extraction_metrics": {},
+            "source_mapping": {}
+        }
+        
+        done = [item for item in processed if item is not None]
+        
+        for item in done:
+            self._record_discovery(discovery_results, item["info"], item["classification"])
+            self._record_quality(quality_results, item["info"]["path"], item["quality_score"])
+        
+        # Merge the knowledge graph in the same priority order as phase 3
+        extracted = {item["info"]["path"]: item["extracted"] for item in done}
+        for priority in ["high_priority", "medium_priority", "low_priority"]:
+            for doc_path_str in quality_results[priority]:
+                self._record_extraction(extraction_results, doc_path_str,
+                                        extracted[doc_path_str])
+        
+        self._save_phase_results(ProcessingPhase.DISCOVERY, discovery_results)
+        self._save_phase_results(ProcessingPhase.QUALITY_ASSESSMENT, quality_results)
+        self._finish_extraction(extraction_results)
+        
+        return {
+            "discovery": discovery_results,
+            "quality": quality_results,
+            "extraction": extraction_results
+        }
+    
+    def _discover_document(self, doc_path: Path) -> Tuple[Dict, str]:
+        """Inventory entry and initial classification for one document"""
+        file_ext = doc_path.suffix.lower()
+        file_size = doc_path.stat().st_size
+        
+        doc_info = {
+            "path": str(doc_path),
+            "format": file_ext,
+            "size": file_size,
+            "size_category": self._classify_size(file_size),
+            "discovered_at": datetime.now().isoformat()
+        }
+        
+        return doc_info, self._classify_document(doc_path)
+    
+    def _record_discovery(self, discovery_results: Dict, doc_info: Dict, doc_class: str):
+        """Add one discovered document to phase 1 results"""
+        # Update format and size distributions
+        file_ext = doc_info["format"]
+        discovery_results["format_distribution"][file_ext] = \
+            discovery_results["format_distribution"].get(file_ext, 0) + 1
+        
+        size_category = doc_info["size_category"]
+        discovery_results["size_distribution"][size_category] = \
+            discovery_results["size_distribution"].get(size_category, 0) + 1
+        
+        discovery_results["document_inventory"].append(doc_info)
+        discovery_results["classification"][doc_info["path"]] = doc_class
+    
+    def _record_quality(self, quality_results: Dict, doc_path_str: str, quality_score: float):
+        """Add one scored document to phase 2 results"""
+        quality_results["quality_scores"][doc_path_str] = quality_score
+        
+        # Quality-based filtering
+        if quality_score < 0.3:
+            quality_results["filtered_documents"].append(doc_path_str)
+            return
+        
+        # Prioritization
+        if quality_score >= 0.8:
+            quality_results["high_priority"].append(doc_path_str)
+        elif quality_score >= 0.5:
+            quality_results["medium_priority"].append(doc_path_str)
+        else:
+            quality_results["low_priority"].append(doc_path_str)
+        
+        quality_results["assessed_documents"].append({
+            "path": doc_path_str,
+            "quality_score": quality_score,
+            "priority": self._get_priority_level(quality_score)
+        })
+    
+    def _record_extraction(self, extraction_results: Dict, doc_path_str: str, extracted: Dict):
+        """Add one document's extracted knowledge to phase 3 results"""
+        extraction_results["extracted_entities"].extend(extracted["entities"])
+        extraction_results["extracted_relationships"].extend(extracted["relationships"])
+        
+        # Update knowledge graph
+        self._update_knowledge_graph(extraction_results["knowledge_graph"], extracted)
+        
+        # Maintain source mapping
+        extraction_results["source_mapping"][doc_path_str] = {
+            "entities": len(extracted["entities"]),
+            "relationships": len(extracted["relationships"]),
+            "extraction_time": datetime.now().isoformat()
+        }
+    
+    def _finish_extraction(self, extraction_results: Dict):
+        """Calculate phase 3 metrics and save the results"""
         extraction_results["extraction_metrics"] = {
             "total_entities": len(extraction_results["extracted_entities"]),
             "total_relationships": len(extraction_results["extracted_relationships"]),
@@ -271,10 +594,7 @@ class PhasedDocumentProcessor:
             "graph_nodes": len(extraction_results["knowledge_graph"])
         }
         
-        # Save phase results
         self._save_phase_results(ProcessingPhase.EXTRACTION, extraction_results)
-        
-        return extraction_results
     
     def phase4_synthesis(self, extraction_results: Dict) -> Dict:
         """
@@ -393,7 +713,8 @@ class PhasedDocumentProcessor:
         }
         
         # Load previous phase results
-        synthesis_results = self._load_phase_results(ProcessingPhase.SYNTHESIS)
+        synthesis_results = self._load_phase_results(ProcessingPhase.SYNTHESIS,
+                                                     keys=["synthesized_knowledge"])
         
         # Integrate validated knowledge
         for key, status in validation_results["validation_status"].items():
@@ -500,54 +821,94 @@ class PhasedDocumentProcessor:
             return "low"
     
     def _extract_knowledge(self, doc_path: Path) -> Dict:
-        """Extract knowledge from document"""
-        # Simplified extraction for demonstration
-        entities = []
-        relationships = []
+        """
+        Extract knowledge from document
+        One compiled scan per text block finds capitalised entities and
+        "X is/has/contains Y" relations together; repeats are counted rather
+        than emitted again
+        """
+        source = str(doc_path)
+        entity_counts = Counter()
+        relation_counts = Counter()
+        # Relations of each verb do not overlap, as with one findall per verb
+        relation_ends = {}
         
         try:
-            with open(doc_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Simple entity extraction (can be enhanced with NLP)
-            # Extract capitalized words as potential entities
-            words = re.findall(r'\b[A-Z][a-z]+\b', content)
-            unique_words = set(words)
-            
-            for word in unique_words:
-                entities.append({
-                    "name": word,
-                    "type": "concept",
-                    "source": str(doc_path),
-                    "confidence": 0.7
-                })
-            
-            # Simple relationship extraction
-            # Look for patterns like "X is Y" or "X has Y"
-            patterns = [
-                r'(\w+)\s+is\s+(\w+)',
-                r'(\w+)\s+has\s+(\w+)',
-                r'(\w+)\s+contains\s+(\w+)'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    relationships.append({
-                        "source": match[0],
-                        "target": match[1],
-                        "type": "related",
-                        "confidence": 0.6
-                    })
+            carry, base = "", 0
+            for block in self._iter_text_blocks(doc_path):
+                text = carry + block
+                cut = self._complete_prefix(text)
+                self._scan_knowledge(text, cut, base, entity_counts, relation_counts,
+                                     relation_ends)
+                carry, base = text[cut:], base + cut
+            self._scan_knowledge(carry, len(carry), base, entity_counts, relation_counts,
+                                 relation_ends)
         
         except Exception as e:
             print(f"    Warning: Error extracting from {doc_path}: {e}")
         
+        entities = [
+            {"name": name, "type": "concept", "source": source, "confidence": 0.7,
+             "count": count}
+            for name, count in entity_counts.items()
+        ]
+        relationships = [
+            {"source": src, "target": target, "type": "related", "predicate": predicate,
+             "confidence": 0.6, "count": count}
+            for (src, predicate, target), count in relation_counts.items()
+        ]
+        
         return {
             "entities": entities,
             "relationships": relationships
         }
     
+    def _scan_knowledge(self, text: str, limit: int, base: int, entity_counts: Counter,
+                        relation_counts: Counter, relation_ends: Dict[str, int]):
+        """Count entities and relations starting before limit in a text block"""
+        for match in self.KNOWLEDGE_SCANNER.finditer(text):
+            start = match.start()
+            if start >= limit:
+                break
+            
+            entity = match.group("entity") or match.group("name")
+            if entity:
+                entity_counts[entity] += 1
+            
+            verb = match.group("verb")
+            if verb:
+                verb = verb.lower()
+                if base + start >= relation_ends.get(verb, 0):
+                    relation_ends[verb] = base + match.end("target")
+                    relation_counts[(match.group("src"), verb, match.group("target"))] += 1
+    
+    def _complete_prefix(self, text: str) -> int:
+        """
+        Length of the prefix of a block in which every match is complete
+        A relation spans three words, so anything starting before the fourth
+        word from the end (the last may be cut mid-word) is safe to scan
+        """
+        window = max(0, len(text) - 4096)
+        starts = [m.start() for m in self.WORD_RUN.finditer(text, window)]
+        if window and len(starts) < 5:
+            starts = [m.start() for m in self.WORD_RUN.finditer(text)]
+        return starts[-4] if len(starts) >= 4 else 0
+    
+    def _iter_text_blocks(self, doc_path: Path) -> Iterator[str]:
+        """Decode a document in blocks, through an mmap view for large files"""
+        if doc_path.stat().st_size >= self.MMAP_THRESHOLD:
+            with mapped_view(doc_path) as view:
+                if view is not None:
+                    decoder = codecs.getincrementaldecoder('utf-8')('ignore')
+                    for start in range(0, len(view), self.TEXT_BLOCK_SIZE):
+                        end = start + self.TEXT_BLOCK_SIZE
+                        yield decoder.decode(view[start:end], final=end >= len(view))
+                    return
+        
+        with open(doc_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for block in iter(lambda: f.read(self.TEXT_BLOCK_SIZE), ''):
+                yield block
+    
     def _update_knowledge_graph(self, graph: Dict, extracted: Dict):
         """Update knowledge graph with extracted data"""
         # Add entities as nodes
@@ -697,26 +1058,100 @@ class PhasedDocumentProcessor:
         return hashlib.sha256(knowledge_str.encode()).hexdigest()[:16]
     
     def _save_phase_results(self, phase: ProcessingPhase, results: Dict):
-        """Save phase processing results"""
-        phase_file = self.phases_path / f"{phase.value}_results.yaml"
-        with open(phase_file, 'w') as f:
-            yaml.dump(results, f, default_flow_style=False)
+        """
+        Save phase processing results
+        Each top-level key is stored as a compact JSON blob in SQLite so it can
+        be loaded on its own; only a small YAML summary is written alongside
+        """
+        result_size = 0
+        with self._results_store() as conn:
+            conn.execute("DELETE FROM phase_results WHERE phase = ?", (phase.value,))
+            for key, value in results.items():
+                blob = json.dumps(value, separators=(',', ':')).encode('utf-8')
+                result_size += len(blob)
+                conn.execute("INSERT INTO phase_results (phase, key, value) VALUES (?, ?, ?)",
+                             (phase.value, key, blob))
+        
+        summary = self._summarize_phase_results(phase, results, result_size)
+        with open(self.phases_path / f"{phase.value}_summary.yaml", 'w') as f:
+            yaml.dump(summary, f, default_flow_style=False, sort_keys=False)
+        
+        # Drop full YAML results left by older versions
+        legacy_file = self.phases_path / f"{phase.value}_results.yaml"
+        if legacy_file.exists():
+            legacy_file.unlink()
         
         # Update phase status
         self.phase_status["completed_phases"].append(phase.value)
         self.phase_status["phase_metrics"][phase.value] = {
-            "completed_at": datetime.now().isoformat(),
-            "result_size": len(str(results))
+            "completed_at": summary["saved_at"],
+            "result_size": result_size
         }
         self.save_phase_status()
     
-    def _load_phase_results(self, phase: ProcessingPhase) -> Dict:
-        """Load phase processing results"""
+    def _load_phase_results(self, phase: ProcessingPhase,
+                            keys: Optional[List[str]] = None) -> Dict:
+        """Load phase processing results, optionally only the given top-level keys"""
+        query = "SELECT key, value FROM phase_results WHERE phase = ?"
+        params = [phase.value]
+        if keys is not None:
+            query += f" AND key IN ({', '.join('?' * len(keys))})"
+            params.extend(keys)
+        
+        with self._results_store() as conn:
+            rows = conn.execute(query, params).fetchall()
+        if rows:
+            return {key: json.loads(value) for key, value in rows}
+        
+        # Fall back to YAML results written before the SQLite store
         phase_file = self.phases_path / f"{phase.value}_results.yaml"
         if phase_file.exists():
             with open(phase_file, 'r') as f:
-                return yaml.safe_load(f) or {}
+                results = yaml.safe_load(f) or {}
+            if keys is not None:
+                results = {key: results[key] for key in keys if key in results}
+            return results
         return {}
+    
+    @contextmanager
+    def _results_store(self) -> Iterator[sqlite3.Connection]:
+        """Open the phase results database, committing on success"""
+        conn = sqlite3.connect(self.results_db, timeout=30.0)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS phase_results (
+                    phase TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    PRIMARY KEY (phase, key)
+                )
+            """)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def _summarize_phase_results(self, phase: ProcessingPhase, results: Dict,
+                                 result_size: int) -> Dict:
+        """Human-readable summary: metrics and scalars as-is, collections by size"""
+        summary = {
+            "phase": phase.value,
+            "saved_at": datetime.now().isoformat(),
+            "result_size": result_size,
+            "results_db": self.results_db.name,
+            "counts": {},
+            "metrics": {}
+        }
+        
+        for key, value in results.items():
+            if key.endswith("_metrics") or not isinstance(value, (dict, list)):
+                summary["metrics"][key] = value
+            else:
+                summary["counts"][key] = len(value)
+        
+        return summary
 
 
 class ModularAgentManager:
@@ -994,6 +1429,803 @@ class ModularAgentManager:
             return 16000  # Full context for general agents
 
 
+class StreamingChunker:
+    """
+    Single-pass chunker over an iterator of lines
+    Header-delimited sections are buffered only until they outgrow their
+    level's size limit; past it, lines go to the next level down and finally
+    to a word window whose joined length is tracked incrementally. Memory is
+    bounded by the limits, not the document size. Every chunk records the
+    start/end character offsets of the source text it covers
+    """
+    
+    # Per strategy: (header pattern, max buffered size) per level, then word
+    # window target size and overlap in words. Patterns match one line at a
+    # time, so an empty header ("#", "## ") never swallows the line after it
+    STRATEGIES = {
+        ChunkingStrategy.PHASED: ([(r'#{1,2}\s+.*?$', 4000), (r'#{3,6}\s+.*?$', 2000)], 1500, 50),
+        ChunkingStrategy.HYBRID: ([(r'#{1,6}\s+.*?$', 2400)], 2000, 50)
+    }
+    WORD = re.compile(r'\S+')
+    
+    def __init__(self, strategy: ChunkingStrategy):
+        levels, self.target, self.overlap = self.STRATEGIES[strategy]
+        self.strategy = strategy
+        self.levels = [(re.compile(pattern), limit) for pattern, limit in levels]
+        self.segments = [None] * len(self.levels)
+        self.words = []
+        self.window_size = 0
+        self.ready = []
+        self.chunk_id = 0
+    
+    def chunks(self, lines: Iterable[str]) -> Iterator[Dict]:
+        """Yield chunks as soon as each one is complete"""
+        offset = 0
+        for line in lines:
+            self._push(0, line, offset)
+            offset += len(line)
+            if self.ready:
+                yield from self.ready
+                self.ready = []
+        
+        self._close(0)
+        yield from self.ready
+        self.ready = []
+    
+    def _push(self, depth: int, line: str, offset: int):
+        """Route a line to the segment open at this depth"""
+        if depth == len(self.levels):
+            self._push_words(line, offset)
+            return
+        
+        pattern, limit = self.levels[depth]
+        match = pattern.match(line)
+        if match:
+            # Headers end the current segment and are not part of any chunk
+            self._close(depth)
+            line, offset = line[match.end():], offset + match.end()
+        
+        segment = self.segments[depth]
+        if segment is None:
+            segment = self.segments[depth] = {"lines": [], "size": 0, "start": offset,
+                                              "overflowed": False}
+        
+        if segment["overflowed"]:
+            self._push(depth + 1, line, offset)
+            return
+        
+        segment["lines"].append(line)
+        segment["size"] += len(line)
+        if segment["size"] > limit:
+            # Too large for one chunk: replay the buffer one level down
+            segment["overflowed"] = True
+            replay_offset = segment["start"]
+            for buffered in segment["lines"]:
+                self._push(depth + 1, buffered, replay_offset)
+                replay_offset += len(buffered)
+            segment["lines"] = []
+    
+    def _push_words(self, line: str, offset: int):
+        """Add a line's words to the window, emitting a chunk each time it fills"""
+        for match in self.WORD.finditer(line):
+            word = match.group()
+            self.window_size += len(word) + (1 if self.words else 0)
+            self.words.append((word, offset + match.start(), offset + match.end()))
+            
+            if self.window_size >= self.target:
+                self._emit_words()
+                self.words = self.words[-self.overlap:]
+                self.window_size = sum(len(w) for w, _, _ in self.words) + len(self.words) - 1
+    
+    def _close(self, depth: int):
+        """Flush the segment at this depth and everything open below it"""
+        if depth == len(self.levels):
+            if self.words:
+                self._emit_words()
+            self.words = []
+            self.window_size = 0
+            return
+        
+        segment = self.segments[depth]
+        if segment is None:
+            return
+        self.segments[depth] = None
+        
+        if segment["overflowed"]:
+            self._close(depth + 1)
+            return
+        
+        text = "".join(segment["lines"])
+        stripped = text.strip()
+        if stripped:
+            start = segment["start"] + len(text) - len(text.lstrip())
+            self._emit(stripped, depth + 1, len(text), start, start + len(stripped))
+    
+    def _emit_words(self):
+        """Emit the word window as one chunk"""
+        text = " ".join(w for w, _, _ in self.words)
+        self._emit(text, len(self.levels) + 1, len(text), self.words[0][1], self.words[-1][2])
+    
+    def _emit(self, text: str, phase: int, size: int, start: int, end: int):
+        """Queue a chunk for the caller"""
+        chunk = {
+            "id": f"{self.strategy.value}_{self.chunk_id}",
+            "text": text,
+            "strategy": self.strategy.value
+        }
+        if self.strategy == ChunkingStrategy.PHASED:
+            chunk["phase"] = phase
+        chunk.update(size=size, start=start, end=end)
+        self.ready.append(chunk)
+        self.chunk_id += 1
+
+
+class Tokenizer(ABC):
+    """Pluggable token counter used to size chunks against context windows"""
+    
+    name = "base"
+    
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Number of tokens in text"""
+        pass
+
+
+class HeuristicTokenizer(Tokenizer):
+    """
+    Fast local estimate close to BPE tokenizers on English technical text
+    Each run of word characters costs one token per 4 characters, and every
+    other non-space character costs one; counts add up across whitespace
+    """
+    
+    name = "heuristic"
+    PIECE = re.compile(r'\w+|[^\w\s]')
+    
+    def count(self, text: str) -> int:
+        return sum((len(piece) + 3) // 4 for piece in self.PIECE.findall(text))
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact counts from a tiktoken encoding (optional dependency)"""
+    
+    def __init__(self, encoding: str = "cl100k_base"):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ValueError("tiktoken is not installed; use the heuristic tokenizer "
+                             "or pip install tiktoken")
+        self.name = f"tiktoken:{encoding}"
+        self.encoding = tiktoken.get_encoding(encoding)
+    
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+class CachedTokenizer(Tokenizer):
+    """LRU cache of token counts keyed by a hash of the text"""
+    
+    def __init__(self, tokenizer: Tokenizer, max_entries: int = 65536):
+        self.tokenizer = tokenizer
+        self.name = tokenizer.name
+        self.max_entries = max_entries
+        self.counts: 'OrderedDict[bytes, int]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def count(self, text: str) -> int:
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        tokens = self.counts.get(key)
+        if tokens is not None:
+            self.hits += 1
+            self.counts.move_to_end(key)
+            return tokens
+        
+        self.misses += 1
+        tokens = self.counts[key] = self.tokenizer.count(text)
+        if len(self.counts) > self.max_entries:
+            self.counts.popitem(last=False)
+        return tokens
+
+
+class TokenBudgetChunker:
+    """
+    Single-pass chunker that packs lines up to a token budget
+    Lines are added whole while they fit; a line larger than the budget is
+    packed word by word. Chunk sizes are the summed token counts of their
+    pieces, so chunks never exceed the budget unless a single word does
+    """
+    
+    WORD = re.compile(r'\S+')
+    
+    def __init__(self, max_tokens: int, tokenizer: Tokenizer):
+        if max_tokens < 1:
+            raise ValueError(f"Token budget must be positive, got {max_tokens}")
+        self.max_tokens = max_tokens
+        self.tokenizer = tokenizer
+        self.pieces = []
+        self.tokens = 0
+        self.chunk_id = 0
+    
+    def chunks(self, lines: Iterable[str]) -> Iterator[Dict]:
+        """Yield chunks as soon as each one is full"""
+        offset = 0
+        for line in lines:
+            stripped = line.strip()
+            if stripped:
+                start = offset + len(line) - len(line.lstrip())
+                tokens = self.tokenizer.count(stripped)
+                if tokens <= self.max_tokens:
+                    yield from self._add(stripped, start, tokens, "\n")
+                else:
+                    for match in self.WORD.finditer(line):
+                        word = match.group()
+                        yield from self._add(word, offset + match.start(),
+                                             self.tokenizer.count(word), " ")
+            offset += len(line)
+        
+        yield from self._flush()
+    
+    def _add(self, piece: str, start: int, tokens: int, separator: str) -> Iterator[Dict]:
+        """Add a piece, first emitting the current chunk if the piece would overflow it"""
+        if self.pieces and self.tokens + tokens > self.max_tokens:
+            yield from self._flush()
+        self.pieces.append((piece, start, separator))
+        self.tokens += tokens
+    
+    def _flush(self) -> Iterator[Dict]:
+        """Emit the packed pieces as one chunk"""
+        if not self.pieces:
+            return
+        
+        parts = [self.pieces[0][0]]
+        for piece, start, separator in self.pieces[1:]:
+            parts.extend((separator, piece))
+        text = "".join(parts)
+        last, last_start, _ = self.pieces[-1]
+        
+        yield {
+            "id": f"{ChunkingStrategy.TOKEN_BUDGET.value}_{self.chunk_id}",
+            "text": text,
+            "strategy": ChunkingStrategy.TOKEN_BUDGET.value,
+            "tokens": self.tokens,
+            "size": len(text),
+            "start": self.pieces[0][1],
+            "end": last_start + len(last)
+        }
+        self.chunk_id += 1
+        self.pieces = []
+        self.tokens = 0
+
+
+class ChunkStore:
+    """
+    Content-addressed chunk store shared by the agents in one agents folder
+    Chunks are stored once by SHA-256 of their text and referenced per
+    (agent, document, position); chunks no longer referenced are removed by
+    collect_garbage(). A 64-bit SimHash per chunk, indexed in four 16-bit
+    bands, finds near duplicates: any two hashes within 3 bits share a band
+    """
+    
+    SIMHASH_BITS = 64
+    BANDS = 4
+    SHINGLE = 3
+    WORD = re.compile(r'\w+')
+    # Each byte value spread into eight 32-bit lanes, one per bit it sets
+    BYTE_LANES = [sum(1 << (32 * bit) for bit in range(8) if value >> bit & 1)
+                  for value in range(256)]
+    
+    def __init__(self, db_path: Path, near_distance: int = 3, merge_near: bool = False):
+        self.db_path = db_path
+        # Band lookups only find matches within BANDS - 1 bits
+        self.near_distance = min(near_distance, self.BANDS - 1)
+        self.merge_near = merge_near
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS chunks (
+                    hash TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    simhash INTEGER NOT NULL,
+                    near_duplicate_of TEXT,
+                    created_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS chunk_bands (
+                    band INTEGER NOT NULL,
+                    value INTEGER NOT NULL,
+                    hash TEXT NOT NULL,
+                    PRIMARY KEY (band, value, hash)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS chunk_refs (
+                    owner TEXT NOT NULL,
+                    document TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    hash TEXT NOT NULL,
+                    start_offset INTEGER,
+                    end_offset INTEGER,
+                    PRIMARY KEY (owner, document, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_chunk_refs_hash ON chunk_refs(hash);
+            """)
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the store, committing on success"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def put_document(self, owner: str, document: str, chunks: Iterable[Dict]) -> Dict:
+        """
+        Replace a document's chunk references with the given chunks
+        Returns counts of new, duplicate and near-duplicate chunks
+        """
+        stats = {"chunks": 0, "new": 0, "duplicate": 0, "near_duplicate": 0}
+        
+        with self._connect() as conn:
+            conn.execute("DELETE FROM chunk_refs WHERE owner = ? AND document = ?",
+                         (owner, document))
+            for position, chunk in enumerate(chunks):
+                chunk_hash, status = self._put_chunk(conn, chunk["text"])
+                stats["chunks"] += 1
+                stats[status] += 1
+                conn.execute(
+                    "INSERT INTO chunk_refs (owner, document, position, hash, start_offset, end_offset) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (owner, document, position, chunk_hash, chunk.get("start"), chunk.get("end"))
+                )
+        
+        return stats
+    
+    def _put_chunk(self, conn: sqlite3.Connection, text: str) -> Tuple[str, str]:
+        """Store a chunk unless present; returns the hash to reference and its status"""
+        chunk_hash = hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+        if conn.execute("SELECT 1 FROM chunks WHERE hash = ?", (chunk_hash,)).fetchone():
+            return chunk_hash, "duplicate"
+        
+        simhash = self.simhash(text)
+        near = self._find_near(conn, simhash)
+        if near is not None and self.merge_near:
+            return near, "near_duplicate"
+        
+        conn.execute(
+            "INSERT INTO chunks (hash, text, size, simhash, near_duplicate_of, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (chunk_hash, text, len(text), self._to_signed(simhash), near,
+             datetime.now().isoformat())
+        )
+        conn.executemany("INSERT INTO chunk_bands (band, value, hash) VALUES (?, ?, ?)",
+                         [(band, value, chunk_hash)
+                          for band, value in enumerate(self._bands(simhash))])
+        return chunk_hash, "new" if near is None else "near_duplicate"
+    
+    def _find_near(self, conn: sqlite3.Connection, simhash: int) -> Optional[str]:
+        """Hash of the closest stored chunk within near_distance bits, if any"""
+        candidates = set()
+        for band, value in enumerate(self._bands(simhash)):
+            candidates.update(conn.execute(
+                "SELECT c.hash, c.simhash FROM chunk_bands b JOIN chunks c ON c.hash = b.hash "
+                "WHERE b.band = ? AND b.value = ?", (band, value)
+            ).fetchall())
+        
+        best = None
+        for chunk_hash, other in candidates:
+            distance = bin(simhash ^ (other & ((1 << self.SIMHASH_BITS) - 1))).count("1")
+            if distance <= self.near_distance and (best is None or distance < best[0]):
+                best = (distance, chunk_hash)
+        return best[1] if best else None
+    
+    def simhash(self, text: str) -> int:
+        """
+        64-bit SimHash over word shingles, weighted by shingle frequency
+        Per-bit weights are summed a byte column at a time: every byte value
+        maps to eight 32-bit lanes, so one integer addition per distinct byte
+        counts all eight of its bits at once
+        """
+        words = self.WORD.findall(text.lower())
+        size = min(self.SHINGLE, len(words))
+        # Text without words hashes as a single empty shingle
+        shingles = Counter(map(" ".join, zip(*(words[i:] for i in range(size))))) if size \
+            else Counter([""])
+        digests = b"".join([
+            hashlib.blake2b(shingle.encode('utf-8', 'surrogatepass'),
+                            digest_size=8).digest() * count
+            for shingle, count in shingles.items()
+        ])
+        
+        # A bit is set when more than half of the weighted shingles set it
+        total = len(digests) // 8
+        lane_mask = (1 << 32) - 1
+        simhash = 0
+        for column in range(8):
+            lanes = 0
+            for value, count in Counter(digests[column::8]).items():
+                lanes += count * self.BYTE_LANES[value]
+            shift = (7 - column) * 8
+            for bit in range(8):
+                if 2 * (lanes >> (32 * bit) & lane_mask) > total:
+                    simhash |= 1 << (shift + bit)
+        
+        return simhash
+    
+    def _bands(self, simhash: int) -> List[int]:
+        """Split a SimHash into BANDS equal-width integers"""
+        width = self.SIMHASH_BITS // self.BANDS
+        return [simhash >> (band * width) & ((1 << width) - 1) for band in range(self.BANDS)]
+    
+    def _to_signed(self, value: int) -> int:
+        """SQLite integers are signed 64-bit"""
+        return value - (1 << 64) if value >= 1 << 63 else value
+    
+    def remove_document(self, owner: str, document: Optional[str] = None) -> int:
+        """Drop an agent's references to one document, or to all its documents"""
+        with self._connect() as conn:
+            if document is None:
+                cursor = conn.execute("DELETE FROM chunk_refs WHERE owner = ?", (owner,))
+            else:
+                cursor = conn.execute("DELETE FROM chunk_refs WHERE owner = ? AND document = ?",
+                                      (owner, document))
+            return cursor.rowcount
+    
+    def refcount(self, chunk_hash: str) -> int:
+        """Number of references to a chunk across documents and agents"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM chunk_refs WHERE hash = ?",
+                                (chunk_hash,)).fetchone()[0]
+    
+    def document_chunks(self, owner: str, document: str) -> List[Dict]:
+        """A document's chunks in order"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT r.hash, c.text, r.start_offset, r.end_offset FROM chunk_refs r "
+                "JOIN chunks c ON c.hash = r.hash "
+                "WHERE r.owner = ? AND r.document = ? ORDER BY r.position",
+                (owner, document)
+            ).fetchall()
+        return [{"hash": h, "text": text, "start": start, "end": end}
+                for h, text, start, end in rows]
+    
+    def owner_chunks(self, owner: str) -> Iterator[Tuple[str, str]]:
+        """Distinct (hash, text) pairs referenced by an agent"""
+        with self._connect() as conn:
+            yield from conn.execute(
+                "SELECT c.hash, c.text FROM chunks c WHERE EXISTS "
+                "(SELECT 1 FROM chunk_refs r WHERE r.hash = c.hash AND r.owner = ?) "
+                "ORDER BY c.hash", (owner,)
+            )
+    
+    def owner_hashes(self, owner: str) -> set:
+        """Distinct chunk hashes referenced by an agent"""
+        with self._connect() as conn:
+            return {row[0] for row in conn.execute(
+                "SELECT DISTINCT hash FROM chunk_refs WHERE owner = ?", (owner,))}
+    
+    def chunk_texts(self, hashes: List[str]) -> Dict[str, str]:
+        """Texts of the given chunks by hash"""
+        texts = {}
+        with self._connect() as conn:
+            for start in range(0, len(hashes), 500):
+                batch = hashes[start:start + 500]
+                texts.update(conn.execute(
+                    f"SELECT hash, text FROM chunks WHERE hash IN ({', '.join('?' * len(batch))})",
+                    batch
+                ).fetchall())
+        return texts
+    
+    def collect_garbage(self) -> int:
+        """Delete chunks nothing references; returns how many were removed"""
+        with self._connect() as conn:
+            orphan = "NOT EXISTS (SELECT 1 FROM chunk_refs r WHERE r.hash = chunks.hash)"
+            conn.execute(f"DELETE FROM chunk_bands WHERE hash IN "
+                         f"(SELECT hash FROM chunks WHERE {orphan})")
+            removed = conn.execute(f"DELETE FROM chunks WHERE {orphan}").rowcount
+            conn.execute("UPDATE chunks SET near_duplicate_of = NULL WHERE near_duplicate_of "
+                         "IS NOT NULL AND near_duplicate_of NOT IN (SELECT hash FROM chunks)")
+        return removed
+    
+    def stats(self) -> Dict:
+        """Stored versus referenced chunk counts and bytes"""
+        with self._connect() as conn:
+            stored, stored_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM chunks").fetchone()
+            references, referenced_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(c.size), 0) FROM chunk_refs r "
+                "JOIN chunks c ON c.hash = r.hash").fetchone()
+            near = conn.execute(
+                "SELECT COUNT(*) FROM chunks WHERE near_duplicate_of IS NOT NULL").fetchone()[0]
+        return {
+            "chunks": stored,
+            "references": references,
+            "near_duplicates": near,
+            "stored_bytes": stored_bytes,
+            "referenced_bytes": referenced_bytes,
+            "dedup_ratio": referenced_bytes / stored_bytes if stored_bytes else 1.0
+        }
+
+
+class Embedder(ABC):
+    """Pluggable text embedder: rows of L2-normalised float32 vectors"""
+    
+    name = "base"
+    dim = 0
+    
+    @abstractmethod
+    def embed(self, texts: List[str]):
+        """Embed texts into an (len(texts), dim) numpy array"""
+        pass
+
+
+class HashingEmbedder(Embedder):
+    """
+    Offline hashing-trick embedder over word unigrams and bigrams
+    Stateless, so vectors stay valid as chunks are added; features are
+    signed-hashed into dim buckets with sublinear term frequency
+    """
+    
+    TOKEN = re.compile(r'\w+')
+    
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+        self.name = f"hashing:{dim}"
+        self._slots = {}
+    
+    def embed(self, texts: List[str]):
+        import numpy as np
+        
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = self.TOKEN.findall(text.lower())
+            counts = {}
+            for feature in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+                counts[feature] = counts.get(feature, 0) + 1
+            if not counts:
+                continue
+            
+            slots = np.empty(len(counts), dtype=np.int64)
+            weights = np.empty(len(counts), dtype=np.float32)
+            for i, (feature, count) in enumerate(counts.items()):
+                slot, sign = self._slot(feature)
+                slots[i] = slot
+                weights[i] = sign * (1.0 + math.log(count))
+            np.add.at(matrix[row], slots, weights)
+        
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+    
+    def _slot(self, feature: str) -> Tuple[int, int]:
+        """Bucket and sign for a feature, memoised for the common vocabulary"""
+        slot = self._slots.get(feature)
+        if slot is None:
+            value = int.from_bytes(hashlib.blake2b(feature.encode('utf-8', 'surrogatepass'),
+                                                   digest_size=8).digest(), 'little')
+            slot = (value % self.dim, 1 if value >> 63 else -1)
+            if len(self._slots) < 1 << 18:
+                self._slots[feature] = slot
+        return slot
+
+
+class VectorIndex:
+    """
+    Local top-k retrieval over chunk embeddings stored as a numpy matrix
+    Up to brute_force_limit vectors are scored exhaustively with one BLAS
+    matrix-vector product; larger indexes are clustered (spherical k-means)
+    into an inverted file whose lists are stored contiguously, and queries
+    score only the nprobe closest lists. Rebuilds keep the existing lists
+    and assign new vectors to their nearest centroid until the index has
+    outgrown them
+    """
+    
+    BRUTE_FORCE_LIMIT = 20000
+    NPROBE = 8
+    KMEANS_ITERATIONS = 10
+    
+    def __init__(self, index_path: Path, embedder: Optional[Embedder] = None,
+                 brute_force_limit: Optional[int] = None, nprobe: Optional[int] = None):
+        self.index_path = index_path
+        self.embedder = embedder or HashingEmbedder()
+        self.brute_force_limit = brute_force_limit or self.BRUTE_FORCE_LIMIT
+        self.nprobe = nprobe or self.NPROBE
+        self.ids = []
+        self.vectors = None
+        self.centroids = None
+        self.list_offsets = None
+        self.load()
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def build(self, items: Iterable[Tuple[str, str]], batch_size: int = 512) -> Dict:
+        """
+        (Re)build the index from (id, text) pairs and save it
+        Vectors of ids already indexed with the same embedder are reused, so
+        only new chunks are embedded
+        """
+        import numpy as np
+        
+        previous = {chunk_id: row for row, chunk_id in enumerate(self.ids)}
+        previous_lists = None
+        if self.centroids is not None:
+            previous_lists = np.repeat(np.arange(len(self.centroids)),
+                                       np.diff(self.list_offsets))
+        ids, reused_at, reused_rows, embedded_at = [], [], [], []
+        pending, blocks = [], []
+        
+        for position, (chunk_id, text) in enumerate(items):
+            ids.append(chunk_id)
+            if chunk_id in previous:
+                reused_at.append(position)
+                reused_rows.append(previous[chunk_id])
+                continue
+            embedded_at.append(position)
+            pending.append(text)
+            if len(pending) >= batch_size:
+                blocks.append(self.embedder.embed(pending))
+                pending = []
+        if pending:
+            blocks.append(self.embedder.embed(pending))
+        
+        vectors = np.empty((len(ids), self.embedder.dim), dtype=np.float32)
+        if reused_at:
+            vectors[reused_at] = self.vectors[reused_rows]
+        if embedded_at:
+            vectors[embedded_at] = np.concatenate(blocks)
+        
+        self.ids, self.vectors = ids, vectors
+        if len(ids) <= self.brute_force_limit:
+            self.centroids = self.list_offsets = None
+        elif (previous_lists is not None
+              and 2 * len(self.centroids) >= self._list_count(len(ids))):
+            # Keep the clustering: reused rows stay in their lists, new rows
+            # join the list of their nearest centroid
+            assignment = np.empty(len(ids), dtype=np.int64)
+            if reused_at:
+                assignment[reused_at] = previous_lists[reused_rows]
+            if embedded_at:
+                assignment[embedded_at] = self._assign(vectors[embedded_at])
+            self._group_lists(assignment)
+        else:
+            self._build_ivf()
+        self.save()
+        
+        return {
+            "embedder": self.embedder.name,
+            "dim": self.embedder.dim,
+            "count": len(self.ids),
+            "embedded": len(embedded_at),
+            "index": "flat" if self.centroids is None else "ivf",
+            "lists": 0 if self.centroids is None else len(self.centroids),
+            "built_at": datetime.now().isoformat()
+        }
+    
+    def _list_count(self, count: int) -> int:
+        """Number of inverted lists for an index of count vectors"""
+        return min(4096, int(math.sqrt(count)))
+    
+    def _build_ivf(self):
+        """Cluster vectors into lists and reorder rows so each list is contiguous"""
+        import numpy as np
+        
+        rng = np.random.default_rng(0)
+        count = len(self.ids)
+        nlist = self._list_count(count)
+        sample = self.vectors[rng.choice(count, size=min(count, nlist * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        
+        for _ in range(self.KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = sample[assignment == cluster]
+                if len(members):
+                    centroids[cluster] = members.sum(axis=0)
+            centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+        
+        self.centroids = centroids
+        self._group_lists(self._assign(self.vectors))
+    
+    def _assign(self, vectors):
+        """Index of the nearest centroid for each vector"""
+        import numpy as np
+        
+        return np.concatenate([
+            np.argmax(vectors[start:start + 65536] @ self.centroids.T, axis=1)
+            for start in range(0, len(vectors), 65536)
+        ])
+    
+    def _group_lists(self, assignment):
+        """Reorder rows so each centroid's list is contiguous and record list offsets"""
+        import numpy as np
+        
+        order = np.argsort(assignment, kind="stable")
+        self.vectors = self.vectors[order]
+        self.ids = [self.ids[i] for i in order]
+        self.list_offsets = np.searchsorted(assignment[order], np.arange(len(self.centroids) + 1))
+    
+    def search(self, query: str, k: int = 4) -> List[Tuple[str, float]]:
+        """Top-k (id, cosine score) pairs for a query, best first"""
+        import numpy as np
+        
+        if not self.ids or k < 1:
+            return []
+        
+        query_vector = self.embedder.embed([query])[0]
+        if self.centroids is None:
+            candidates = None
+            scores = self.vectors @ query_vector
+        else:
+            lists = np.argsort(-(self.centroids @ query_vector))[:self.nprobe]
+            candidates = np.concatenate([
+                np.arange(self.list_offsets[c], self.list_offsets[c + 1]) for c in lists
+            ])
+            scores = self.vectors[candidates] @ query_vector
+        
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        rows = top if candidates is None else candidates[top]
+        return [(self.ids[row], float(scores[i])) for row, i in zip(rows, top)]
+    
+    def save(self):
+        """
+        Write vectors, ids and IVF lists to a new version directory under index_path
+        meta.json names the current version and is replaced atomically last,
+        so a crash never mixes files from two builds and readers that have
+        memory-mapped an earlier version's vectors are never truncated
+        """
+        import numpy as np
+        
+        version = f"v{time.time_ns()}"
+        version_path = self.index_path / version
+        version_path.mkdir(parents=True)
+        np.save(version_path / "vectors.npy", self.vectors)
+        if self.centroids is not None:
+            np.save(version_path / "centroids.npy", self.centroids)
+            np.save(version_path / "list_offsets.npy", self.list_offsets)
+        with open(version_path / "ids.json", 'w') as f:
+            json.dump(self.ids, f)
+        
+        temp_file = self.index_path / "meta.json.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump({"embedder": self.embedder.name, "dim": self.embedder.dim,
+                       "count": len(self.ids), "version": version}, f)
+        os.replace(temp_file, self.index_path / "meta.json")
+        
+        # Earlier versions stay readable through open mappings once unlinked
+        for path in self.index_path.iterdir():
+            if path.is_dir() and path.name != version:
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.suffix == ".npy" or path.name == "ids.json":
+                path.unlink()
+    
+    def load(self):
+        """Load a saved index; vectors are memory-mapped, not read up front"""
+        meta_file = self.index_path / "meta.json"
+        if not meta_file.exists():
+            return
+        with open(meta_file, 'r') as f:
+            meta = json.load(f)
+        if meta.get("embedder") != self.embedder.name:
+            # Vectors from another embedder are not comparable; rebuild from scratch
+            return
+        
+        import numpy as np
+        
+        # Indexes saved before versioning keep their files in index_path itself
+        version_path = self.index_path / meta.get("version", "")
+        with open(version_path / "ids.json", 'r') as f:
+            self.ids = json.load(f)
+        self.vectors = np.load(version_path / "vectors.npy", mmap_mode='r')
+        if (version_path / "centroids.npy").exists():
+            self.centroids = np.load(version_path / "centroids.npy")
+            self.list_offsets = np.load(version_path / "list_offsets.npy")
+
+
 class EnhancedDocumentationManager:
     """
     Enhanced documentation manager v3.0 combining:
@@ -1002,8 +2234,14 @@ class EnhancedDocumentationManager:
     - Modular agent management
     """
     
-    def __init__(self, agent_path: Path):
+    # Token-budget chunks are sized so this many fill the agent's context window
+    CHUNKS_PER_CONTEXT = 4
+    DEFAULT_CONTEXT_SIZE = 8000
+    
+    def __init__(self, agent_path: Path, tokenizer: Optional[Tokenizer] = None,
+                 embedder: Optional[Embedder] = None):
         self.agent_path = agent_path
+        self.tokenizer = CachedTokenizer(tokenizer or HeuristicTokenizer())
         self.context_path = agent_path / "context"
         self.registry_file = self.context_path / "docs_registry.yaml"
         self.validation_log = self.context_path / "validation_log.yaml"
@@ -1011,6 +2249,7 @@ class EnhancedDocumentationManager:
         
         # Initialize processors
         self.phased_processor = PhasedDocumentProcessor(agent_path)
+        self.chunk_store = ChunkStore(agent_path.parent / "chunk-store" / "chunks.db")
         self.modular_manager = ModularAgentManager(agent_path.parent)
         
         # Load registry
@@ -1029,6 +2268,9 @@ class EnhancedDocumentationManager:
         # Create layer directories
         for layer_dir in self.context_layers.values():
             layer_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Semantic retrieval over this agent's chunks
+        self.vector_index = VectorIndex(self.context_layers["semantic"] / "index", embedder)
     
     def load_registry(self) -> dict:
         """Load or initialize documentation registry"""
@@ -1082,10 +2324,15 @@ class EnhancedDocumentationManager:
                 yaml.dump({"validations": validation_results}, f)
     
     def process_documents_phased(self, doc_paths: List[Path], 
-                                module_name: Optional[str] = None) -> Dict:
+                                module_name: Optional[str] = None,
+                                workers: int = 1, resume: bool = False) -> Dict:
         """
         Process documents using phased approach
         Implements mixed-documentation-agent specification
+        Phases 1-3 stream documents through phases1to3_pipelined (a process
+        pool when workers > 1); with resume, documents checkpointed by an
+        earlier run are not re-extracted and unchanged documents are not
+        re-chunked
         """
         print("\n📚 Starting Phased Document Processing")
         print(f"   Total documents: {len(doc_paths)}")
@@ -1094,20 +2341,11 @@ class EnhancedDocumentationManager:
         
         results = {}
         
-        # Phase 1: Discovery
-        results["discovery"] = self.phased_processor.phase1_discovery(doc_paths)
+        # Phases 1-3: Discovery, quality assessment and extraction, pipelined
+        # per document and checkpointed so interrupted runs can resume
+        results.update(self.phased_processor.phases1to3_pipelined(doc_paths, workers, resume))
         print(f"   ✓ Discovery complete: {results['discovery']['total_documents']} documents")
-        
-        # Phase 2: Quality Assessment
-        results["quality"] = self.phased_processor.phase2_quality_assessment(
-            results["discovery"]
-        )
         print(f"   ✓ Quality assessment: {len(results['quality']['high_priority'])} high priority")
-        
-        # Phase 3: Extraction
-        results["extraction"] = self.phased_processor.phase3_extraction(
-            results["quality"], self
-        )
         print(f"   ✓ Extraction: {results['extraction']['extraction_metrics']['total_entities']} entities")
         
         # Phase 4: Synthesis
@@ -1128,12 +2366,19 @@ class EnhancedDocumentationManager:
         )
         print(f"   ✓ Integration: {results['integration']['integration_metrics']['total_integrated']} integrated")
         
+        # Chunk documents into the shared, deduplicated chunk store
+        chunk_stats = self.ingest_documents(doc_paths, save=False, resume=resume)
+        print(f"   ✓ Chunks: {chunk_stats['chunks']} referenced, {chunk_stats['new']} new, "
+              f"{chunk_stats['duplicate'] + chunk_stats['near_duplicate']} duplicates, "
+              f"{chunk_stats['unchanged']} documents unchanged")
+        
         # Update registry with phase results
         self.registry["phases"][datetime.now().isoformat()] = {
             "module": module_name,
             "documents_processed": len(doc_paths),
             "phases_completed": list(results.keys()),
-            "integration_rate": results["integration"]["integration_metrics"]["integration_rate"]
+            "integration_rate": results["integration"]["integration_metrics"]["integration_rate"],
+            "chunks": chunk_stats
         }
         
         # If module specified, update module registry
@@ -1161,142 +2406,138 @@ class EnhancedDocumentationManager:
         return hashlib.sha256(content.encode()).hexdigest()
     
     def chunk_document(self, content: str, 
-                      strategy: ChunkingStrategy = ChunkingStrategy.PHASED) -> List[Dict]:
+                      strategy: ChunkingStrategy = ChunkingStrategy.PHASED,
+                      max_tokens: Optional[int] = None) -> List[Dict]:
         """
         Enhanced chunking with phased strategy support
         """
-        if strategy == ChunkingStrategy.PHASED:
-            # Phased chunking for large documents
-            return self._phased_chunking(content)
-        else:
-            # Use existing chunking strategies from v2.0
-            return self._standard_chunking(content, strategy)
+        return list(self.iter_chunks(io.StringIO(content), strategy, max_tokens))
     
-    def _phased_chunking(self, content: str) -> List[Dict]:
+    def chunk_file(self, doc_path: Path,
+                   strategy: ChunkingStrategy = ChunkingStrategy.PHASED,
+                   max_tokens: Optional[int] = None) -> Iterator[Dict]:
+        """Stream chunks from a document without reading it into memory"""
+        with open(doc_path, 'r', encoding='utf-8', errors='ignore') as f:
+            yield from self.iter_chunks(f, strategy, max_tokens)
+    
+    def iter_chunks(self, lines: Iterable[str],
+                    strategy: ChunkingStrategy = ChunkingStrategy.PHASED,
+                    max_tokens: Optional[int] = None) -> Iterator[Dict]:
         """
-        Phased chunking strategy for large documents
-        Based on mixed-documentation-agent spec
+        Chunk an iterator of lines in a single pass
+        PHASED splits on H1/H2 then H3-H6 headers for large documents; HYBRID
+        (from v2.0) splits on any header; TOKEN_BUDGET packs lines up to
+        max_tokens (default: chunk_token_budget()). Other strategies yield no chunks
         """
-        chunks = []
-        chunk_id = 0
-        
-        # Phase 1: High-level sections (large chunks)
-        sections = re.split(r'^#{1,2}\s+.*?$', content, flags=re.MULTILINE)
+        if strategy == ChunkingStrategy.TOKEN_BUDGET:
+            budget = max_tokens or self.chunk_token_budget()
+            return TokenBudgetChunker(budget, self.tokenizer).chunks(lines)
+        if strategy not in StreamingChunker.STRATEGIES:
+            return iter(())
+        return StreamingChunker(strategy).chunks(lines)
+    
+    def chunk_token_budget(self) -> int:
+        """Tokens per chunk so CHUNKS_PER_CONTEXT chunks fill the agent's context size"""
+        context_size = self.DEFAULT_CONTEXT_SIZE
+        agent_file = self.agent_path / "agent.yaml"
+        if agent_file.exists():
+            with open(agent_file, 'r') as f:
+                config = yaml.safe_load(f) or {}
+            optimization = config.get("processing_config", {}).get("module_optimization", {})
+            context_size = optimization.get("context_size") or context_size
+        return max(1, context_size // self.CHUNKS_PER_CONTEXT)
+    
+    def ingest_documents(self, doc_paths: List[Path],
+                         strategy: ChunkingStrategy = ChunkingStrategy.TOKEN_BUDGET,
+                         max_tokens: Optional[int] = None, save: bool = True,
+                         resume: bool = False) -> Dict:
+        """
+        Chunk documents into the shared content-addressed chunk store
+        Chunks already stored by this or another agent are referenced, not
+        copied; chunks orphaned by re-ingested documents are collected. With
+        resume, documents whose size, mtime and chunking settings match their
+        registry entry are skipped
+        """
+        owner = self.agent_path.name
+        if strategy == ChunkingStrategy.TOKEN_BUDGET:
+            max_tokens = max_tokens or self.chunk_token_budget()
+        totals = {"documents": 0, "unchanged": 0, "chunks": 0, "new": 0, "duplicate": 0,
+                  "near_duplicate": 0}
         
-        for section in sections:
-            if not section.strip():
+        for doc_path in doc_paths:
+            try:
+                stat_result = doc_path.stat()
+            except OSError:
                 continue
             
-            # Phase 2: If section is large, break into subsections
-            if len(section) > 4000:
-                subsections = re.split(r'^#{3,6}\s+.*?$', section, flags=re.MULTILINE)
-                
-                for subsection in subsections:
-                    if not subsection.strip():
-                        continue
-                    
-                    # Phase 3: If still large, use fixed-size chunks
-                    if len(subsection) > 2000:
-                        words = subsection.split()
-                        current_chunk = []
-                        
-                        for word in words:
-                            current_chunk.append(word)
-                            
-                            if len(" ".join(current_chunk)) >= 1500:
-                                chunk_text = " ".join(current_chunk)
-                                chunks.append({
-                                    "id": f"phased_{chunk_id}",
-                                    "text": chunk_text,
-                                    "strategy": "phased",
-                                    "phase": 3,
-                                    "size": len(chunk_text)
-                                })
-                                current_chunk = current_chunk[-50:]  # Overlap
-                                chunk_id += 1
-                        
-                        if current_chunk:
-                            chunks.append({
-                                "id": f"phased_{chunk_id}",
-                                "text": " ".join(current_chunk),
-                                "strategy": "phased",
-                                "phase": 3,
-                                "size": len(" ".join(current_chunk))
-                            })
-                            chunk_id += 1
-                    else:
-                        # Phase 2 chunk
-                        chunks.append({
-                            "id": f"phased_{chunk_id}",
-                            "text": subsection.strip(),
-                            "strategy": "phased",
-                            "phase": 2,
-                            "size": len(subsection)
-                        })
-                        chunk_id += 1
-            else:
-                # Phase 1 chunk
-                chunks.append({
-                    "id": f"phased_{chunk_id}",
-                    "text": section.strip(),
-                    "strategy": "phased",
-                    "phase": 1,
-                    "size": len(section)
-                })
-                chunk_id += 1
+            fingerprint = {"size": stat_result.st_size, "mtime_ns": stat_result.st_mtime_ns,
+                           "strategy": strategy.value, "max_tokens": max_tokens}
+            entry = self.registry["chunks"].get(str(doc_path), {})
+            if resume and all(entry.get(key) == value for key, value in fingerprint.items()):
+                totals["unchanged"] += 1
+                continue
+            
+            stats = self.chunk_store.put_document(
+                owner, str(doc_path), self.chunk_file(doc_path, strategy, max_tokens)
+            )
+            self.registry["chunks"][str(doc_path)] = dict(
+                stats, **fingerprint, ingested_at=datetime.now().isoformat()
+            )
+            totals["documents"] += 1
+            for key, value in stats.items():
+                totals[key] += value
         
-        return chunks
-    
-    def _standard_chunking(self, content: str, strategy: ChunkingStrategy) -> List[Dict]:
-        """Standard chunking strategies from v2.0"""
-        # Implementation from v2.0
-        # (Simplified here - full implementation in v2.0)
-        chunks = []
+        # Nothing was re-referenced, so there are no new orphans or chunks to embed
+        totals["collected"] = self.chunk_store.collect_garbage() if totals["documents"] else 0
+        if totals["documents"]:
+            self._refresh_vector_index()
         
-        if strategy == ChunkingStrategy.HYBRID:
-            # Hybrid approach from v2.0
-            sections = re.split(r'^#{1,6}\s+.*?$', content, flags=re.MULTILINE)
-            chunk_id = 0
-            
-            for section in sections:
-                if not section.strip():
-                    continue
-                
-                if len(section) > 2400:
-                    # Break into smaller chunks
-                    words = section.split()
-                    current_chunk = []
-                    
-                    for word in words:
-                        current_chunk.append(word)
-                        if len(" ".join(current_chunk)) >= 2000:
-                            chunks.append({
-                                "id": f"hybrid_{chunk_id}",
-                                "text": " ".join(current_chunk),
-                                "strategy": "hybrid",
-                                "size": len(" ".join(current_chunk))
-                            })
-                            current_chunk = current_chunk[-50:]
-                            chunk_id += 1
-                    
-                    if current_chunk:
-                        chunks.append({
-                            "id": f"hybrid_{chunk_id}",
-                            "text": " ".join(current_chunk),
-                            "strategy": "hybrid",
-                            "size": len(" ".join(current_chunk))
-                        })
-                        chunk_id += 1
-                else:
-                    chunks.append({
-                        "id": f"hybrid_{chunk_id}",
-                        "text": section.strip(),
-                        "strategy": "hybrid",
-                        "size": len(section)
-                    })
-                    chunk_id += 1
+        if save:
+            self.save_registry()
+        
+        return totals
+    
+    def build_vector_index(self, save: bool = True) -> Dict:
+        """Embed this agent's stored chunks into its semantic vector index"""
+        stats = self.vector_index.build(self.chunk_store.owner_chunks(self.agent_path.name))
+        self.registry["embeddings"] = stats
+        if save:
+            self.save_registry()
+        return stats
+    
+    def _refresh_vector_index(self):
+        """
+        Update the vector index after chunk changes, if numpy is available
+        Nothing is embedded or rewritten while the agent references the same
+        set of chunks as the index holds
+        """
+        if set(self.vector_index.ids) == self.chunk_store.owner_hashes(self.agent_path.name):
+            return
         
-        return chunks
+        try:
+            self.build_vector_index(save=False)
+        except ImportError:
+            print("   ⚠️  numpy not installed; skipping semantic index")
+    
+    def retrieve(self, query: str, k: Optional[int] = None) -> List[Dict]:
+        """
+        Top-k chunks most relevant to a query
+        Defaults to CHUNKS_PER_CONTEXT, i.e. as many token-budget chunks as
+        fill the agent's context window, instead of whole context layers
+        """
+        hits = self.vector_index.search(query, k or self.CHUNKS_PER_CONTEXT)
+        texts = self.chunk_store.chunk_texts([chunk_hash for chunk_hash, _ in hits])
+        return [{"hash": chunk_hash, "score": score, "text": texts[chunk_hash]}
+                for chunk_hash, score in hits if chunk_hash in texts]
+    
+    def remove_document_chunks(self, doc_path: Path) -> int:
+        """Release this agent's chunk references for a document and collect orphans"""
+        released = self.chunk_store.remove_document(self.agent_path.name, str(doc_path))
+        self.registry["chunks"].pop(str(doc_path), None)
+        self.chunk_store.collect_garbage()
+        self._refresh_vector_index()
+        self.save_registry()
+        return released
 
 
 class EnhancedAgentGeneratorV3:
@@ -1331,7 +2572,8 @@ class EnhancedAgentGeneratorV3:
                     context_cache: bool = True,
                     templates: List[str] = None,
                     module_path: Optional[Path] = None,
-                    documents: Optional[List[Path]] = None):
+                    documents: Optional[List[Path]] = None,
+                    workers: int = 1):
         """
         Create a new agent with v3.0 features:
         - Phased document processing
@@ -1459,7 +2701,8 @@ class EnhancedAgentGeneratorV3:
         # Process initial documents if provided
         if documents:
             print(f"\n📄 Processing {len(documents)} initial documents...")
-            results = self.doc_manager.process_documents_phased(documents, self.module_name)
+            results = self.doc_manager.process_documents_phased(documents, self.module_name,
+                                                                workers=workers)
             print(f"   ✓ Processed with {results['integration']['integration_metrics']['integration_rate']:.1%} integration rate")
         
         # Create README with v3.0 features
@@ -1686,6 +2929,19 @@ Specialization Levels:
             help='Use phased approach for document processing (mandatory for large collections)'
         )
         
+        self.parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Worker processes for phased discovery, quality and extraction (0 = all cores, default: 1)'
+        )
+        
+        self.parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Skip documents already extracted by an earlier phased run (matched by content hash)'
+        )
+        
         # Agent configuration
         self.parser.add_argument(
             '--type',
@@ -1788,7 +3044,8 @@ def main():
                 repos=repos,
                 context_cache=args.context_cache,
                 module_path=module_path,
-                documents=documents
+                documents=documents,
+                workers=args.workers or os.cpu_count() or 1
             )
         
         elif mode == AgentMode.UPDATE:
@@ -1814,7 +3071,9 @@ def main():
                 
                 if args.phased:
                     results = generator.doc_manager.process_documents_phased(
-                        documents, args.module_name
+                        documents, args.module_name,
+                        workers=args.workers or os.cpu_count() or 1,
+                        resume=args.resume
                     )
                     print(f"\n✅ Phased processing complete")
                     print(f"   Integration rate: {results['integration']['integration_metrics']['integration_rate']:.1%}")
@@ -13,11 +13,14 @@ from pathlib import Path
 def main():
     parser = argparse.ArgumentParser(prog='data', add_help=False)
     parser.add_argument('subcommand', nargs='?', default='help',
-                       choices=['scan', 'context', 'research', 'query', 'help'])
+                       choices=['scan', 'context', 'watch', 'research', 'query', 'cache', 'help'])
     parser.add_argument('target', nargs='?')
     parser.add_argument('--topics', nargs='+')
+    parser.add_argument('--incremental', action='store_true')
+    parser.add_argument('--workers', type=int)
     
-    args = parser.parse_args()
+    # Unrecognised options (e.g. query filters) are passed straight through
+    args, extra = parser.parse_known_args()
     
     base_cmd = [sys.executable, str(Path(__file__).parent / "engineering_data_context.py")]
     
@@ -25,10 +28,20 @@ def main():
         cmd = base_cmd + ["generate", "--folder", args.target or "."]
         if args.subcommand == 'context':
             cmd.append("--deep-research")
+        if args.incremental:
+            cmd.append("--incremental")
+        if args.workers is not None:
+            cmd += ["--workers", str(args.workers)]
+    elif args.subcommand == 'watch':
+        cmd = base_cmd + ["watch", "--folder", args.target or "."]
+        if args.workers is not None:
+            cmd += ["--workers", str(args.workers)]
     elif args.subcommand == 'research':
         cmd = base_cmd + ["enhance", "--folder", ".", "--research-topics"] + (args.topics or [])
     elif args.subcommand == 'query':
         cmd = base_cmd + ["query", "--context", args.target or ""]
+    elif args.subcommand == 'cache':
+        cmd = base_cmd + ["cache", "--cache-action", args.target or "stats"]
     else:
         print("""
 📊 Data Command
@@ -38,19 +51,35 @@ Usage: /data [subcommand] [options]
 Subcommands:
   scan FOLDER      Scan for engineering data
   context FOLDER   Generate context with research
+  watch FOLDER     Keep context fresh as files change (Ctrl+C to stop)
   research TOPICS  Add research on topics
   query "TERM"     Query data context
+  cache [ACTION]   Research cache: stats, compact or clear
   help            Show this help
 
+Options:
+  --incremental    Only re-scan files changed since the last scan
+  --workers N      Extract files with N processes (0 = all cores)
+  Other options are passed to engineering_data_context.py, e.g.
+  query filters: --type --module --data-type --min-size --max-size
+                 --limit --offset --facets
+  watch options: --modules --debounce SECONDS --poll-interval SECONDS
+  cache options: --cache-ttl-days --cache-max-entries
+                 --cache-policy lru|lfu --vacuum
+
 Examples:
   /data scan ./measurements
+  /data scan ./measurements --incremental
   /data context ./data
+  /data watch ./measurements --debounce 2
   /data research "sensor calibration" "API docs"
   /data query "temperature sensor"
+  /data query "sensor" --data-type tabular_data --limit 50 --offset 50
+  /data cache compact --cache-max-entries 5000 --vacuum
 """)
         return
     
-    subprocess.run(cmd)
+    subprocess.run(cmd + extra)
 
 if __name__ == '__main__':
     main()
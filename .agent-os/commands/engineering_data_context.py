@@ -15,10 +15,13 @@ Features:
 - Cross-repository data reusability
 
 Usage:
-    /engineering-data-context generate --folder PATH [--deep-research] [--modules]
+    /engineering-data-context generate --folder PATH [--deep-research] [--modules] [--incremental] [--workers N]
+        [--hash-algorithm auto|xxh3|blake3|blake2b|md5] [--hash-strategy auto|full|sampled]
+    /engineering-data-context watch --folder PATH [--modules] [--debounce SECONDS]
     /engineering-data-context enhance --folder PATH [--research-topics TOPICS]
-    /engineering-data-context query --context QUERY
+    /engineering-data-context query --context QUERY [--type file] [--data-type T] [--limit N --offset N]
     /engineering-data-context export --format [json|yaml|markdown]
+    /engineering-data-context cache [--cache-action stats|compact|clear] [--vacuum]
 """
 
 import os
@@ -29,21 +32,48 @@ import argparse
 import hashlib
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Callable, Iterable
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, fields
 import re
 import ast
+import csv
+import io
+import struct
+import stat
+import mmap
+import zipfile
 import subprocess
 import shutil
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+import threading
+import queue
+import asyncio
+from itertools import accumulate, islice
+from collections import OrderedDict
+from contextlib import contextmanager
 import requests
 from urllib.parse import quote
 import time
 
+def _slotted(cls, extra: Tuple[str, ...] = ()):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)."""
+    names = tuple(f.name for f in fields(cls)) + extra
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
 @dataclass
 class DataContext:
-    """Represents context for a data file or folder."""
+    """Represents context for a data file or folder.
+    
+    Instances are slotted and intern their type, tag and module strings, so a
+    large scan holds no per-context __dict__ and one copy of each repeated
+    string. Contexts read back from the database keep their JSON columns as
+    text until first accessed (see from_row), and unchanged columns are
+    written back without re-encoding.
+    """
     path: str
     type: str  # 'file', 'folder', 'module'
     name: str
@@ -56,6 +86,81 @@ class DataContext:
     last_updated: str
     tags: List[str]
     module_assignment: Optional[str]
+    fingerprint: Optional[str] = None  # stat fingerprint used by incremental rescans
+    
+    # JSON columns decoded on first access, with the value a NULL column decodes to
+    JSON_FIELDS = {'metadata': dict, 'data_schema': lambda: None, 'related_docs': list,
+                   'web_research': lambda: None, 'tags': list}
+    
+    def __post_init__(self):
+        self._raw = None
+        self.type = sys.intern(self.type)
+        self.tags = [sys.intern(tag) for tag in self.tags]
+        if self.module_assignment:
+            self.module_assignment = sys.intern(self.module_assignment)
+    
+    @classmethod
+    def from_row(cls, row: Tuple) -> 'DataContext':
+        """Build a context from a data_context row without decoding its JSON columns."""
+        context = cls.__new__(cls)
+        (context.path, context.type, context.name, context.description, metadata,
+         context.content_hash, data_schema, related_docs, web_research,
+         context.last_updated, tags, module_assignment, context.fingerprint) = row
+        context.type = sys.intern(context.type)
+        context.module_assignment = sys.intern(module_assignment) if module_assignment else None
+        context._raw = {'metadata': metadata, 'data_schema': data_schema,
+                        'related_docs': related_docs, 'web_research': web_research,
+                        'tags': tags}
+        return context
+    
+    def __getattr__(self, name: str):
+        # Only reached for unset slots: decode a JSON column still held as text
+        try:
+            raw = object.__getattribute__(self, '_raw')
+        except AttributeError:
+            raise AttributeError(name) from None
+        if not raw or name not in raw:
+            raise AttributeError(name)
+        text = raw.pop(name)
+        value = json.loads(text) if text else self.JSON_FIELDS[name]()
+        if name == 'tags':
+            value = [sys.intern(tag) for tag in value]
+        setattr(self, name, value)
+        return value
+    
+    def json_column(self, name: str) -> Optional[str]:
+        """Return a JSON column as stored text, encoding it only if it was decoded."""
+        raw = self._raw
+        if raw and name in raw:
+            return raw[name]
+        value = getattr(self, name)
+        if value is None or (not value and name in ('data_schema', 'web_research')):
+            return None
+        return json.dumps(value)
+
+DataContext = _slotted(DataContext, extra=('_raw',))
+
+@dataclass
+class FolderAggregate:
+    """Rolled-up statistics for a folder, computed bottom-up in a single pass."""
+    item_count: int
+    total_size_bytes: int
+    data_types: List[str]
+    subdirectories: List[str]
+    content_hash: str
+
+@dataclass
+class _FolderScanState:
+    """Per-folder accumulator used while a tree scan is in progress."""
+    path: Path
+    parent: Optional['_FolderScanState']
+    item_count: int = 0
+    total_size_bytes: int = 0
+    pending_children: int = 0
+    data_types: set = field(default_factory=set)
+    subdirectories: List[str] = field(default_factory=list)
+    file_records: List[Tuple[str, int, int]] = field(default_factory=list)
+    child_hashes: List[Tuple[str, str]] = field(default_factory=list)
 
 @dataclass
 class ResearchResult:
@@ -68,14 +173,1693 @@ class ResearchResult:
     best_practices: List[str]
     timestamp: str
 
+@dataclass
+class ScanProgress:
+    """Progress of a context scan, passed to on_progress callbacks."""
+    files: int = 0
+    folders: int = 0
+    unchanged: int = 0
+    bytes_hashed: int = 0
+    elapsed: float = 0.0
+    expected_items: Optional[int] = None  # items stored by the previous scan, if any
+    done: bool = False
+    
+    @property
+    def processed(self) -> int:
+        return self.files + self.folders + self.unchanged
+    
+    @property
+    def files_per_sec(self) -> float:
+        return self.files / self.elapsed if self.elapsed else 0.0
+    
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds left, estimated from the previous scan's size; None when unknown."""
+        if self.done:
+            return 0.0
+        if not self.expected_items or not self.elapsed or not self.processed:
+            return None
+        remaining = max(self.expected_items - self.processed, 0)
+        return remaining * self.elapsed / self.processed
+    
+    def format(self) -> str:
+        eta = self.eta
+        return (f"{self.files} files, {self.folders} folders, {self.unchanged} unchanged | "
+                f"{self.bytes_hashed / (1024 * 1024):.1f} MB hashed | "
+                f"{self.files_per_sec:.1f} files/s | "
+                f"ETA {'unknown' if eta is None else f'{eta:.0f}s'}")
+
+class ContextStore:
+    """Shared SQLite access layer for the data-context database.
+    
+    Each thread keeps one long-lived connection. WAL journaling lets readers
+    (queries, /data commands) run while a scan is writing, and bulk writes go
+    through executemany in chunked transactions.
+    """
+    
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA foreign_keys=ON"
+    )
+    
+    def __init__(self, db_path: Path, chunk_size: int = 5000, timeout: float = 30.0):
+        self.db_path = db_path
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self._local = threading.local()
+    
+    def __getstate__(self):
+        # Connections never cross process boundaries; workers reconnect lazily
+        return {'db_path': self.db_path, 'chunk_size': self.chunk_size, 'timeout': self.timeout}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+    
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening and tuning it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block of statements in one IMMEDIATE transaction."""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
+    def execute(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        """Execute one statement in autocommit mode."""
+        return self.connection().execute(sql, params)
+    
+    def query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Execute a read and return all rows."""
+        return self.connection().execute(sql, params).fetchall()
+    
+    def executemany(self, sql: str, rows: Iterable[Tuple]) -> int:
+        """Execute a statement for many rows, committing every chunk_size rows."""
+        rows = iter(rows)
+        total = 0
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return total
+            with self.transaction() as conn:
+                conn.executemany(sql, chunk)
+            total += len(chunk)
+    
+    def close(self):
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+class ContextWriter(threading.Thread):
+    """Single writer thread that persists contexts to SQLite in batches."""
+    
+    _STOP = object()
+    
+    def __init__(self, save_batch, batch_size: int = 500, flush_interval: float = 2.0):
+        super().__init__(name='context-writer', daemon=True)
+        self.save_batch = save_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=batch_size * 4)
+        self.written = 0
+        self.error: Optional[BaseException] = None
+    
+    def put(self, context: DataContext):
+        """Queue a context for writing; blocks when the writer falls behind."""
+        if self.error:
+            raise self.error
+        self.queue.put(context)
+    
+    def close(self):
+        """Flush remaining contexts and wait for the writer to finish."""
+        self.queue.put(self._STOP)
+        self.join()
+        if self.error:
+            raise self.error
+    
+    def run(self):
+        batch = []
+        while True:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            
+            if item is not None and item is not self._STOP:
+                batch.append(item)
+            
+            if batch and (item is None or item is self._STOP or len(batch) >= self.batch_size):
+                try:
+                    self.save_batch(batch)
+                    self.written += len(batch)
+                except Exception as e:
+                    self.error = e
+                batch = []
+            
+            if item is self._STOP:
+                return
+
+class _SampleComplete(Exception):
+    """Raised once the sampling budget is met and nothing later can be sampled."""
+
+class StreamingSchemaSampler:
+    """Infer a sampled schema from a JSON or YAML stream with bounded memory.
+    
+    Mirrors the sampling budget of the old in-memory inference: the first
+    MAX_KEYS keys of each object, the first element of each array, and
+    nesting down to MAX_DEPTH. Values outside the budget are skipped without
+    being materialised, and reading stops as soon as no ancestor container
+    can sample anything further.
+    """
+    
+    MAX_KEYS = 10
+    MAX_DEPTH = 3
+    CHUNK_SIZE = 64 * 1024
+    
+    _STRUCTURAL = re.compile(r'["{}\[\]]')
+    _STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+    _COMPLETE_RUN = re.compile(r'(?:[^"]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+    _BRACKETS = re.compile(r'[{}\[\]]')
+    _BRACKET_DELTA = {'{': 1, '[': 1, '}': -1, ']': -1}
+    _STRING_SPECIAL = re.compile(r'["\\]')
+    _SCALAR_END = re.compile(r'[\s,:\]}]')
+    
+    _YAML_TYPES = {
+        'tag:yaml.org,2002:str': 'string',
+        'tag:yaml.org,2002:timestamp': 'string',
+        'tag:yaml.org,2002:binary': 'string',
+        'tag:yaml.org,2002:int': 'number',
+        'tag:yaml.org,2002:float': 'number',
+        'tag:yaml.org,2002:bool': 'boolean',
+        'tag:yaml.org,2002:null': 'null'
+    }
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    
+    # JSON
+    
+    def sample_json(self) -> Dict:
+        """Sample the schema of a JSON document."""
+        schema = {}
+        try:
+            self._json_value(schema, 0, tail_needed=False)
+        except _SampleComplete:
+            pass
+        return schema
+    
+    def _fill(self, keep_from: Optional[int] = None) -> bool:
+        """Read another chunk, discarding the buffer before `keep_from` (default: pos)."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        keep_from = self.pos if keep_from is None else keep_from
+        self.buffer = self.buffer[keep_from:] + chunk
+        self.pos -= keep_from
+        return True
+    
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError('Unexpected end of JSON document')
+    
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at JSON offset near {self.pos}")
+        self.pos += 1
+    
+    def _json_value(self, out: Dict, depth: int, tail_needed: bool):
+        """Fill `out` with the schema of the next value."""
+        char = self._peek()
+        
+        if depth > self.MAX_DEPTH:
+            out['type'] = 'unknown'
+            if not tail_needed:
+                raise _SampleComplete()
+            self._skip_json_value()
+        elif char == '{':
+            self._json_object(out, depth, tail_needed)
+        elif char == '[':
+            self.pos += 1
+            out['type'] = 'array'
+            if self._peek() == ']':
+                self.pos += 1
+                return
+            out['items'] = {}
+            self._json_value(out['items'], depth + 1, tail_needed)
+            if not tail_needed:
+                raise _SampleComplete()
+            self._skip_json_rest(1)
+        elif char == '"':
+            out['type'] = 'string'
+            self._skip_json_string()
+        else:
+            token = self._read_json_scalar()
+            if token in ('true', 'false'):
+                out['type'] = 'boolean'
+            elif token == 'null':
+                out['type'] = 'null'
+            else:
+                float(token)  # validates the number
+                out['type'] = 'number'
+    
+    def _json_object(self, out: Dict, depth: int, tail_needed: bool):
+        self.pos += 1
+        properties = {}
+        out['type'] = 'object'
+        out['properties'] = properties
+        
+        if self._peek() == '}':
+            self.pos += 1
+            return
+        
+        while True:
+            if len(properties) >= self.MAX_KEYS:
+                if not tail_needed:
+                    raise _SampleComplete()
+                self._skip_json_rest(1)
+                return
+            
+            key = self._read_json_key()
+            self._expect(':')
+            properties[key] = {}
+            # Siblings after this key may still be sampled
+            self._json_value(properties[key], depth + 1, tail_needed=True)
+            
+            char = self._peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError(f"Expected ',' or '}}' in JSON object, got '{char}'")
+    
+    def _read_json_key(self) -> str:
+        if self._peek() != '"':
+            raise ValueError('Expected a string key in JSON object')
+        return self._skip_json_string(keep=True)
+    
+    def _read_json_scalar(self) -> str:
+        self._peek()
+        while True:
+            match = self._SCALAR_END.search(self.buffer, self.pos)
+            if match or not self._fill():
+                break
+        end = match.start() if match else len(self.buffer)
+        token = self.buffer[self.pos:end]
+        self.pos = end
+        return token
+    
+    def _skip_json_string(self, keep: bool = False) -> Optional[str]:
+        """Skip a string at the opening quote, decoding and returning it if `keep`."""
+        start = self.pos
+        self.pos += 1
+        while True:
+            match = self._STRING_SPECIAL.search(self.buffer, self.pos)
+            if match is None or (match.group() == '\\' and match.end() >= len(self.buffer)):
+                # Need more input; retain the string so far only if it is decoded
+                self.pos = match.start() if match else len(self.buffer)
+                keep_from = start if keep else self.pos
+                if not self._fill(keep_from):
+                    raise ValueError('Unterminated JSON string')
+                start -= keep_from
+                continue
+            if match.group() == '"':
+                self.pos = match.end()
+                return json.loads(self.buffer[start:self.pos]) if keep else None
+            self.pos = match.end() + 1
+    
+    def _skip_json_value(self):
+        char = self._peek()
+        if char in '{[':
+            self.pos += 1
+            self._skip_json_rest(1)
+        elif char == '"':
+            self._skip_json_string()
+        else:
+            self._read_json_scalar()
+    
+    def _skip_json_rest(self, nesting: int):
+        """Skip forward until `nesting` open containers have been closed.
+        
+        Whole buffers are skipped with C-level regex and bracket counting;
+        only the buffer where the nesting closes is scanned token by token.
+        """
+        while nesting:
+            # Everything up to the start of any incomplete trailing string
+            end = self._COMPLETE_RUN.match(self.buffer, self.pos).end()
+            brackets = self._BRACKETS.findall(self._STRING.sub('', self.buffer[self.pos:end]))
+            depths = list(accumulate(map(self._BRACKET_DELTA.__getitem__, brackets)))
+            
+            if depths and min(depths) <= -nesting:
+                self._skip_json_tokens(nesting)
+                return
+            
+            nesting += depths[-1] if depths else 0
+            self.pos = end
+            if not self._fill():
+                raise ValueError('Unexpected end of JSON document')
+    
+    def _skip_json_tokens(self, nesting: int):
+        """Skip token by token until `nesting` open containers have been closed."""
+        while nesting:
+            match = self._STRUCTURAL.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self._fill():
+                    raise ValueError('Unexpected end of JSON document')
+                continue
+            char = match.group()
+            self.pos = match.start()
+            if char == '"':
+                self._skip_json_string()
+                continue
+            self.pos += 1
+            nesting += 1 if char in '{[' else -1
+    
+    # YAML
+    
+    def sample_yaml(self) -> Dict:
+        """Sample the schema of the first YAML document from parser events."""
+        events = yaml.parse(self.stream, Loader=yaml.SafeLoader)
+        self._resolver = yaml.resolver.Resolver()
+        schema = {}
+        try:
+            for event in events:
+                if isinstance(event, yaml.DocumentStartEvent):
+                    self._yaml_node(next(events), events, schema, 0, tail_needed=False)
+                    break
+        except _SampleComplete:
+            pass
+        return schema or {'type': 'null'}
+    
+    def _yaml_node(self, event, events, out: Dict, depth: int, tail_needed: bool):
+        if depth > self.MAX_DEPTH:
+            out['type'] = 'unknown'
+            if not tail_needed:
+                raise _SampleComplete()
+            self._skip_yaml_node(event, events)
+        elif isinstance(event, yaml.MappingStartEvent):
+            properties = {}
+            out['type'] = 'object'
+            out['properties'] = properties
+            for key_event in events:
+                if isinstance(key_event, yaml.MappingEndEvent):
+                    return
+                if len(properties) >= self.MAX_KEYS:
+                    if not tail_needed:
+                        raise _SampleComplete()
+                    self._skip_yaml_node(key_event, events)
+                    self._skip_yaml_node(next(events), events)
+                    continue
+                if isinstance(key_event, yaml.ScalarEvent):
+                    key = key_event.value
+                else:
+                    self._skip_yaml_node(key_event, events)
+                    key = '?'
+                properties[key] = {}
+                self._yaml_node(next(events), events, properties[key], depth + 1,
+                                tail_needed=True)
+        elif isinstance(event, yaml.SequenceStartEvent):
+            out['type'] = 'array'
+            item_event = next(events)
+            if isinstance(item_event, yaml.SequenceEndEvent):
+                return
+            out['items'] = {}
+            self._yaml_node(item_event, events, out['items'], depth + 1, tail_needed)
+            if not tail_needed:
+                raise _SampleComplete()
+            self._skip_yaml_node(None, events, nesting=1)
+        elif isinstance(event, yaml.ScalarEvent):
+            tag = event.tag
+            if not tag or tag == '!':
+                tag = self._resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+            out['type'] = self._YAML_TYPES.get(tag, 'string')
+        else:
+            out['type'] = 'unknown'
+    
+    def _skip_yaml_node(self, event, events, nesting: int = 0):
+        """Consume events until the node starting at `event` (or open nesting) closes."""
+        if event is not None:
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                nesting += 1
+            elif not nesting:
+                return
+        for event in events:
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                nesting += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                nesting -= 1
+            if not nesting:
+                return
+
+class _ThriftCompactReader:
+    """Minimal Thrift compact-protocol decoder for Parquet footers.
+    
+    Structs decode to {field_id: value} dicts; only what FileMetaData needs.
+    """
+    
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+    
+    def _byte(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+    
+    def _varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self._byte()
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+    
+    def _zigzag(self) -> int:
+        n = self._varint()
+        return (n >> 1) ^ -(n & 1)
+    
+    def _value(self, ttype: int) -> Any:
+        if ttype in (1, 2):  # booleans inside containers carry a byte
+            return self._byte() == 1
+        if ttype == 3:
+            return struct.unpack('b', bytes([self._byte()]))[0]
+        if ttype in (4, 5, 6):
+            return self._zigzag()
+        if ttype == 7:
+            value = struct.unpack('<d', self.data[self.pos:self.pos + 8])[0]
+            self.pos += 8
+            return value
+        if ttype == 8:
+            length = self._varint()
+            value = self.data[self.pos:self.pos + length]
+            self.pos += length
+            return value
+        if ttype in (9, 10):
+            header = self._byte()
+            size = header >> 4
+            if size == 15:
+                size = self._varint()
+            return [self._value(header & 0x0F) for _ in range(size)]
+        if ttype == 11:
+            size = self._varint()
+            if not size:
+                return {}
+            types = self._byte()
+            return {self._value(types >> 4): self._value(types & 0x0F) for _ in range(size)}
+        if ttype == 12:
+            return self.read_struct()
+        raise ValueError(f'Unsupported thrift compact type {ttype}')
+    
+    def read_struct(self) -> Dict[int, Any]:
+        fields = {}
+        field_id = 0
+        while True:
+            header = self._byte()
+            if header == 0:
+                return fields
+            delta, ttype = header >> 4, header & 0x0F
+            field_id = field_id + delta if delta else self._zigzag()
+            if ttype in (1, 2):
+                fields[field_id] = ttype == 1
+            else:
+                fields[field_id] = self._value(ttype)
+
+class TokenBucket:
+    """Async token-bucket rate limiter: `rate` tokens per second, bursts up to `capacity`."""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class LocalResearchBackend:
+    """Offline stand-in for _web_research, for benchmarking research throughput.
+    
+    Returns synthetic results after an optional simulated network latency.
+    """
+    
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+    
+    def __call__(self, query: str) -> ResearchResult:
+        if self.latency:
+            time.sleep(self.latency)
+        return ResearchResult(
+            query=query,
+            sources=[{'title': f'Local result for {query}', 'url': 'local://research'}],
+            summary=f"Local research stand-in for {query}",
+            technical_docs=[],
+            code_examples=[],
+            best_practices=[],
+            timestamp=datetime.now().isoformat()
+        )
+
+class ResearchScheduler:
+    """Run research queries for many contexts on an asyncio event loop.
+    
+    A fixed pool of worker coroutines pulls contexts from the input, so only
+    `concurrency` contexts are in progress at once. Backend calls are rate
+    limited by a token bucket, identical queries share one in-flight future,
+    and the cache is consulted lazily per query. New results are
+    checkpointed to the cache every `checkpoint_every` results, so an
+    interrupted run resumes from the cache.
+    """
+    
+    def __init__(self, research_fn: Callable[[str], Optional[ResearchResult]],
+                 cache_lookup: Callable[[str], Optional[Dict]],
+                 cache_store: Callable[[List[Tuple[str, str, Dict]]], None],
+                 rate: float = 5.0, concurrency: int = 8, timeout: float = 30.0,
+                 checkpoint_every: int = 50):
+        self.research_fn = research_fn
+        self.cache_lookup = cache_lookup
+        self.cache_store = cache_store
+        self.rate = rate
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.checkpoint_every = checkpoint_every
+        self.stats = {'queries': 0, 'cache_hits': 0, 'coalesced': 0, 'fetched': 0, 'failed': 0}
+    
+    def run(self, contexts: Iterable[DataContext],
+            queries_for: Callable[[DataContext], List[str]]):
+        """Research every context synchronously, attaching results to web_research."""
+        asyncio.run(self._run(contexts, queries_for))
+    
+    async def _run(self, contexts: Iterable[DataContext],
+                   queries_for: Callable[[DataContext], List[str]]):
+        self._bucket = TokenBucket(self.rate)
+        self._resolved: Dict[str, asyncio.Future] = {}
+        self._pending: List[Tuple[str, str, Dict]] = []
+        remaining = iter(contexts)
+        
+        async def worker():
+            for context in remaining:
+                for query in queries_for(context):
+                    result = await self._resolve(query)
+                    if result:
+                        if context.web_research is None:
+                            context.web_research = {}
+                        context.web_research[query] = result
+        
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        finally:
+            self._checkpoint()
+    
+    async def _resolve(self, query: str) -> Optional[Dict]:
+        """Return the research result for a query, fetching it at most once."""
+        self.stats['queries'] += 1
+        query_hash = hashlib.md5(query.encode()).hexdigest()
+        
+        future = self._resolved.get(query_hash)
+        if future is not None:
+            self.stats['coalesced'] += 1
+            return await future
+        
+        future = asyncio.get_running_loop().create_future()
+        self._resolved[query_hash] = future
+        result = None
+        
+        try:
+            result = self.cache_lookup(query_hash)
+            if result is not None:
+                self.stats['cache_hits'] += 1
+            else:
+                await self._bucket.acquire()
+                fetched = await asyncio.wait_for(
+                    asyncio.to_thread(self.research_fn, query), self.timeout)
+                if fetched:
+                    result = asdict(fetched)
+                    self.stats['fetched'] += 1
+                    self._pending.append((query_hash, query, result))
+                    if len(self._pending) >= self.checkpoint_every:
+                        self._checkpoint()
+        except Exception as e:
+            self.stats['failed'] += 1
+            print(f"   Research error for '{query}': {e}")
+        finally:
+            future.set_result(result)
+        
+        return result
+    
+    def _checkpoint(self):
+        """Persist newly fetched results so partial progress survives interruption."""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self.cache_store(pending)
+
+class ResearchCache:
+    """Research result cache with per-entry TTL and a bounded size.
+    
+    Lookups are per query; expired entries count as misses. Hits are
+    buffered in memory and written back by flush(), so lookups never write.
+    compact() drops expired entries and evicts the least recently (LRU) or
+    least frequently (LFU) used entries above max_entries. Hit, miss and
+    eviction counters persist in research_cache_stats.
+    """
+    
+    POLICIES = ('lru', 'lfu')
+    
+    def __init__(self, store: ContextStore, ttl_days: float = 30.0,
+                 max_entries: int = 10000, policy: str = 'lru'):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown cache policy: {policy}")
+        self.store = store
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._touched: Dict[str, int] = {}
+        self._counters = {'hits': 0, 'misses': 0, 'expired': 0}
+        self._compaction: Optional[threading.Thread] = None
+    
+    def init_schema(self):
+        """Create the cache tables, migrating caches written before TTL support."""
+        store = self.store
+        store.execute('''
+            CREATE TABLE IF NOT EXISTS research_cache (
+                query_hash TEXT PRIMARY KEY,
+                query TEXT,
+                results TEXT,
+                timestamp TEXT,
+                created_at REAL,
+                accessed_at REAL,
+                hit_count INTEGER DEFAULT 0
+            )
+        ''')
+        
+        columns = {row[1] for row in store.query("PRAGMA table_info(research_cache)")}
+        for column, decl in (('created_at', 'REAL'), ('accessed_at', 'REAL'),
+                             ('hit_count', 'INTEGER DEFAULT 0')):
+            if column not in columns:
+                store.execute(f"ALTER TABLE research_cache ADD COLUMN {column} {decl}")
+        if 'created_at' not in columns:
+            store.execute('''
+                UPDATE research_cache
+                SET created_at = CAST(strftime('%s', timestamp, 'utc') AS REAL),
+                    accessed_at = CAST(strftime('%s', timestamp, 'utc') AS REAL)
+            ''')
+        
+        store.execute("CREATE INDEX IF NOT EXISTS idx_research_cache_created "
+                      "ON research_cache(created_at)")
+        store.execute("CREATE INDEX IF NOT EXISTS idx_research_cache_eviction "
+                      "ON research_cache(accessed_at)")
+        store.execute('''
+            CREATE TABLE IF NOT EXISTS research_cache_stats (
+                name TEXT PRIMARY KEY,
+                value INTEGER
+            )
+        ''')
+    
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_days * 86400
+    
+    def get(self, query_hash: str) -> Optional[Dict]:
+        """Return a cached, unexpired result or None."""
+        rows = self.store.query(
+            "SELECT results, created_at FROM research_cache WHERE query_hash = ?",
+            (query_hash,))
+        with self._lock:
+            if not rows:
+                self._counters['misses'] += 1
+                return None
+            results, created_at = rows[0]
+            if self.ttl_days and (created_at or 0) < self._cutoff():
+                self._counters['misses'] += 1
+                self._counters['expired'] += 1
+                return None
+            self._counters['hits'] += 1
+            self._touched[query_hash] = self._touched.get(query_hash, 0) + 1
+        return json.loads(results)
+    
+    def put(self, entries: List[Tuple[str, str, Dict]]):
+        """Store a batch of (query_hash, query, result) entries."""
+        now = time.time()
+        timestamp = datetime.now().isoformat()
+        self.store.executemany('''
+            INSERT INTO research_cache
+                (query_hash, query, results, timestamp, created_at, accessed_at, hit_count)
+            VALUES (?, ?, ?, ?, ?, ?, 0)
+            ON CONFLICT(query_hash) DO UPDATE SET
+                query = excluded.query, results = excluded.results,
+                timestamp = excluded.timestamp, created_at = excluded.created_at,
+                accessed_at = excluded.accessed_at
+        ''', ((query_hash, query, json.dumps(result), timestamp, now, now)
+              for query_hash, query, result in entries))
+    
+    def flush(self):
+        """Write buffered hit counts, access times and counters back to the database."""
+        with self._lock:
+            touched, self._touched = self._touched, {}
+            counters = self._counters
+            self._counters = dict.fromkeys(counters, 0)
+        
+        now = time.time()
+        self.store.executemany(
+            "UPDATE research_cache SET accessed_at = ?, hit_count = hit_count + ? "
+            "WHERE query_hash = ?",
+            ((now, hits, query_hash) for query_hash, hits in touched.items()))
+        self._add_counters(counters)
+    
+    def _add_counters(self, counters: Dict[str, int]):
+        self.store.executemany(
+            "INSERT INTO research_cache_stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            ((name, value) for name, value in counters.items() if value))
+    
+    def compact(self) -> Dict[str, int]:
+        """Delete expired entries, then evict down to max_entries."""
+        with self.store.transaction() as conn:
+            expired = 0
+            if self.ttl_days:
+                expired = conn.execute("DELETE FROM research_cache WHERE created_at < ?",
+                                       (self._cutoff(),)).rowcount
+            
+            evicted = 0
+            excess = conn.execute("SELECT COUNT(*) FROM research_cache").fetchone()[0] - self.max_entries
+            if self.max_entries and excess > 0:
+                order = ('accessed_at' if self.policy == 'lru'
+                         else 'hit_count, accessed_at')
+                evicted = conn.execute(f'''
+                    DELETE FROM research_cache WHERE query_hash IN (
+                        SELECT query_hash FROM research_cache ORDER BY {order} LIMIT ?
+                    )
+                ''', (excess,)).rowcount
+        
+        self._add_counters({'expired_removed': expired, 'evictions': evicted})
+        return {'expired_removed': expired, 'evicted': evicted}
+    
+    def compact_in_background(self):
+        """Flush and compact on a background thread; see wait()."""
+        self.wait()
+        
+        def run():
+            try:
+                self.flush()
+                self.compact()
+            except sqlite3.Error as e:
+                print(f"   Warning: research cache compaction failed: {e}")
+            finally:
+                self.store.close()
+        
+        self._compaction = threading.Thread(target=run, name='research-cache-compaction')
+        self._compaction.start()
+    
+    def wait(self):
+        """Wait for a running background compaction to finish."""
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return entry counts, sizes and lifetime hit/miss counters."""
+        self.flush()
+        entries, size, expired = self.store.query(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(results)), 0), "
+            "COALESCE(SUM(created_at < ?), 0) FROM research_cache",
+            (self._cutoff() if self.ttl_days else 0,))[0]
+        counters = dict(self.store.query("SELECT name, value FROM research_cache_stats"))
+        lookups = counters.get('hits', 0) + counters.get('misses', 0)
+        return {
+            'entries': entries,
+            'size_bytes': size,
+            'expired_entries': expired,
+            'max_entries': self.max_entries,
+            'ttl_days': self.ttl_days,
+            'policy': self.policy,
+            'hits': counters.get('hits', 0),
+            'misses': counters.get('misses', 0),
+            'hit_rate': counters.get('hits', 0) / lookups if lookups else 0.0,
+            'evictions': counters.get('evictions', 0),
+            'expired_removed': counters.get('expired_removed', 0)
+        }
+    
+    def clear(self) -> int:
+        """Remove every cached result."""
+        return self.store.execute("DELETE FROM research_cache").rowcount
+    
+    def __getstate__(self):
+        # Locks and threads stay in the parent process
+        state = self.__dict__.copy()
+        state.update(_lock=None, _touched={}, _compaction=None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+@contextmanager
+def mapped_view(file_path: Path, min_size: int = 0) -> Iterator[Optional[memoryview]]:
+    """Yield a read-only, mmap-backed memoryview of a file's contents.
+    
+    Slicing the view copies nothing, and pages come from the OS page cache,
+    which concurrent worker processes share. Yields None for files smaller
+    than min_size, empty files, or files that cannot be mapped, so callers
+    fall back to buffered reads. Slices must not outlive the block.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        mapping = None
+        if size and size >= min_size:
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+    
+    if mapping is None:
+        yield None
+        return
+    
+    view = memoryview(mapping)
+    try:
+        yield view
+    finally:
+        view.release()
+        mapping.close()
+
+def _absolute_path(path: Path) -> Path:
+    """Absolute, normalised form of a path, as stored in data_context.
+    
+    Symlinks are not resolved, so paths match those reported by the tree
+    walker and by filesystem events under the same root.
+    """
+    return Path(os.path.abspath(path))
+
+class ContentFingerprinter:
+    """Configurable content hashing for files and folders.
+    
+    Algorithms: 'xxh3' (xxhash) and 'blake3' when installed, 'blake2b' from
+    the standard library, and 'md5' for fingerprints compatible with older
+    databases; 'auto' picks the fastest available. Strategies: 'full' hashes
+    every byte, 'sampled' hashes the file size plus one block_size block
+    every stride bytes (always including the first and last block), and
+    'auto' hashes files up to full_threshold fully and samples larger ones.
+    Files of at least mmap_threshold bytes are hashed straight from an mmap
+    view; smaller ones are read with readinto into a reused buffer.
+    """
+    
+    ALGORITHMS = ('auto', 'xxh3', 'blake3', 'blake2b', 'md5')
+    STRATEGIES = ('auto', 'full', 'sampled')
+    
+    def __init__(self, algorithm: str = 'auto', strategy: str = 'auto',
+                 block_size: int = 1024 * 1024, stride: int = 16 * 1024 * 1024,
+                 full_threshold: int = 10 * 1024 * 1024,
+                 mmap_threshold: int = 64 * 1024 * 1024):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown hash algorithm: {algorithm}")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown hash strategy: {strategy}")
+        if block_size <= 0 or stride < block_size:
+            raise ValueError("block_size must be positive and no larger than stride")
+        self.algorithm = self._resolve(algorithm)
+        self.strategy = strategy
+        self.block_size = block_size
+        self.stride = stride
+        self.full_threshold = full_threshold
+        self.mmap_threshold = mmap_threshold
+        self._new = self._factory(self.algorithm)
+        self._local = threading.local()
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_new'], state['_local']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._new = self._factory(self.algorithm)
+        self._local = threading.local()
+    
+    @classmethod
+    def _resolve(cls, algorithm: str) -> str:
+        """Return the concrete algorithm for 'auto', checking optional ones are installed."""
+        candidates = ('xxh3', 'blake3', 'blake2b') if algorithm == 'auto' else (algorithm,)
+        for candidate in candidates:
+            try:
+                cls._factory(candidate)
+                return candidate
+            except ImportError:
+                if algorithm != 'auto':
+                    raise
+        return 'blake2b'
+    
+    @staticmethod
+    def _factory(algorithm: str) -> Callable[[], Any]:
+        """Return a constructor for hashers with update() and hexdigest()."""
+        if algorithm == 'xxh3':
+            import xxhash
+            return xxhash.xxh3_128
+        if algorithm == 'blake3':
+            from blake3 import blake3
+            return blake3
+        if algorithm == 'blake2b':
+            return lambda: hashlib.blake2b(digest_size=16)
+        return hashlib.md5
+    
+    def new(self):
+        """Return a fresh hasher for this algorithm."""
+        return self._new()
+    
+    def _buffer(self) -> memoryview:
+        # One read buffer per thread, reused for every file
+        view = getattr(self._local, 'view', None)
+        if view is None:
+            view = self._local.view = memoryview(bytearray(self.block_size))
+        return view
+    
+    def hash_file(self, file_path: Path, size: Optional[int] = None) -> str:
+        """Fingerprint a file's contents with the configured strategy."""
+        if size is None:
+            size = os.stat(file_path).st_size
+        sampled = self.strategy == 'sampled' or (
+            self.strategy == 'auto' and size > self.full_threshold)
+        
+        hasher = self._new()
+        if sampled:
+            hasher.update(size.to_bytes(8, 'little'))
+            offsets = list(range(0, max(size - self.block_size, 0), self.stride))
+            offsets.append(max(size - self.block_size, 0))
+        else:
+            offsets = None
+        
+        if size >= self.mmap_threshold:
+            with mapped_view(file_path) as mapped:
+                if mapped is not None:
+                    for offset in offsets if sampled else range(0, size, self.block_size):
+                        hasher.update(mapped[offset:offset + self.block_size])
+                    return hasher.hexdigest()
+        
+        view = self._buffer()
+        with open(file_path, 'rb', buffering=0) as f:
+            if not sampled:
+                while True:
+                    n = f.readinto(view)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+            else:
+                for offset in offsets:
+                    f.seek(offset)
+                    n = f.readinto(view)
+                    hasher.update(view[:n])
+        return hasher.hexdigest()
+
+class _SubstringAutomaton:
+    """Aho-Corasick automaton over a list of patterns.
+    
+    One pass over a text reports the index of every pattern occurring in it,
+    in time proportional to the text length plus the number of matches,
+    however many patterns there are.
+    """
+    
+    def __init__(self, patterns: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                child = self._goto[state].get(char)
+                if child is None:
+                    child = self._goto[state][char] = len(self._goto)
+                    self._goto.append({})
+                    outputs.append([])
+                state = child
+            outputs[state].append(index)
+        
+        # Breadth-first failure links; each state also reports its suffixes' patterns
+        self._fail = [0] * len(self._goto)
+        pending = list(self._goto[0].values())
+        for state in pending:
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                outputs[child].extend(outputs[self._fail[child]])
+                pending.append(child)
+        self._outputs = [tuple(output) for output in outputs]
+    
+    def find(self, text: str) -> Iterator[Tuple[int, ...]]:
+        """Yield the (non-empty) pattern indexes ending at each position of text."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        if outputs[0]:
+            yield outputs[0]
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                yield outputs[state]
+
+class ModuleMatcher:
+    """Indexed module lookup used to assign contexts to modules.
+    
+    Matching keeps the substring rules of the per-context loop it replaces:
+    a context belongs to the first module whose name appears in its path,
+    otherwise to the module scoring highest on name containment (3) plus
+    one per tag contained in the module name. Module names found in a path
+    or name come from one Aho-Corasick pass over it; tags are looked up in
+    an index of every module-name substring up to GRAM characters, and
+    longer tags only verify modules sharing all of their GRAM-grams. Work
+    per context therefore grows with the matches, not the module count.
+    `comparisons` counts the candidate modules examined.
+    """
+    
+    GRAM = 3
+    
+    def __init__(self, modules: Iterable[str]):
+        self.modules = sorted(set(modules))
+        self._lowered = [module.lower() for module in self.modules]
+        self._paths = _SubstringAutomaton(self.modules)
+        self._names = _SubstringAutomaton(self._lowered)
+        grams: Dict[str, set] = {}
+        for rank, module in enumerate(self._lowered):
+            for size in range(self.GRAM + 1):
+                for start in range(len(module) - size + 1):
+                    grams.setdefault(module[start:start + size], set()).add(rank)
+        self._grams = grams
+        self.comparisons = 0
+    
+    def module_for_path(self, path: str) -> Optional[str]:
+        """Return the first module whose name appears in a path."""
+        best = None
+        for ranks in self._paths.find(path):
+            self.comparisons += len(ranks)
+            first = min(ranks)
+            if best is None or first < best:
+                best = first
+        return self.modules[best] if best is not None else None
+    
+    def _modules_containing(self, tag: str) -> Iterable[int]:
+        """Ranks of the modules whose lowercased name contains a lowercased tag."""
+        if len(tag) <= self.GRAM:
+            return self._grams.get(tag, ())
+        
+        postings = sorted((self._grams.get(tag[start:start + self.GRAM], set())
+                           for start in range(len(tag) - self.GRAM + 1)), key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        self.comparisons += len(candidates)
+        return [rank for rank in candidates if tag in self._lowered[rank]]
+    
+    def best_module(self, name: str, tags: List[str]) -> Optional[str]:
+        """Score modules by name and tag containment and return the best match.
+        
+        A module scores 3 when its name appears in the context name and 1
+        for each tag that appears in the module name.
+        """
+        scores: Dict[int, int] = {}
+        for ranks in self._names.find(name.lower()):
+            self.comparisons += len(ranks)
+            for rank in ranks:
+                scores[rank] = 3
+        for tag in tags:
+            for rank in self._modules_containing(tag.lower()):
+                scores[rank] = scores.get(rank, 0) + 1
+        
+        if not scores:
+            return None
+        return self.modules[min(scores, key=lambda i: (-scores[i], i))]
+
+class ContextSummary:
+    """Summary statistics accumulated one context at a time."""
+    
+    def __init__(self):
+        self.total_items = 0
+        self.total_size = 0
+        self.data_types: Dict[str, int] = {}
+        self.module_assignments: Dict[str, int] = {}
+        self.research_performed = 0
+        self.folders = 0
+        self.files = 0
+    
+    def add(self, context: DataContext):
+        self.total_items += 1
+        if context.type == 'file':
+            self.files += 1
+            self.total_size += context.metadata.get('size_bytes', 0)
+            dt = context.metadata.get('data_type', 'unknown')
+            self.data_types[dt] = self.data_types.get(dt, 0) + 1
+        elif context.type == 'folder':
+            self.folders += 1
+        if context.module_assignment:
+            self.module_assignments[context.module_assignment] = \
+                self.module_assignments.get(context.module_assignment, 0) + 1
+        if context.web_research:
+            self.research_performed += 1
+    
+    def as_dict(self) -> Dict:
+        return {
+            'total_items': self.total_items,
+            'total_size_mb': self.total_size / (1024 * 1024),
+            'data_types': self.data_types,
+            'module_assignments': self.module_assignments,
+            'research_performed': self.research_performed,
+            'folders_processed': self.folders,
+            'files_processed': self.files
+        }
+
+class ContextExporter:
+    """Streaming writer for the agent-friendly exports of one scan.
+    
+    Contexts are written as they arrive: the full set to context.json,
+    context.yaml and context.jsonl, and each context to a newline-delimited
+    JSON and markdown shard for its top-level folder and, when assigned, its
+    module. Only counts and a few README examples are kept in memory, so peak
+    memory does not grow with the dataset. close() writes manifest.json, which
+    lists every shard so agents can load only the ones they need.
+    
+    Files are written to a staging directory next to output_dir and moved
+    into place by close(), manifest last; abort() discards them, so an
+    abandoned scan leaves the previous export intact.
+    """
+    
+    SAMPLES = 5
+    MAX_OPEN_SHARDS = 64
+    ROOT_SHARD = '_root'
+    
+    USAGE = """## Shards
+
+`manifest.json` lists one shard per top-level folder (`shards/folders/`) and
+per assigned module (`shards/modules/`), each as newline-delimited JSON with a
+markdown summary alongside, plus the number of contexts and data types it holds.
+
+## Usage
+
+### Accessing Context Data
+
+```python
+import json
+
+# Load only the shards you need
+with open('manifest.json', 'r') as f:
+    manifest = json.load(f)
+
+shard = next(s for s in manifest['shards'] if s['kind'] == 'module' and s['key'] == 'MODULE_NAME')
+with open(shard['jsonl'], 'r') as f:
+    module_contexts = [json.loads(line) for line in f]
+
+# Or load all contexts
+with open('context.json', 'r') as f:
+    contexts = json.load(f)
+```
+
+### Querying Context
+
+Use the `/engineering-data-context query` command to search contexts:
+
+```bash
+/engineering-data-context query --context "sensor data"
+```
+
+### Enhancing Context
+
+To add more research or update existing context:
+
+```bash
+/engineering-data-context enhance --folder . --research-topics "API documentation"
+```
+"""
+    
+    def __init__(self, output_dir: Path, folder_path: Path):
+        self.output_dir = output_dir
+        self.folder_path = folder_path
+        self.total = 0
+        self._root = os.path.abspath(folder_path)
+        self._shards: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._file_names: set = set()
+        self._open: 'OrderedDict[Tuple[str, str], Tuple[Any, Any]]' = OrderedDict()
+        self._by_type: Dict[str, Dict[str, Any]] = {}
+        self._by_module: Dict[str, Dict[str, Any]] = {}
+        self._research: List[Tuple[str, List[Tuple[str, str]]]] = []
+        
+        self._staging = output_dir.parent / f".{output_dir.name}.partial"
+        shutil.rmtree(self._staging, ignore_errors=True)
+        self._staging.mkdir(parents=True)
+        self._json = open(self._staging / 'context.json', 'w')
+        self._yaml = open(self._staging / 'context.yaml', 'w')
+        self._jsonl = open(self._staging / 'context.jsonl', 'w')
+        self._json.write('[')
+    
+    def add(self, context: DataContext):
+        """Write one context to the combined exports and its shards."""
+        record = asdict(context)
+        line = json.dumps(record)
+        
+        self._json.write(',\n' if self.total else '\n')
+        self._json.write(json.dumps(record, indent=2))
+        yaml.safe_dump([record], self._yaml, default_flow_style=False)
+        self._jsonl.write(line + '\n')
+        self.total += 1
+        
+        data_type = context.metadata.get('data_type', context.type)
+        self._sample(self._by_type, data_type, f"**{context.name}**: {context.description}")
+        
+        self._write_shard('folders', self._folder_key(context), context, line)
+        if context.module_assignment:
+            self._sample(self._by_module, context.module_assignment, context.name)
+            self._write_shard('modules', context.module_assignment, context, line)
+        
+        if context.web_research and len(self._research) < self.SAMPLES:
+            findings = [(query, str(result.get('summary', 'N/A')))
+                        for query, result in list(context.web_research.items())[:2]]
+            self._research.append((context.name, findings))
+    
+    def close(self) -> Dict[str, Any]:
+        """Finish all files and write the manifest and README; returns the manifest."""
+        self._json.write('\n]\n' if self.total else ']\n')
+        self._close_files()
+        
+        manifest = {
+            'generated': datetime.now().isoformat(),
+            'source': str(self.folder_path),
+            'total_items': self.total,
+            'files': {'json': 'context.json', 'yaml': 'context.yaml', 'jsonl': 'context.jsonl'},
+            'shards': [
+                {'kind': kind[:-1], 'key': key, 'count': shard['count'],
+                 'jsonl': shard['jsonl'], 'markdown': shard['markdown'],
+                 'data_types': shard['data_types']}
+                for (kind, key), shard in sorted(self._shards.items())
+            ]
+        }
+        with open(self._staging / 'manifest.json', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        self._write_readme()
+        
+        self._publish()
+        return manifest
+    
+    def abort(self):
+        """Close all files and discard the partial export."""
+        self._close_files()
+        shutil.rmtree(self._staging, ignore_errors=True)
+    
+    def _close_files(self):
+        for handle in (self._json, self._yaml, self._jsonl):
+            handle.close()
+        while self._open:
+            self._close_shard(next(iter(self._open)))
+    
+    def _publish(self):
+        """Move the staged export into output_dir, replacing the previous one."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Shards from an earlier export of this folder would otherwise linger
+        for stale in ('shards', 'modules'):
+            shutil.rmtree(self.output_dir / stale, ignore_errors=True)
+        if (self._staging / 'shards').exists():
+            os.replace(self._staging / 'shards', self.output_dir / 'shards')
+        for name in ('context.json', 'context.yaml', 'context.jsonl', 'README.md',
+                     'manifest.json'):
+            os.replace(self._staging / name, self.output_dir / name)
+        self._staging.rmdir()
+    
+    def _folder_key(self, context: DataContext) -> str:
+        """Shard key for a context: its top-level folder below the scanned folder."""
+        relative = os.path.relpath(os.path.abspath(context.path), self._root)
+        parts = relative.split(os.sep)
+        if relative == os.curdir or (len(parts) == 1 and context.type != 'folder'):
+            return self.ROOT_SHARD
+        return parts[0]
+    
+    def _sample(self, groups: Dict[str, Dict[str, Any]], key: str, entry: str):
+        group = groups.setdefault(key, {'count': 0, 'samples': []})
+        group['count'] += 1
+        if len(group['samples']) < self.SAMPLES:
+            group['samples'].append(entry)
+    
+    def _write_shard(self, kind: str, key: str, context: DataContext, line: str):
+        shard_id = (kind, key)
+        shard = self._shards.get(shard_id)
+        if shard is None:
+            stem = re.sub(r'[^\w.-]+', '_', key).strip('.') or 'shard'
+            name, n = stem, 1
+            while (kind, name.lower()) in self._file_names:
+                n += 1
+                name = f"{stem}_{n}"
+            self._file_names.add((kind, name.lower()))
+            shard = self._shards[shard_id] = {
+                'count': 0, 'data_types': {},
+                'jsonl': f"shards/{kind}/{name}.jsonl", 'markdown': f"shards/{kind}/{name}.md"
+            }
+        
+        handles = self._open.get(shard_id)
+        if handles is None:
+            if len(self._open) >= self.MAX_OPEN_SHARDS:
+                self._close_shard(next(iter(self._open)))
+            jsonl_path = self._staging / shard['jsonl']
+            jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            mode = 'a' if shard['count'] else 'w'
+            handles = (open(jsonl_path, mode), open(self._staging / shard['markdown'], mode))
+            if not shard['count']:
+                handles[1].write(f"# {kind[:-1].title()}: {key}\n\n")
+        self._open[shard_id] = handles
+        self._open.move_to_end(shard_id)
+        
+        data_type = context.metadata.get('data_type', context.type)
+        handles[0].write(line + '\n')
+        handles[1].write(f"- **{context.name}** ({data_type}): {context.description}\n")
+        shard['count'] += 1
+        shard['data_types'][data_type] = shard['data_types'].get(data_type, 0) + 1
+    
+    def _close_shard(self, shard_id: Tuple[str, str]):
+        for handle in self._open.pop(shard_id):
+            handle.close()
+    
+    def _write_readme(self):
+        lines = [
+            "# Engineering Data Context", "",
+            f"Generated: {datetime.now().isoformat()}", "",
+            "## Overview", "",
+            f"This directory contains context information for {self.total} data items.", "",
+            "## Summary by Type", ""
+        ]
+        
+        for data_type, group in sorted(self._by_type.items()):
+            lines.append(f"### {data_type.replace('_', ' ').title()}\n")
+            lines.extend(f"- {entry}" for entry in group['samples'])
+            if group['count'] > self.SAMPLES:
+                lines.append(f"- ... and {group['count'] - self.SAMPLES} more")
+            lines.append("")
+        
+        if self._by_module:
+            lines += ["## Module Assignments", ""]
+            for module, group in sorted(self._by_module.items()):
+                lines.append(f"### {module}\n")
+                lines.extend(f"- {entry}" for entry in group['samples'])
+                if group['count'] > self.SAMPLES:
+                    lines.append(f"- ... and {group['count'] - self.SAMPLES} more")
+                lines.append("")
+        
+        if self._research:
+            lines += ["## Research Findings", ""]
+            for name, findings in self._research:
+                lines.append(f"### {name}\n")
+                for query, summary in findings:
+                    lines.append(f"**Query**: {query}")
+                    lines.append(f"**Summary**: {summary}\n")
+        
+        lines.append(self.USAGE)
+        (self._staging / 'README.md').write_text('\n'.join(lines))
+
+class InotifyEventSource:
+    """Linux inotify watches over a folder tree, read through ctypes.
+    
+    Every non-hidden, non-symlinked directory gets a watch, and directories
+    created or moved in later are watched as they appear. poll() returns the
+    paths named by the events, or the root itself if the kernel queue
+    overflowed. Raises OSError when inotify is unavailable or the watch
+    limit is reached, so callers can fall back to PollingEventSource.
+    """
+    
+    IN_MODIFY = 0x2
+    IN_ATTRIB = 0x4
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+            | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+    _EVENT = struct.Struct('iIII')
+    
+    def __init__(self, root: Path):
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        import ctypes
+        import ctypes.util
+        
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._ctypes = ctypes
+        self.root = _absolute_path(root)
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: Dict[int, Path] = {}
+        try:
+            self._watch_tree(self.root)
+        except OSError:
+            self.close()
+            raise
+    
+    def _watch_tree(self, top: Path):
+        for directory, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames
+                           if not d.startswith('.') and not os.path.islink(os.path.join(directory, d))]
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+            if wd < 0:
+                errno = self._ctypes.get_errno()
+                raise OSError(errno, f"inotify_add_watch failed for {directory}: "
+                                     f"{os.strerror(errno)}")
+            self._watches[wd] = Path(directory)
+    
+    def poll(self, timeout: float) -> set:
+        """Wait up to timeout seconds and return the paths touched since the last poll."""
+        import select
+        
+        changed = set()
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return changed
+        
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                
+                if mask & self.IN_Q_OVERFLOW:
+                    changed.add(self.root)
+                    continue
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & self.IN_IGNORED:
+                    del self._watches[wd]
+                    continue
+                if mask & self.IN_DELETE_SELF:
+                    changed.add(directory)
+                    continue
+                
+                path = directory / os.fsdecode(name) if name else directory
+                changed.add(path)
+                if (mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO)
+                        and not path.name.startswith('.')):
+                    try:
+                        self._watch_tree(path)
+                    except OSError as e:
+                        print(f"   Warning: Could not watch {path}: {e}")
+        return changed
+    
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+class PollingEventSource:
+    """Portable fallback that diffs (size, mtime_ns) snapshots of a folder tree."""
+    
+    def __init__(self, root: Path, interval: float = 2.0):
+        self.root = _absolute_path(root)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+    
+    def _take_snapshot(self) -> Dict[str, Tuple[bool, int, int]]:
+        snapshot = {}
+        for directory, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames
+                           if not d.startswith('.') and not os.path.islink(os.path.join(directory, d))]
+            for name in dirnames + filenames:
+                path = os.path.join(directory, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                is_dir = name in dirnames
+                # A directory's mtime only tracks its own entries, which its parent already sees
+                snapshot[path] = (is_dir, 0 if is_dir else st.st_size,
+                                  0 if is_dir else st.st_mtime_ns)
+        return snapshot
+    
+    def poll(self, timeout: float) -> set:
+        """Sleep up to the polling interval and return paths that changed."""
+        time.sleep(min(timeout, self.interval))
+        current = self._take_snapshot()
+        previous, self._snapshot = self._snapshot, current
+        return {Path(p) for p in previous.keys() | current.keys()
+                if previous.get(p) != current.get(p)}
+    
+    def close(self):
+        pass
+
+class ContextWatcher:
+    """Keep a scanned folder's stored contexts fresh from filesystem events.
+    
+    Events are debounced: a batch is applied once no new event has arrived
+    for `debounce` seconds, or `max_delay` seconds after its first event so
+    a constantly busy tree still updates. Each batch goes through
+    EngineeringDataContextGenerator.refresh_paths.
+    """
+    
+    def __init__(self, generator: 'EngineeringDataContextGenerator', folder_path: Path,
+                 source=None, debounce: float = 1.0, max_delay: float = 10.0,
+                 use_modules: bool = False, poll_interval: float = 2.0):
+        self.generator = generator
+        self.folder_path = _absolute_path(folder_path)
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.use_modules = use_modules
+        if source is None:
+            try:
+                source = InotifyEventSource(self.folder_path)
+            except OSError as e:
+                print(f"   inotify unavailable ({e}); polling every {poll_interval}s")
+                source = PollingEventSource(self.folder_path, interval=poll_interval)
+        self.source = source
+        self.batches = 0
+    
+    def run(self, stop: Optional[threading.Event] = None, max_batches: Optional[int] = None):
+        """Apply event batches until stop is set, max_batches are applied or Ctrl+C."""
+        pending = set()
+        first = last = 0.0
+        try:
+            while not (stop and stop.is_set()):
+                changed = self.source.poll(self.debounce if pending else 1.0)
+                now = time.monotonic()
+                if changed:
+                    if not pending:
+                        first = now
+                    pending |= changed
+                    last = now
+                
+                if pending and (now - last >= self.debounce or now - first >= self.max_delay):
+                    self.apply(pending)
+                    pending = set()
+                    if max_batches is not None and self.batches >= max_batches:
+                        return
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if pending:
+                self.apply(pending)
+            self.source.close()
+    
+    def apply(self, paths: set) -> Dict[str, int]:
+        """Refresh the stored contexts for one batch of changed paths."""
+        result = self.generator.refresh_paths(self.folder_path, paths, use_modules=self.use_modules)
+        self.batches += 1
+        print(f"   {len(paths)} changed paths: {result['updated']} contexts updated, "
+              f"{result['folders']} folders re-aggregated, {result['removed']} removed")
+        return result
+
+# Process-local generator used by extraction workers, set by the pool initializer
+_worker_generator = None
+
+def _init_scan_worker(generator: 'EngineeringDataContextGenerator'):
+    """Pool initializer: keep one generator per worker process."""
+    global _worker_generator
+    _worker_generator = generator
+
+def _scan_worker_extract(path: str, stat_result: os.stat_result) -> Optional[DataContext]:
+    """Hash and extract schema for one file inside a worker process."""
+    return _worker_generator._extract_file_context(Path(path), stat_result)
+
 class EngineeringDataContextGenerator:
     """Main context generator for engineering data."""
     
-    def __init__(self, base_path: Path = None):
+    # Bytes read up front for CSV header/dtype sniffing and per sampled block
+    CSV_SNIFF_BYTES = 64 * 1024
+    CSV_ESTIMATE_SAMPLES = 16
+    # Files at least this large are sniffed and sampled through mapped_view
+    MMAP_THRESHOLD = 64 * 1024 * 1024
+    # Contexts enriched, committed and exported together, and seconds between progress events
+    BATCH_SIZE = 500
+    PROGRESS_INTERVAL = 2.0
+    # Strings pandas.read_csv treats as missing by default
+    CSV_NA_VALUES = frozenset([
+        '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+        '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+    ])
+    
+    def __init__(self, base_path: Path = None, row_count_mode: str = 'exact',
+                 row_estimate_threshold: int = 256 * 1024 * 1024,
+                 research_backend: Optional[Callable[[str], Optional[ResearchResult]]] = None,
+                 research_rate: float = 5.0, research_concurrency: int = 8,
+                 cache_ttl_days: float = 30.0, cache_max_entries: int = 10000,
+                 cache_policy: str = 'lru',
+                 fingerprinter: Optional[ContentFingerprinter] = None):
         self.base_path = base_path or Path.cwd()
+        # Swappable research backend (e.g. LocalResearchBackend for offline
+        # benchmarks); None means _web_research
+        self.research_backend = research_backend
+        self.research_rate = research_rate
+        self.research_concurrency = research_concurrency
+        # 'exact' counts every newline; 'estimate' samples CSVs above the threshold
+        self.row_count_mode = row_count_mode
+        self.row_estimate_threshold = row_estimate_threshold
+        self.fingerprinter = fingerprinter or ContentFingerprinter()
         self.context_dir = self.base_path / '.agent-os' / 'data-context'
         self.context_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.context_dir / 'context.db'
+        self.store = ContextStore(self.db_path)
+        self._cached_matcher: Optional[Tuple[Tuple, ModuleMatcher]] = None
+        self.research_cache = ResearchCache(self.store, ttl_days=cache_ttl_days,
+                                            max_entries=cache_max_entries, policy=cache_policy)
         self._init_database()
         
         # File type mappings for engineering data
@@ -111,12 +1895,39 @@ class EngineeringDataContextGenerator:
             '.dxf': 'cad_exchange'
         }
         
+        # Schema extractors by extension; each reads only headers/footers it needs
+        self.schema_extractors: Dict[str, Callable[[Path], Optional[Dict]]] = {
+            '.csv': self._extract_tabular_schema,
+            '.xlsx': self._extract_tabular_schema,
+            '.xls': self._extract_tabular_schema,
+            '.json': self._extract_json_schema,
+            '.yaml': self._extract_yaml_schema,
+            '.yml': self._extract_yaml_schema,
+            '.db': self._extract_database_schema,
+            '.sqlite': self._extract_database_schema,
+            '.parquet': self._extract_parquet_schema,
+            '.feather': self._extract_feather_schema,
+            '.h5': self._extract_hdf5_schema,
+            '.hdf5': self._extract_hdf5_schema,
+            '.nc': self._extract_netcdf_schema,
+            '.npy': self._extract_npy_schema,
+            '.npz': self._extract_npz_schema
+        }
+    
+    def register_schema_extractor(self, extension: str,
+                                  extractor: Callable[[Path], Optional[Dict]]):
+        """Register or replace the schema extractor for a file extension.
+        
+        Extractors must be picklable (e.g. module-level functions) when
+        scanning with workers > 1.
+        """
+        self.schema_extractors[extension.lower()] = extractor
+        
     def _init_database(self):
         """Initialize SQLite database for context storage."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        store = self.store
         
-        cursor.execute('''
+        store.execute('''
             CREATE TABLE IF NOT EXISTS data_context (
                 path TEXT PRIMARY KEY,
                 type TEXT,
@@ -129,119 +1940,561 @@ class EngineeringDataContextGenerator:
                 web_research TEXT,
                 last_updated TEXT,
                 tags TEXT,
-                module_assignment TEXT
+                module_assignment TEXT,
+                fingerprint TEXT
             )
         ''')
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS research_cache (
-                query_hash TEXT PRIMARY KEY,
-                query TEXT,
-                results TEXT,
-                timestamp TEXT
-            )
+        # Migrate databases created before incremental rescans existed
+        columns = {row[1] for row in store.query("PRAGMA table_info(data_context)")}
+        if 'fingerprint' not in columns:
+            store.execute("ALTER TABLE data_context ADD COLUMN fingerprint TEXT")
+        
+        self.research_cache.init_schema()
+        self._init_search_index()
+    
+    # Facet expressions shared by the indexes and query_context filters
+    DATA_TYPE_EXPR = "json_extract(metadata, '$.data_type')"
+    SIZE_EXPR = ("COALESCE(json_extract(metadata, '$.size_bytes'), "
+                 "json_extract(metadata, '$.total_size_bytes'))")
+    # bm25 column weights for name, description, tags
+    BM25_WEIGHTS = (10.0, 2.0, 5.0)
+    
+    def _init_search_index(self):
+        """Create the FTS5 index and facet indexes, kept in sync by triggers.
+        
+        The FTS table uses data_context as external content keyed by rowid.
+        Rows must be upserted rather than REPLACEd so the triggers see
+        updates; run rebuild_search_index() after a VACUUM, which may
+        renumber rowids.
+        """
+        store = self.store
+        
+        for column, expr in (('type', 'type'), ('module', 'module_assignment'),
+                             ('data_type', self.DATA_TYPE_EXPR), ('size', self.SIZE_EXPR)):
+            store.execute(f"CREATE INDEX IF NOT EXISTS idx_data_context_{column} "
+                          f"ON data_context({expr})")
+        
+        existing = store.query(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'data_context_fts'")
+        try:
+            store.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS data_context_fts USING fts5(
+                    name, description, tags,
+                    content='data_context', content_rowid='rowid',
+                    tokenize='unicode61'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: query_context falls back to LIKE scans
+            self.fts_enabled = False
+            return
+        self.fts_enabled = True
+        
+        store.execute('''
+            CREATE TRIGGER IF NOT EXISTS data_context_fts_insert AFTER INSERT ON data_context BEGIN
+                INSERT INTO data_context_fts(rowid, name, description, tags)
+                VALUES (new.rowid, new.name, new.description, new.tags);
+            END
+        ''')
+        store.execute('''
+            CREATE TRIGGER IF NOT EXISTS data_context_fts_delete AFTER DELETE ON data_context BEGIN
+                INSERT INTO data_context_fts(data_context_fts, rowid, name, description, tags)
+                VALUES ('delete', old.rowid, old.name, old.description, old.tags);
+            END
+        ''')
+        store.execute('''
+            CREATE TRIGGER IF NOT EXISTS data_context_fts_update
+            AFTER UPDATE OF name, description, tags ON data_context BEGIN
+                INSERT INTO data_context_fts(data_context_fts, rowid, name, description, tags)
+                VALUES ('delete', old.rowid, old.name, old.description, old.tags);
+                INSERT INTO data_context_fts(rowid, name, description, tags)
+                VALUES (new.rowid, new.name, new.description, new.tags);
+            END
         ''')
         
-        conn.commit()
-        conn.close()
+        if not existing:
+            self.rebuild_search_index()
+    
+    def rebuild_search_index(self):
+        """Rebuild the full-text index from data_context."""
+        if self.fts_enabled:
+            self.store.execute("INSERT INTO data_context_fts(data_context_fts) VALUES ('rebuild')")
     
     def generate_context(self, folder_path: Path, deep_research: bool = False,
-                        use_modules: bool = False) -> Dict[str, Any]:
-        """Generate context for a folder and its subfolders."""
+                        use_modules: bool = False, incremental: bool = False,
+                        workers: int = 1,
+                        on_progress: Optional[Callable[[ScanProgress], None]] = None
+                        ) -> Dict[str, Any]:
+        """Generate context for a folder and its subfolders.
+        
+        In incremental mode, files whose stat fingerprint (size, mtime_ns, inode)
+        and folders whose content hash match the stored context are not
+        re-extracted. Rows for paths that no longer exist are pruned either way.
+        With workers > 1, file hashing and schema extraction run in a process
+        pool while a single writer thread batches results into SQLite.
+        Paths are stored in absolute form, so relative folders such as "."
+        match the rows of earlier scans.
+        """
+        folder_path = _absolute_path(folder_path)
         
         print(f"🔍 Generating context for: {folder_path}")
         
         if not folder_path.exists():
             return {'error': f'Path does not exist: {folder_path}'}
         
-        contexts = []
+        run: Dict[str, Any] = {}
+        for _ in self._run_context(folder_path, deep_research, use_modules, incremental,
+                                   workers, on_progress, run):
+            pass
         
-        # Process folder recursively
-        for root, dirs, files in os.walk(folder_path):
-            root_path = Path(root)
+        return {
+            'status': 'success',
+            'contexts_created': run['summary']['total_items'],
+            'contexts_updated': run['updated'],
+            'contexts_unchanged': run['unchanged'],
+            'contexts_removed': run['removed'],
+            'summary': run['summary'],
+            'output_location': str(self.context_dir)
+        }
+    
+    def iter_context(self, folder_path: Path, deep_research: bool = False,
+                     use_modules: bool = False, incremental: bool = False,
+                     workers: int = 1,
+                     on_progress: Optional[Callable[[ScanProgress], None]] = None
+                     ) -> Iterator[DataContext]:
+        """Yield contexts for a folder as they are extracted, enriched and saved.
+        
+        Contexts are researched, assigned to modules, committed and exported
+        in micro-batches of BATCH_SIZE, so an interrupted scan keeps every
+        completed batch and memory does not grow with the number of files.
+        Exports are only replaced once the scan completes; a consumer that
+        stops early leaves the previous export in place. on_progress receives a ScanProgress every PROGRESS_INTERVAL seconds
+        and once more when the scan is done.
+        """
+        folder_path = _absolute_path(folder_path)
+        if not folder_path.exists():
+            raise FileNotFoundError(f'Path does not exist: {folder_path}')
+        yield from self._run_context(folder_path, deep_research, use_modules, incremental,
+                                     workers, on_progress, {})
+    
+    def _run_context(self, folder_path: Path, deep_research: bool, use_modules: bool,
+                     incremental: bool, workers: int,
+                     on_progress: Optional[Callable[[ScanProgress], None]],
+                     run: Dict[str, Any]) -> Iterator[DataContext]:
+        """Scan a folder in micro-batches, filling run with the final counts and summary."""
+        previous = self._load_fingerprints(folder_path)
+        scan_state = {'seen_paths': set(), 'unchanged': 0}
+        progress = ScanProgress(expected_items=len(previous) or None)
+        start = last_report = time.monotonic()
+        summary = ContextSummary()
+        matcher = self._module_matcher() if use_modules else None
+        research_stats: Dict[str, int] = {}
+        
+        # Incremental exports cover the whole folder, so they are written after the scan
+        exporter = None if incremental else ContextExporter(self._export_dir(folder_path),
+                                                           folder_path)
+        
+        def report(done: bool = False):
+            if on_progress:
+                progress.unchanged = scan_state['unchanged']
+                progress.elapsed = time.monotonic() - start
+                progress.done = done
+                on_progress(progress)
+        
+        def finish_batch(batch: List[DataContext]) -> Iterator[DataContext]:
+            if deep_research:
+                for key, value in self._perform_deep_research(batch, verbose=False).items():
+                    research_stats[key] = research_stats.get(key, 0) + value
+            if matcher is not None and matcher.modules:
+                for context in batch:
+                    context.module_assignment = (self._find_best_module(context, matcher)
+                                                 or context.module_assignment)
+            for context in batch:
+                writer.put(context)
+                summary.add(context)
+                if exporter:
+                    exporter.add(context)
+                yield context
+        
+        # Stream contexts from the walker/extractors to the writer as they arrive
+        writer = ContextWriter(self._save_contexts, batch_size=self.BATCH_SIZE)
+        writer.start()
+        try:
+            try:
+                batch = []
+                for context in self._iter_scan(folder_path, previous, incremental,
+                                               workers, scan_state):
+                    if context.type == 'folder':
+                        progress.folders += 1
+                    else:
+                        progress.files += 1
+                        progress.bytes_hashed += context.metadata.get('size_bytes', 0)
+                    
+                    batch.append(context)
+                    if len(batch) >= self.BATCH_SIZE:
+                        yield from finish_batch(batch)
+                        batch = []
+                    
+                    if time.monotonic() - last_report >= self.PROGRESS_INTERVAL:
+                        last_report = time.monotonic()
+                        report()
+                yield from finish_batch(batch)
+            finally:
+                writer.close()
+        except BaseException:
+            # Includes GeneratorExit when an iter_context consumer stops early
+            if exporter:
+                exporter.abort()
+            raise
+        
+        if research_stats:
+            print(f"   {research_stats['queries']} queries: {research_stats['fetched']} fetched, "
+                  f"{research_stats['cache_hits']} cached, {research_stats['coalesced']} "
+                  f"coalesced, {research_stats['failed']} failed")
+            # Persist hit counts and enforce TTL/size limits while exports are written
+            self.research_cache.compact_in_background()
+        if matcher is not None:
+            print(f"   Assigned {sum(summary.module_assignments.values())} of "
+                  f"{summary.total_items} contexts to {len(matcher.modules)} modules")
+        
+        # Drop rows for deleted paths
+        seen_paths = scan_state['seen_paths']
+        updated = summary.total_items
+        unchanged = scan_state['unchanged']
+        removed = self._prune_contexts([p for p in previous if p not in seen_paths])
+        
+        if incremental:
+            print(f"   {updated} updated, {unchanged} unchanged, {removed} removed")
+            # Summaries and exports cover the whole folder, not just the changes
+            summary = ContextSummary()
+            exporter = ContextExporter(self._export_dir(folder_path), folder_path)
+            for context in self._iter_contexts(folder_path):
+                summary.add(context)
+                exporter.add(context)
+        
+        # Save as agent-friendly formats
+        self._finish_exports(exporter)
+        self.research_cache.wait()
+        report(done=True)
+        
+        run.update(summary=summary.as_dict(), updated=updated, unchanged=unchanged,
+                   removed=removed)
+    
+    def _iter_scan(self, folder_path: Path, previous: Dict[str, Optional[str]],
+                   incremental: bool, workers: int, scan_state: Dict) -> Iterator[DataContext]:
+        """Yield folder and file contexts for a tree, extracting files in a bounded pipeline.
+        
+        The walker streams file paths to a process pool, keeping at most a few
+        tasks per worker in flight so memory stays bounded on huge trees.
+        Updates scan_state['seen_paths'] and scan_state['unchanged'] as it goes.
+        """
+        seen_paths = scan_state['seen_paths']
+        executor = None
+        in_flight = set()
+        
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers,
+                                           initializer=_init_scan_worker,
+                                           initargs=(self,))
+        max_in_flight = max(1, workers) * 4
+        
+        def drain(futures):
+            for future in futures:
+                try:
+                    context = future.result()
+                except Exception as e:
+                    print(f"   Warning: Could not process file: {e}")
+                    continue
+                if context:
+                    yield context
+        
+        try:
+            # Process folder recursively in a single bottom-up pass
+            for kind, path, info in self._scan_tree(folder_path):
+                if kind == 'folder':
+                    folder_context = self._create_folder_context(path, info)
+                    seen_paths.add(folder_context.path)
+                    if incremental and previous.get(folder_context.path) == folder_context.fingerprint:
+                        scan_state['unchanged'] += 1
+                    else:
+                        yield folder_context
+                    continue
+                
+                if path.suffix.lower() not in self.engineering_extensions:
+                    continue
+                
+                seen_paths.add(str(path))
+                
+                if incremental and previous.get(str(path)) == self._stat_fingerprint(info):
+                    scan_state['unchanged'] += 1
+                    continue
+                
+                if executor is None:
+                    file_context = self._extract_file_context(path, info)
+                    if file_context:
+                        yield file_context
+                    continue
+                
+                in_flight.add(executor.submit(_scan_worker_extract, str(path), info))
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    yield from drain(done)
             
-            # Create folder context
-            folder_context = self._create_folder_context(root_path)
-            contexts.append(folder_context)
+            yield from drain(as_completed(in_flight))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _extract_file_context(self, file_path: Path,
+                              stat_result: os.stat_result) -> Optional[DataContext]:
+        """Create a file context, reporting unreadable files instead of aborting the scan."""
+        try:
+            return self._create_file_context(file_path, stat_result)
+        except OSError as e:
+            print(f"   Warning: Could not read {file_path}: {e}")
+            return None
+    
+    def _stat_fingerprint(self, stat_result: os.stat_result) -> str:
+        """Build a cheap change fingerprint from file metadata."""
+        return f"{stat_result.st_size}:{stat_result.st_mtime_ns}:{stat_result.st_ino}"
+    
+    def _scope_clause(self, folder_path: Path) -> Tuple[str, Tuple[str, str]]:
+        """Build a WHERE clause matching a folder and everything beneath it."""
+        root = str(_absolute_path(folder_path))
+        prefix = root.rstrip(os.sep) + os.sep
+        escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return "(path = ? OR path LIKE ? ESCAPE '\\')", (root, f"{escaped}%")
+    
+    def _load_fingerprints(self, folder_path: Path) -> Dict[str, Optional[str]]:
+        """Load stored fingerprints for every context under a folder."""
+        clause, params = self._scope_clause(folder_path)
+        return dict(self.store.query(
+            f"SELECT path, fingerprint FROM data_context WHERE {clause}", params))
+    
+    def _prune_contexts(self, paths: List[str]) -> int:
+        """Delete stored contexts for paths that no longer exist."""
+        return self.store.executemany("DELETE FROM data_context WHERE path = ?",
+                                      ((p,) for p in paths))
+    
+    def _prune_tree(self, path: Path) -> int:
+        """Delete stored contexts for a path and everything beneath it."""
+        clause, params = self._scope_clause(path)
+        return self.store.execute(f"DELETE FROM data_context WHERE {clause}", params).rowcount
+    
+    def refresh_paths(self, folder_path: Path, paths: Iterable[Path],
+                      use_modules: bool = False) -> Dict[str, int]:
+        """Update stored contexts for changed paths under a scanned folder.
+        
+        Changed files are re-extracted, deleted paths are pruned along with
+        everything beneath them and new directories are scanned. Every
+        ancestor folder up to folder_path is then re-aggregated deepest first
+        from its own listing and its children's stored hashes, so sizes and
+        Merkle hashes match a full rescan without walking the rest of the tree.
+        """
+        root = _absolute_path(folder_path)
+        contexts: List[DataContext] = []
+        dirty = set()
+        removed = 0
+        
+        for path in sorted({_absolute_path(p) for p in paths}):
+            if path != root and root not in path.parents:
+                continue
+            below = path.relative_to(root).parts
+            # Scans never descend into hidden or symlinked directories
+            if any(part.startswith('.') for part in below[:-1]):
+                continue
+            if path != root:
+                dirty.add(path.parent)
             
-            # Process files in folder
-            for file_name in files:
-                file_path = root_path / file_name
-                file_context = self._create_file_context(file_path)
-                
-                if file_context:
-                    contexts.append(file_context)
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                removed += self._prune_tree(path)
+                continue
             
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-        
-        # Perform deep research if requested
-        if deep_research:
-            print("\n🌐 Performing deep web research...")
-            contexts = self._perform_deep_research(contexts)
+            if stat.S_ISDIR(stat_result.st_mode):
+                if path == root or not (path.name.startswith('.') or path.is_symlink()):
+                    previous = self._load_fingerprints(path)
+                    scan_state = {'seen_paths': set(), 'unchanged': 0}
+                    contexts.extend(self._iter_scan(path, previous, True, 1, scan_state))
+                    removed += self._prune_contexts(
+                        [p for p in previous if p not in scan_state['seen_paths']])
+            elif (stat.S_ISREG(stat_result.st_mode)
+                  and path.suffix.lower() in self.engineering_extensions):
+                context = self._extract_file_context(path, stat_result)
+                if context:
+                    contexts.append(context)
+        
+        # Re-aggregate touched folders and their ancestors, children before parents
+        folders = set()
+        for folder in dirty:
+            while folder not in folders:
+                folders.add(folder)
+                if folder == root:
+                    break
+                folder = folder.parent
+        
+        fresh = {c.path: c for c in contexts if c.type == 'folder'}
+        refreshed = 0
+        for folder in sorted(folders, key=lambda p: len(p.parts), reverse=True):
+            if not folder.is_dir():
+                continue
+            context = self._refresh_folder(folder, fresh)
+            fresh[context.path] = context
+            contexts.append(context)
+            refreshed += 1
         
-        # Assign to modules if requested
         if use_modules:
-            print("\n📦 Assigning contexts to modules...")
-            contexts = self._assign_to_modules(contexts)
+            matcher = self._module_matcher()
+            for context in contexts:
+                context.module_assignment = (self._find_best_module(context, matcher)
+                                             or context.module_assignment)
         
-        # Save contexts to database
         self._save_contexts(contexts)
-        
-        # Generate summary report
-        summary = self._generate_summary(contexts)
-        
-        # Save as agent-friendly formats
-        self._save_agent_formats(contexts, folder_path)
-        
-        return {
-            'status': 'success',
-            'contexts_created': len(contexts),
-            'summary': summary,
-            'output_location': str(self.context_dir)
-        }
+        return {'updated': len(contexts) - refreshed, 'folders': refreshed, 'removed': removed}
+    
+    def _refresh_folder(self, folder: Path, fresh: Dict[str, DataContext]) -> DataContext:
+        """Rebuild one folder's context from its listing and its children's contexts."""
+        state = _FolderScanState(path=folder, parent=None)
+        _, subdirs = self._read_folder(state)
+        
+        for name in subdirs:
+            child_path = str(folder / name)
+            child = fresh.get(child_path)
+            if child is None:
+                rows = self.store.query(
+                    "SELECT content_hash, json_extract(metadata, '$.total_size_bytes') "
+                    "FROM data_context WHERE path = ? AND type = 'folder'", (child_path,))
+                if rows:
+                    content_hash, size = rows[0]
+                    state.child_hashes.append((name, content_hash))
+                    state.total_size_bytes += size or 0
+                    continue
+                # Never scanned (e.g. created between events): scan it now
+                scanned = list(self._iter_scan(folder / name, {}, False, 1,
+                                               {'seen_paths': set(), 'unchanged': 0}))
+                self._save_contexts(scanned)
+                child = next(c for c in reversed(scanned) if c.path == child_path)
+                fresh[child_path] = child
+            state.child_hashes.append((name, child.content_hash))
+            state.total_size_bytes += child.metadata['total_size_bytes']
+        
+        return self._create_folder_context(folder, self._aggregate_folder(state))
+    
+    def _scan_tree(self, folder_path: Path) -> Iterator[Tuple[str, Path, Any]]:
+        """Walk a folder tree once, yielding files and rolled-up folders.
+        
+        Every directory is listed exactly once with os.scandir and each
+        DirEntry's stat is reused. Files are yielded as ('file', path, stat)
+        while their directory is listed; folders are yielded as
+        ('folder', path, FolderAggregate) once all of their subfolders are
+        done, so sizes and Merkle-style hashes roll up to the parents.
+        Hidden subdirectories are skipped.
+        """
+        stack = [_FolderScanState(path=folder_path, parent=None)]
+        
+        while stack:
+            state = stack.pop()
+            files, subdirs = self._read_folder(state)
+            
+            for name, stat_result in files:
+                yield 'file', state.path / name, stat_result
+            
+            state.pending_children = len(subdirs)
+            for name in sorted(subdirs, reverse=True):
+                stack.append(_FolderScanState(path=state.path / name, parent=state))
+            
+            # Emit every folder whose subtree is now complete, rolling up to parents
+            while state is not None and state.pending_children == 0:
+                aggregate = self._aggregate_folder(state)
+                yield 'folder', state.path, aggregate
+                
+                parent = state.parent
+                if parent is not None:
+                    parent.pending_children -= 1
+                    parent.total_size_bytes += state.total_size_bytes
+                    parent.child_hashes.append((state.path.name, aggregate.content_hash))
+                state = parent
     
-    def _create_folder_context(self, folder_path: Path) -> DataContext:
-        """Create context for a folder."""
+    def _read_folder(self, state: _FolderScanState) -> Tuple[List[Tuple[str, os.stat_result]],
+                                                             List[str]]:
+        """List a folder once, recording its direct entries on state.
         
-        # Calculate folder statistics
-        file_count = len(list(folder_path.glob('*')))
-        total_size = sum(f.stat().st_size for f in folder_path.rglob('*') if f.is_file())
+        Returns the (name, stat) of its files and the subdirectories a scan
+        descends into (hidden and symlinked directories are not).
+        """
+        files = []
+        subdirs = []
         
-        # Identify data types in folder
-        data_types = set()
-        for file in folder_path.glob('*'):
-            if file.is_file():
-                ext = file.suffix.lower()
-                if ext in self.engineering_extensions:
-                    data_types.add(self.engineering_extensions[ext])
+        try:
+            with os.scandir(state.path) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"   Warning: Could not list {state.path}: {e}")
+            entries = []
+        
+        for entry in entries:
+            state.item_count += 1
+            try:
+                if entry.is_dir():
+                    state.subdirectories.append(entry.name)
+                    if not entry.name.startswith('.') and not entry.is_symlink():
+                        subdirs.append(entry.name)
+                    continue
+                if not entry.is_file():
+                    continue
+                stat_result = entry.stat()
+            except OSError:
+                continue
+            
+            state.total_size_bytes += stat_result.st_size
+            state.file_records.append((entry.name, stat_result.st_size, stat_result.st_mtime_ns))
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext in self.engineering_extensions:
+                state.data_types.add(self.engineering_extensions[ext])
+            files.append((entry.name, stat_result))
+        
+        return files, subdirs
+    
+    def _aggregate_folder(self, state: _FolderScanState) -> FolderAggregate:
+        """Build a folder's aggregate once its files and child folders are recorded."""
+        return FolderAggregate(
+            item_count=state.item_count,
+            total_size_bytes=state.total_size_bytes,
+            data_types=sorted(state.data_types),
+            subdirectories=state.subdirectories,
+            content_hash=self._generate_folder_hash(state.file_records, state.child_hashes)
+        )
+    
+    def _create_folder_context(self, folder_path: Path, aggregate: FolderAggregate) -> DataContext:
+        """Create context for a folder from its rolled-up aggregate."""
         
         metadata = {
-            'file_count': file_count,
-            'total_size_bytes': total_size,
-            'data_types': list(data_types),
-            'subdirectories': [d.name for d in folder_path.iterdir() if d.is_dir()]
+            'file_count': aggregate.item_count,
+            'total_size_bytes': aggregate.total_size_bytes,
+            'data_types': aggregate.data_types,
+            'subdirectories': aggregate.subdirectories
         }
         
-        # Generate content hash for folder
-        content_hash = self._generate_folder_hash(folder_path)
-        
         return DataContext(
             path=str(folder_path),
             type='folder',
             name=folder_path.name,
-            description=f"Folder containing {file_count} items",
+            description=f"Folder containing {aggregate.item_count} items",
             metadata=metadata,
-            content_hash=content_hash,
+            content_hash=aggregate.content_hash,
             data_schema=None,
             related_docs=[],
             web_research=None,
             last_updated=datetime.now().isoformat(),
-            tags=list(data_types),
-            module_assignment=None
+            tags=list(aggregate.data_types),
+            module_assignment=None,
+            fingerprint=aggregate.content_hash
         )
     
-    def _create_file_context(self, file_path: Path) -> Optional[DataContext]:
+    def _create_file_context(self, file_path: Path,
+                             stat_result: Optional[os.stat_result] = None) -> Optional[DataContext]:
         """Create context for a data file."""
         
         ext = file_path.suffix.lower()
@@ -251,17 +2504,18 @@ class EngineeringDataContextGenerator:
             return None
         
         data_type = self.engineering_extensions[ext]
+        stat_result = stat_result or file_path.stat()
         
         # Extract metadata
         metadata = {
-            'size_bytes': file_path.stat().st_size,
+            'size_bytes': stat_result.st_size,
             'extension': ext,
             'data_type': data_type,
-            'modified': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+            'modified': datetime.fromtimestamp(stat_result.st_mtime).isoformat()
         }
         
         # Generate content hash
-        content_hash = self._generate_file_hash(file_path)
+        content_hash = self._generate_file_hash(file_path, stat_result.st_size)
         
         # Extract data schema if possible
         data_schema = self._extract_data_schema(file_path, data_type)
@@ -285,51 +2539,41 @@ class EngineeringDataContextGenerator:
             web_research=None,
             last_updated=datetime.now().isoformat(),
             tags=tags,
-            module_assignment=None
+            module_assignment=None,
+            fingerprint=self._stat_fingerprint(stat_result)
         )
     
-    def _generate_folder_hash(self, folder_path: Path) -> str:
-        """Generate hash for folder contents."""
-        hasher = hashlib.md5()
+    def _generate_folder_hash(self, file_records: List[Tuple[str, int, int]],
+                              child_hashes: List[Tuple[str, str]]) -> str:
+        """Generate a Merkle-style hash from a folder's files and child folder hashes."""
+        hasher = self.fingerprinter.new()
         
-        for file in sorted(folder_path.rglob('*')):
-            if file.is_file():
-                hasher.update(file.name.encode())
-                hasher.update(str(file.stat().st_size).encode())
-                hasher.update(str(file.stat().st_mtime).encode())
+        for name, size, mtime_ns in sorted(file_records):
+            hasher.update(name.encode())
+            hasher.update(str(size).encode())
+            hasher.update(str(mtime_ns).encode())
+        
+        for name, child_hash in sorted(child_hashes):
+            hasher.update(name.encode())
+            hasher.update(child_hash.encode())
         
         return hasher.hexdigest()
     
-    def _generate_file_hash(self, file_path: Path) -> str:
+    def _generate_file_hash(self, file_path: Path, size: Optional[int] = None) -> str:
         """Generate hash for file contents."""
-        hasher = hashlib.md5()
-        
-        # For large files, hash only first and last chunks
-        if file_path.stat().st_size > 10 * 1024 * 1024:  # 10MB
-            with open(file_path, 'rb') as f:
-                hasher.update(f.read(1024 * 1024))  # First 1MB
-                f.seek(-1024 * 1024, 2)  # Last 1MB
-                hasher.update(f.read())
-        else:
-            with open(file_path, 'rb') as f:
-                hasher.update(f.read())
-        
-        return hasher.hexdigest()
+        return self.fingerprinter.hash_file(file_path, size)
     
     def _extract_data_schema(self, file_path: Path, data_type: str) -> Optional[Dict]:
         """Extract schema information from data files."""
         
         schema = None
+        extractor = self.schema_extractors.get(file_path.suffix.lower())
+        
+        if extractor is None:
+            return None
         
         try:
-            if data_type in ['tabular_data', 'spreadsheet']:
-                schema = self._extract_tabular_schema(file_path)
-            elif data_type == 'structured_data' and file_path.suffix == '.json':
-                schema = self._extract_json_schema(file_path)
-            elif data_type == 'configuration':
-                schema = self._extract_yaml_schema(file_path)
-            elif data_type == 'database':
-                schema = self._extract_database_schema(file_path)
+            schema = extractor(file_path)
         except Exception as e:
             print(f"   Warning: Could not extract schema from {file_path.name}: {e}")
         
@@ -337,70 +2581,188 @@ class EngineeringDataContextGenerator:
     
     def _extract_tabular_schema(self, file_path: Path) -> Dict:
         """Extract schema from CSV/Excel files."""
+        if file_path.suffix.lower() == '.csv':
+            return self._extract_csv_schema(file_path)
+        
         schema = {'columns': [], 'row_count': 0}
         
         try:
             import pandas as pd
             
-            if file_path.suffix == '.csv':
-                df = pd.read_csv(file_path, nrows=5)
-            else:
-                df = pd.read_excel(file_path, nrows=5)
-            
+            df = pd.read_excel(file_path, nrows=5)
             schema['columns'] = list(df.columns)
             schema['dtypes'] = {col: str(dtype) for col, dtype in df.dtypes.items()}
-            
-            # Get full row count
-            if file_path.suffix == '.csv':
-                with open(file_path, 'r') as f:
-                    schema['row_count'] = sum(1 for _ in f) - 1
-            
         except ImportError:
-            # Fallback for CSV without pandas
-            if file_path.suffix == '.csv':
-                with open(file_path, 'r') as f:
-                    header = f.readline().strip()
-                    schema['columns'] = header.split(',')
-                    schema['row_count'] = sum(1 for _ in f)
+            pass
         
         return schema
     
-    def _extract_json_schema(self, file_path: Path) -> Dict:
-        """Extract schema from JSON files."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+    def _extract_csv_schema(self, file_path: Path) -> Dict:
+        """Extract CSV columns, dtypes and row count in one buffered binary pass.
+        
+        The header and the first rows are sniffed from the leading block, then
+        newlines are counted from the same handle. In 'estimate' mode, files
+        above the threshold are sampled at evenly spaced offsets instead.
+        """
+        size = file_path.stat().st_size
+        estimate = self.row_count_mode == 'estimate' and size > self.row_estimate_threshold
+        
+        if estimate and size >= self.MMAP_THRESHOLD:
+            # Sniff and sample straight from the page cache
+            with mapped_view(file_path) as mapped:
+                if mapped is not None:
+                    schema = self._sniff_csv_header(mapped[:self.CSV_SNIFF_BYTES])
+                    line_count = self._estimate_line_count(mapped, size)
+                    if line_count is not None:
+                        schema['row_count'] = max(line_count - 1, 0)
+                        schema['row_count_estimated'] = True
+                        return schema
+        
+        with open(file_path, 'rb') as f:
+            head = f.read(self.CSV_SNIFF_BYTES)
+            schema = self._sniff_csv_header(head)
+            
+            if estimate:
+                line_count = self._estimate_line_count(f, size)
+                if line_count is not None:
+                    schema['row_count'] = max(line_count - 1, 0)
+                    schema['row_count_estimated'] = True
+                    return schema
+                f.seek(len(head))
+            
+            newlines, last_byte = self._count_newlines(f)
+            newlines += head.count(b'\n')
+            if last_byte is None and head:
+                last_byte = head[-1]
+        
+        # Match line iteration: a final line without a newline still counts
+        line_count = newlines + (1 if last_byte is not None and last_byte != ord('\n') else 0)
+        schema['row_count'] = max(line_count - 1, 0)
+        return schema
+    
+    def _sniff_csv_header(self, head) -> Dict:
+        """Infer delimiter, columns and dtypes from the leading block.
+        
+        pandas reads the same 5 rows it always has when it is installed; the
+        csv module fallback reports the dtype names pandas would.
+        """
+        text = str(head, 'utf-8-sig', 'replace')
+        if len(head) == self.CSV_SNIFF_BYTES and '\n' in text:
+            text = text[:text.rindex('\n')]  # drop a partial trailing line
+        
+        try:
+            delimiter = csv.Sniffer().sniff(text.split('\n', 1)[0], delimiters=',;\t|').delimiter
+        except csv.Error:
+            delimiter = ','
+        
+        try:
+            import pandas as pd
+            
+            df = pd.read_csv(io.StringIO(text), sep=delimiter, nrows=5)
+            return {
+                'columns': [str(c) for c in df.columns],
+                'row_count': 0,
+                'dtypes': {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+                'delimiter': delimiter
+            }
+        except (ImportError, ValueError):
+            # Without pandas, or for a block it cannot parse, use the csv module
+            pass
+        
+        rows = []
+        for row in csv.reader(io.StringIO(text), delimiter=delimiter):
+            rows.append(row)
+            if len(rows) > 5:  # header plus the same 5 rows pandas reads
+                break
+        
+        if not rows:
+            return {'columns': [], 'row_count': 0}
+        
+        columns = rows[0]
+        dtypes = {}
+        for index, column in enumerate(columns):
+            # Short rows are padded with missing values, as pandas does
+            values = [row[index].strip() if index < len(row) else '' for row in rows[1:]]
+            dtypes[column] = self._infer_csv_dtype(values)
+        
+        return {'columns': columns, 'row_count': 0, 'dtypes': dtypes, 'delimiter': delimiter}
+    
+    def _infer_csv_dtype(self, values: List[str]) -> str:
+        """Map sampled CSV values to the dtype name pandas would report."""
+        present = [v for v in values if v not in self.CSV_NA_VALUES]
+        if not present:
+            return 'float64'
+        if all(v in ('True', 'False', 'true', 'false', 'TRUE', 'FALSE') for v in present):
+            return 'bool' if len(present) == len(values) else 'object'
+        
+        kinds = set()
+        for value in present:
+            if '_' in value:
+                return 'object'  # Python accepts digit separators, pandas does not
+            try:
+                int(value)
+                kinds.add('int')
+                continue
+            except ValueError:
+                pass
+            try:
+                float(value)
+                kinds.add('float')
+            except ValueError:
+                return 'object'
+        
+        if kinds == {'int'} and len(present) == len(values):
+            return 'int64'
+        return 'float64'
+    
+    def _count_newlines(self, f) -> Tuple[int, Optional[int]]:
+        """Count newlines from the current position using a reused 1 MB buffer."""
+        buffer = bytearray(1024 * 1024)
+        count = 0
+        last_byte = None
+        
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            count += buffer.count(b'\n', 0, n)
+            last_byte = buffer[n - 1]
         
-        return self._infer_json_schema(data)
+        return count, last_byte
     
-    def _infer_json_schema(self, data: Any, depth: int = 0) -> Dict:
-        """Recursively infer JSON schema."""
-        if depth > 3:  # Limit recursion depth
-            return {'type': 'unknown'}
+    def _estimate_line_count(self, source, size: int) -> Optional[int]:
+        """Extrapolate a line count from newline density in evenly spaced samples.
+        
+        source is a binary file or an mmap view of one.
+        """
+        samples = self.CSV_ESTIMATE_SAMPLES
+        stride = max((size - self.CSV_SNIFF_BYTES) // max(samples - 1, 1), 1)
+        sampled_bytes = 0
+        newlines = 0
+        
+        for i in range(samples):
+            offset = min(i * stride, max(size - self.CSV_SNIFF_BYTES, 0))
+            if isinstance(source, memoryview):
+                block = source[offset:offset + self.CSV_SNIFF_BYTES].tobytes()
+            else:
+                source.seek(offset)
+                block = source.read(self.CSV_SNIFF_BYTES)
+            sampled_bytes += len(block)
+            newlines += block.count(b'\n')
         
-        if isinstance(data, dict):
-            properties = {}
-            for key, value in list(data.items())[:10]:  # Sample first 10 keys
-                properties[key] = self._infer_json_schema(value, depth + 1)
-            return {'type': 'object', 'properties': properties}
-        elif isinstance(data, list):
-            if data:
-                return {'type': 'array', 'items': self._infer_json_schema(data[0], depth + 1)}
-            return {'type': 'array'}
-        elif isinstance(data, str):
-            return {'type': 'string'}
-        elif isinstance(data, (int, float)):
-            return {'type': 'number'}
-        elif isinstance(data, bool):
-            return {'type': 'boolean'}
-        else:
-            return {'type': 'null'}
+        if not newlines:
+            return None
+        return round(size * newlines / sampled_bytes)
+    
+    def _extract_json_schema(self, file_path: Path) -> Dict:
+        """Extract schema from JSON files."""
+        with open(file_path, 'r') as f:
+            return StreamingSchemaSampler(f).sample_json()
     
     def _extract_yaml_schema(self, file_path: Path) -> Dict:
         """Extract schema from YAML files."""
         with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
-        
-        return self._infer_json_schema(data)
+            return StreamingSchemaSampler(f).sample_yaml()
     
     def _extract_database_schema(self, file_path: Path) -> Dict:
         """Extract schema from database files."""
@@ -430,6 +2792,229 @@ class EngineeringDataContextGenerator:
         
         return schema
     
+    # Parquet physical types and the converted types worth surfacing
+    PARQUET_TYPES = ['boolean', 'int32', 'int64', 'int96', 'float', 'double',
+                     'byte_array', 'fixed_len_byte_array']
+    PARQUET_CONVERTED_TYPES = {0: 'string', 5: 'decimal', 6: 'date', 9: 'timestamp_millis',
+                               10: 'timestamp_micros', 19: 'json'}
+    
+    def _extract_parquet_schema(self, file_path: Path) -> Dict:
+        """Extract columns and row counts from the Parquet footer only."""
+        with open(file_path, 'rb') as f:
+            f.seek(-8, 2)
+            footer_length, magic = struct.unpack('<I4s', f.read(8))
+            if magic != b'PAR1':
+                raise ValueError('Not a Parquet file')
+            f.seek(-8 - footer_length, 2)
+            metadata = _ThriftCompactReader(f.read(footer_length)).read_struct()
+        
+        columns = []
+        dtypes = {}
+        # Schema is a depth-first flattening: (element, children left) frames
+        parents: List[List] = []
+        for element in metadata.get(2, [])[1:]:
+            name = element.get(4, b'').decode('utf-8', errors='replace')
+            path = '.'.join([frame[0] for frame in parents] + [name])
+            
+            if element.get(5):
+                parents.append([name, element[5]])
+                continue
+            
+            columns.append(path)
+            physical = element.get(1)
+            converted = self.PARQUET_CONVERTED_TYPES.get(element.get(6))
+            dtypes[path] = converted or (self.PARQUET_TYPES[physical]
+                                         if physical is not None and physical < len(self.PARQUET_TYPES)
+                                         else 'unknown')
+            
+            # Close finished groups
+            while parents:
+                parents[-1][1] -= 1
+                if parents[-1][1]:
+                    break
+                parents.pop()
+        
+        schema = {
+            'columns': columns,
+            'dtypes': dtypes,
+            'row_count': metadata.get(3, 0),
+            'row_groups': len(metadata.get(4, []))
+        }
+        if 6 in metadata:
+            schema['created_by'] = metadata[6].decode('utf-8', errors='replace')
+        return schema
+    
+    def _extract_feather_schema(self, file_path: Path) -> Dict:
+        """Extract the Arrow schema of a Feather file from its footer."""
+        with open(file_path, 'rb') as f:
+            magic = f.read(6)
+        
+        schema = {'format': 'feather', 'version': 2 if magic == b'ARROW1' else 1}
+        
+        try:
+            import pyarrow as pa
+            
+            with pa.memory_map(str(file_path), 'r') as source:
+                reader = pa.ipc.open_file(source)
+                schema['columns'] = reader.schema.names
+                schema['dtypes'] = {f.name: str(f.type) for f in reader.schema}
+                schema['record_batches'] = reader.num_record_batches
+        except ImportError:
+            pass
+        
+        return schema
+    
+    def _extract_hdf5_schema(self, file_path: Path) -> Dict:
+        """Extract the HDF5 group/dataset tree without reading any dataset values."""
+        with open(file_path, 'rb') as f:
+            signature = f.read(8)
+        if signature != b'\x89HDF\r\n\x1a\n':
+            raise ValueError('Not an HDF5 file')
+        
+        schema = {'format': 'hdf5'}
+        
+        try:
+            import h5py
+            
+            datasets = {}
+            groups = []
+            
+            def visit(name, obj):
+                if isinstance(obj, h5py.Dataset):
+                    if len(datasets) < 200:
+                        datasets[name] = {'shape': list(obj.shape), 'dtype': str(obj.dtype)}
+                else:
+                    groups.append(name)
+            
+            with h5py.File(file_path, 'r') as h5:
+                h5.visititems(visit)
+            
+            schema['groups'] = groups[:200]
+            schema['datasets'] = datasets
+        except ImportError:
+            pass
+        
+        return schema
+    
+    # Classic/64-bit NetCDF type codes and their sizes
+    NETCDF_TYPES = {1: ('byte', 1), 2: ('char', 1), 3: ('short', 2), 4: ('int', 4),
+                    5: ('float', 4), 6: ('double', 8), 7: ('ubyte', 1), 8: ('ushort', 2),
+                    9: ('uint', 4), 10: ('int64', 8), 11: ('uint64', 8)}
+    
+    def _extract_netcdf_schema(self, file_path: Path) -> Dict:
+        """Extract dimensions and variables from a NetCDF header.
+        
+        Classic and 64-bit-offset headers are parsed directly; NetCDF-4 files
+        are HDF5 containers and use the HDF5 extractor.
+        """
+        with open(file_path, 'rb') as f:
+            magic = f.read(4)
+            if magic[:3] != b'CDF':
+                return {**self._extract_hdf5_schema(file_path), 'format': 'netcdf4'}
+            
+            version = magic[3]
+            count_format = '>Q' if version == 5 else '>I'
+            offset_size = 4 if version == 1 else 8
+            
+            def count() -> int:
+                return struct.unpack(count_format, f.read(struct.calcsize(count_format)))[0]
+            
+            def name() -> str:
+                length = count()
+                return f.read(length + (-length % 4))[:length].decode('utf-8', errors='replace')
+            
+            def skip_attributes():
+                tag, n = struct.unpack('>I', f.read(4))[0], count()
+                for _ in range(n if tag else 0):
+                    name()
+                    nc_type = struct.unpack('>I', f.read(4))[0]
+                    size = count() * self.NETCDF_TYPES.get(nc_type, ('', 1))[1]
+                    f.seek(size + (-size % 4), 1)
+            
+            record_count = count()
+            
+            tag, n = struct.unpack('>I', f.read(4))[0], count()
+            dimensions = {}
+            for _ in range(n if tag else 0):
+                dim_name = name()
+                dimensions[dim_name] = count() or None  # 0 marks the record dimension
+            
+            skip_attributes()
+            
+            dim_names = list(dimensions)
+            tag, n = struct.unpack('>I', f.read(4))[0], count()
+            variables = {}
+            for _ in range(n if tag else 0):
+                var_name = name()
+                dim_ids = [count() for _ in range(count())]
+                skip_attributes()
+                nc_type = struct.unpack('>I', f.read(4))[0]
+                f.read(struct.calcsize(count_format) + offset_size)  # vsize, begin
+                variables[var_name] = {
+                    'dimensions': [dim_names[i] for i in dim_ids if i < len(dim_names)],
+                    'dtype': self.NETCDF_TYPES.get(nc_type, ('unknown', 0))[0]
+                }
+        
+        return {
+            'format': 'netcdf3',
+            'record_count': None if record_count in (0xFFFFFFFF, 2 ** 64 - 1) else record_count,
+            'dimensions': dimensions,
+            'variables': variables
+        }
+    
+    def _read_npy_header(self, f) -> Dict:
+        """Parse a .npy header from an open binary handle without reading the array.
+        
+        Uses numpy.lib.format when numpy is installed; otherwise the header
+        dict is parsed directly.
+        """
+        try:
+            from numpy.lib import format as npy_format
+        except ImportError:
+            npy_format = None
+        
+        if npy_format is not None:
+            version = npy_format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = npy_format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = npy_format.read_array_header_2_0(f)
+            return {
+                'dtype': str(npy_format.dtype_to_descr(dtype)),
+                'shape': list(shape),
+                'fortran_order': fortran_order
+            }
+        
+        if f.read(6) != b'\x93NUMPY':
+            raise ValueError('Not a .npy file')
+        major = f.read(2)[0]
+        length_format = '<H' if major == 1 else '<I'
+        header_length = struct.unpack(length_format, f.read(struct.calcsize(length_format)))[0]
+        header = ast.literal_eval(f.read(header_length).decode('latin1' if major < 3 else 'utf-8'))
+        return {
+            'dtype': str(header['descr']),
+            'shape': list(header['shape']),
+            'fortran_order': header['fortran_order']
+        }
+    
+    def _extract_npy_schema(self, file_path: Path) -> Dict:
+        """Extract dtype and shape from a .npy header."""
+        with open(file_path, 'rb') as f:
+            return self._read_npy_header(f)
+    
+    def _extract_npz_schema(self, file_path: Path) -> Dict:
+        """Extract dtype and shape of each array in a .npz archive from member headers."""
+        arrays = {}
+        
+        with zipfile.ZipFile(file_path) as archive:
+            for member in archive.namelist()[:200]:
+                if not member.endswith('.npy'):
+                    continue
+                with archive.open(member) as f:
+                    arrays[member[:-4]] = self._read_npy_header(f)
+        
+        return {'arrays': arrays}
+    
     def _generate_description(self, file_path: Path, data_type: str, 
                             schema: Optional[Dict]) -> str:
         """Generate human-readable description of data file."""
@@ -446,9 +3031,18 @@ class EngineeringDataContextGenerator:
             if 'columns' in schema:
                 desc_parts.append(f"with {len(schema['columns'])} columns")
                 if 'row_count' in schema:
-                    desc_parts.append(f"and {schema['row_count']} rows")
+                    approx = "~" if schema.get('row_count_estimated') else ""
+                    desc_parts.append(f"and {approx}{schema['row_count']} rows")
             elif 'tables' in schema:
                 desc_parts.append(f"containing {len(schema['tables'])} tables")
+            elif 'shape' in schema:
+                desc_parts.append(f"with shape {tuple(schema['shape'])} ({schema['dtype']})")
+            elif 'arrays' in schema:
+                desc_parts.append(f"containing {len(schema['arrays'])} arrays")
+            elif 'variables' in schema:
+                desc_parts.append(f"with {len(schema['variables'])} variables")
+            elif 'datasets' in schema:
+                desc_parts.append(f"containing {len(schema['datasets'])} datasets")
         
         return " ".join(desc_parts)
     
@@ -478,41 +3072,37 @@ class EngineeringDataContextGenerator:
         
         return list(set(tags))
     
-    def _perform_deep_research(self, contexts: List[DataContext]) -> List[DataContext]:
-        """Perform deep web research for contexts."""
-        
-        research_cache = self._load_research_cache()
+    def _perform_deep_research(self, contexts: List[DataContext],
+                               verbose: bool = True) -> Dict[str, int]:
+        """Perform deep web research for contexts, returning the scheduler stats."""
+        
+        # Limit queries per context
+        return self._run_research(contexts,
+                                  lambda context: self._generate_research_queries(context)[:2],
+                                  verbose)
+    
+    def _run_research(self, contexts: Iterable[DataContext],
+                      queries_for: Callable[[DataContext], List[str]],
+                      verbose: bool = True) -> Dict[str, int]:
+        """Research contexts through the async scheduler and report throughput."""
+        scheduler = ResearchScheduler(
+            self.research_backend or self._web_research,
+            cache_lookup=self.research_cache.get,
+            cache_store=self.research_cache.put,
+            rate=self.research_rate,
+            concurrency=self.research_concurrency
+        )
         
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = []
-            
-            for context in contexts:
-                # Generate research queries based on context
-                queries = self._generate_research_queries(context)
-                
-                for query in queries[:2]:  # Limit queries per context
-                    query_hash = hashlib.md5(query.encode()).hexdigest()
-                    
-                    if query_hash not in research_cache:
-                        future = executor.submit(self._web_research, query)
-                        futures.append((future, context, query, query_hash))
-            
-            # Collect research results
-            for future, context, query, query_hash in futures:
-                try:
-                    result = future.result(timeout=30)
-                    if result:
-                        if context.web_research is None:
-                            context.web_research = {}
-                        context.web_research[query] = asdict(result)
-                        
-                        # Cache the result
-                        self._cache_research(query_hash, query, result)
-                        
-                except Exception as e:
-                    print(f"   Research error for '{query}': {e}")
+        start = time.monotonic()
+        scheduler.run(contexts, queries_for)
+        elapsed = max(time.monotonic() - start, 1e-9)
         
-        return contexts
+        stats = scheduler.stats
+        if verbose:
+            print(f"   {stats['queries']} queries: {stats['fetched']} fetched, "
+                  f"{stats['cache_hits']} cached, {stats['coalesced']} coalesced, "
+                  f"{stats['failed']} failed ({stats['queries'] / elapsed:.1f} queries/s)")
+        return stats
     
     def _generate_research_queries(self, context: DataContext) -> List[str]:
         """Generate research queries for a context."""
@@ -562,305 +3152,141 @@ class EngineeringDataContextGenerator:
         except Exception:
             return None
     
-    def _load_research_cache(self) -> Dict[str, ResearchResult]:
-        """Load research cache from database."""
-        cache = {}
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT query_hash, results FROM research_cache")
-        for row in cursor.fetchall():
-            cache[row[0]] = json.loads(row[1])
-        
-        conn.close()
-        return cache
+    def compact_research_cache(self, vacuum: bool = False) -> Dict[str, int]:
+        """Compact the research cache now, optionally reclaiming disk space.
+        
+        VACUUM may renumber data_context rowids, so the search index is
+        rebuilt afterwards.
+        """
+        self.research_cache.wait()
+        self.research_cache.flush()
+        result = self.research_cache.compact()
+        if vacuum:
+            self.store.execute("VACUUM")
+            self.rebuild_search_index()
+        return result
     
-    def _cache_research(self, query_hash: str, query: str, result: ResearchResult):
-        """Cache research results."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO research_cache (query_hash, query, results, timestamp)
-            VALUES (?, ?, ?, ?)
-        ''', (query_hash, query, json.dumps(asdict(result)), datetime.now().isoformat()))
-        
-        conn.commit()
-        conn.close()
+    def _module_search_dirs(self) -> List[Path]:
+        """Directories whose children are candidate modules."""
+        return [self.base_path / 'specs' / 'modules', self.base_path / 'src' / 'modules',
+                self.base_path]
     
-    def _assign_to_modules(self, contexts: List[DataContext]) -> List[DataContext]:
-        """Assign contexts to appropriate modules."""
-        
-        # Find modules in the repository
-        modules = self._discover_modules()
-        
-        for context in contexts:
-            # Determine best module match based on path and tags
-            best_module = self._find_best_module(context, modules)
-            if best_module:
-                context.module_assignment = best_module
-                print(f"   Assigned {context.name} to module: {best_module}")
-        
-        return contexts
+    def _module_matcher(self) -> ModuleMatcher:
+        """Return the cached ModuleMatcher, rebuilding it if module folders changed."""
+        signature = []
+        for directory in self._module_search_dirs():
+            try:
+                signature.append(directory.stat().st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        signature = tuple(signature)
+        
+        cached = self._cached_matcher
+        if cached is None or cached[0] != signature:
+            cached = (signature, ModuleMatcher(self._discover_modules()))
+            self._cached_matcher = cached
+        return cached[1]
     
     def _discover_modules(self) -> List[str]:
         """Discover modules in the repository."""
         modules = []
+        specs_modules, src_modules, base = self._module_search_dirs()
         
-        # Check for specs/modules structure
-        specs_modules = self.base_path / 'specs' / 'modules'
-        if specs_modules.exists():
-            modules.extend([d.name for d in specs_modules.iterdir() if d.is_dir()])
-        
-        # Check for src/modules structure
-        src_modules = self.base_path / 'src' / 'modules'
-        if src_modules.exists():
-            modules.extend([d.name for d in src_modules.iterdir() if d.is_dir()])
+        # Check for specs/modules and src/modules structures
+        for parent in (specs_modules, src_modules):
+            if parent.exists():
+                modules.extend([d.name for d in parent.iterdir() if d.is_dir()])
         
         # Check for top-level module indicators
-        for item in self.base_path.iterdir():
+        for item in base.iterdir():
             if item.is_dir() and (item / '__init__.py').exists():
                 modules.append(item.name)
         
         return list(set(modules))
     
-    def _find_best_module(self, context: DataContext, modules: List[str]) -> Optional[str]:
+    def _find_best_module(self, context: DataContext, matcher: ModuleMatcher) -> Optional[str]:
         """Find the best module match for a context."""
         
-        if not modules:
-            return None
-        
-        context_path = Path(context.path)
-        
         # Check if context is already in a module
-        for module in modules:
-            if module in str(context_path):
-                return module
+        module = matcher.module_for_path(context.path)
+        if module:
+            return module
         
         # Match based on tags and name similarity
-        best_score = 0
-        best_module = None
-        
-        for module in modules:
-            score = 0
-            
-            # Check name similarity
-            if module.lower() in context.name.lower():
-                score += 3
-            
-            # Check tag matches
-            for tag in context.tags:
-                if tag.lower() in module.lower():
-                    score += 1
-            
-            if score > best_score:
-                best_score = score
-                best_module = module
-        
-        return best_module if best_score > 0 else None
+        return matcher.best_module(context.name, context.tags)
     
-    def _save_contexts(self, contexts: List[DataContext]):
-        """Save contexts to database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for context in contexts:
-            cursor.execute('''
-                INSERT OR REPLACE INTO data_context 
-                (path, type, name, description, metadata, content_hash, 
-                 data_schema, related_docs, web_research, last_updated, tags, module_assignment)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                context.path,
-                context.type,
-                context.name,
-                context.description,
-                json.dumps(context.metadata),
-                context.content_hash,
-                json.dumps(context.data_schema) if context.data_schema else None,
-                json.dumps(context.related_docs),
-                json.dumps(context.web_research) if context.web_research else None,
-                context.last_updated,
-                json.dumps(context.tags),
-                context.module_assignment
-            ))
-        
-        conn.commit()
-        conn.close()
-    
-    def _save_agent_formats(self, contexts: List[DataContext], folder_path: Path):
-        """Save contexts in agent-friendly formats."""
-        
-        # Create output directory
-        output_dir = self.context_dir / 'exports' / folder_path.name
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Convert to serializable format
-        contexts_data = [asdict(c) for c in contexts]
-        
-        # Save as JSON
-        json_path = output_dir / 'context.json'
-        with open(json_path, 'w') as f:
-            json.dump(contexts_data, f, indent=2)
-        
-        # Save as YAML
-        yaml_path = output_dir / 'context.yaml'
-        with open(yaml_path, 'w') as f:
-            yaml.dump(contexts_data, f, default_flow_style=False)
-        
-        # Save module-specific contexts
-        module_contexts = {}
-        for context in contexts:
-            if context.module_assignment:
-                if context.module_assignment not in module_contexts:
-                    module_contexts[context.module_assignment] = []
-                module_contexts[context.module_assignment].append(asdict(context))
-        
-        if module_contexts:
-            modules_dir = output_dir / 'modules'
-            modules_dir.mkdir(exist_ok=True)
-            
-            for module, contexts in module_contexts.items():
-                module_file = modules_dir / f'{module}_context.json'
-                with open(module_file, 'w') as f:
-                    json.dump(contexts, f, indent=2)
-        
-        # Generate markdown documentation
-        self._generate_markdown_docs(contexts, output_dir)
-        
-        print(f"\n📁 Context files saved to: {output_dir}")
+    def _save_contexts(self, contexts: Iterable[DataContext]):
+        """Save contexts to database in chunked transactions."""
+        # Upsert (not REPLACE) so rowids stay stable and the FTS triggers fire
+        self.store.executemany('''
+            INSERT INTO data_context 
+            (path, type, name, description, metadata, content_hash, 
+             data_schema, related_docs, web_research, last_updated, tags,
+             module_assignment, fingerprint)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                type = excluded.type,
+                name = excluded.name,
+                description = excluded.description,
+                metadata = excluded.metadata,
+                content_hash = excluded.content_hash,
+                data_schema = excluded.data_schema,
+                related_docs = excluded.related_docs,
+                web_research = excluded.web_research,
+                last_updated = excluded.last_updated,
+                tags = excluded.tags,
+                module_assignment = excluded.module_assignment,
+                fingerprint = excluded.fingerprint
+        ''', (self._context_to_row(context) for context in contexts))
     
-    def _generate_markdown_docs(self, contexts: List[DataContext], output_dir: Path):
-        """Generate markdown documentation for contexts."""
-        
-        md_path = output_dir / 'README.md'
-        
-        md_content = f"""# Engineering Data Context
-
-Generated: {datetime.now().isoformat()}
-
-## Overview
-
-This directory contains context information for {len(contexts)} data items.
-
-## Summary by Type
-
-"""
+    def _context_to_row(self, context: DataContext) -> Tuple:
+        """Serialize a DataContext into a data_context row."""
+        return (
+            context.path,
+            context.type,
+            context.name,
+            context.description,
+            context.json_column('metadata'),
+            context.content_hash,
+            context.json_column('data_schema'),
+            context.json_column('related_docs'),
+            context.json_column('web_research'),
+            context.last_updated,
+            context.json_column('tags'),
+            context.module_assignment,
+            context.fingerprint
+        )
+    
+    def _export_dir(self, folder_path: Path) -> Path:
+        """Directory holding the exports for a scanned folder."""
+        return self.context_dir / 'exports' / folder_path.name
+    
+    def _save_agent_formats(self, contexts: Iterable[DataContext], folder_path: Path):
+        """Save contexts in agent-friendly formats, streaming them to sharded exports."""
         
-        # Group by type
-        by_type = {}
+        exporter = ContextExporter(self._export_dir(folder_path), folder_path)
         for context in contexts:
-            data_type = context.metadata.get('data_type', context.type)
-            if data_type not in by_type:
-                by_type[data_type] = []
-            by_type[data_type].append(context)
-        
-        for data_type, items in sorted(by_type.items()):
-            md_content += f"### {data_type.replace('_', ' ').title()}\n\n"
-            for item in items[:5]:  # Show first 5
-                md_content += f"- **{item.name}**: {item.description}\n"
-            if len(items) > 5:
-                md_content += f"- ... and {len(items) - 5} more\n"
-            md_content += "\n"
-        
-        # Module assignments
-        if any(c.module_assignment for c in contexts):
-            md_content += "## Module Assignments\n\n"
-            
-            module_groups = {}
-            for context in contexts:
-                if context.module_assignment:
-                    if context.module_assignment not in module_groups:
-                        module_groups[context.module_assignment] = []
-                    module_groups[context.module_assignment].append(context)
-            
-            for module, items in sorted(module_groups.items()):
-                md_content += f"### {module}\n\n"
-                for item in items[:5]:
-                    md_content += f"- {item.name}\n"
-                if len(items) > 5:
-                    md_content += f"- ... and {len(items) - 5} more\n"
-                md_content += "\n"
-        
-        # Research findings
-        research_items = [c for c in contexts if c.web_research]
-        if research_items:
-            md_content += "## Research Findings\n\n"
-            
-            for item in research_items[:5]:
-                md_content += f"### {item.name}\n\n"
-                if item.web_research:
-                    for query, result in list(item.web_research.items())[:2]:
-                        md_content += f"**Query**: {query}\n"
-                        md_content += f"**Summary**: {result.get('summary', 'N/A')}\n\n"
-        
-        md_content += """## Usage
-
-### Accessing Context Data
-
-```python
-import json
-
-# Load all contexts
-with open('context.json', 'r') as f:
-    contexts = json.load(f)
-
-# Load module-specific contexts
-with open('modules/MODULE_NAME_context.json', 'r') as f:
-    module_contexts = json.load(f)
-```
-
-### Querying Context
-
-Use the `/engineering-data-context query` command to search contexts:
-
-```bash
-/engineering-data-context query --context "sensor data"
-```
-
-### Enhancing Context
-
-To add more research or update existing context:
-
-```bash
-/engineering-data-context enhance --folder . --research-topics "API documentation"
-```
-"""
-        
-        md_path.write_text(md_content)
+            exporter.add(context)
+        self._finish_exports(exporter)
+    
+    def _finish_exports(self, exporter: ContextExporter):
+        """Close an exporter, writing its manifest and README."""
+        manifest = exporter.close()
+        print(f"\n📁 Context files saved to: {exporter.output_dir} "
+              f"({len(manifest['shards'])} shards)")
     
-    def _generate_summary(self, contexts: List[DataContext]) -> Dict:
+    def _generate_summary(self, contexts: Iterable[DataContext]) -> Dict:
         """Generate summary statistics."""
         
-        total_size = sum(c.metadata.get('size_bytes', 0) for c in contexts 
-                        if c.type == 'file')
-        
-        data_types = {}
-        for context in contexts:
-            if context.type == 'file':
-                dt = context.metadata.get('data_type', 'unknown')
-                data_types[dt] = data_types.get(dt, 0) + 1
-        
-        module_assignments = {}
+        summary = ContextSummary()
         for context in contexts:
-            if context.module_assignment:
-                module_assignments[context.module_assignment] = \
-                    module_assignments.get(context.module_assignment, 0) + 1
-        
-        return {
-            'total_items': len(contexts),
-            'total_size_mb': total_size / (1024 * 1024),
-            'data_types': data_types,
-            'module_assignments': module_assignments,
-            'research_performed': sum(1 for c in contexts if c.web_research),
-            'folders_processed': sum(1 for c in contexts if c.type == 'folder'),
-            'files_processed': sum(1 for c in contexts if c.type == 'file')
-        }
+            summary.add(context)
+        return summary.as_dict()
     
     def enhance_context(self, folder_path: Path, 
                         research_topics: Optional[List[str]] = None) -> Dict:
         """Enhance existing context with additional research."""
+        folder_path = _absolute_path(folder_path)
         
         print(f"✨ Enhancing context for: {folder_path}")
         
@@ -875,6 +3301,7 @@ To add more research or update existing context:
         if research_topics:
             print(f"\n🔍 Researching topics: {', '.join(research_topics)}")
             contexts = self._research_specific_topics(contexts, research_topics)
+            self.research_cache.compact_in_background()
         
         # Update timestamps
         for context in contexts:
@@ -883,6 +3310,7 @@ To add more research or update existing context:
         # Save updated contexts
         self._save_contexts(contexts)
         self._save_agent_formats(contexts, folder_path)
+        self.research_cache.wait()
         
         return {
             'status': 'success',
@@ -892,88 +3320,130 @@ To add more research or update existing context:
     
     def _load_contexts(self, folder_path: Path) -> List[DataContext]:
         """Load existing contexts from database."""
-        contexts = []
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return list(self._iter_contexts(folder_path))
+    
+    def _iter_contexts(self, folder_path: Path) -> Iterator[DataContext]:
+        """Stream stored contexts under a folder, ordered by path."""
+        clause, params = self._scope_clause(folder_path)
         
         # Get all contexts under this folder
-        cursor.execute('''
-            SELECT * FROM data_context 
-            WHERE path LIKE ? 
+        cursor = self.store.execute(f'''
+            SELECT path, type, name, description, metadata, content_hash,
+                   data_schema, related_docs, web_research, last_updated, tags,
+                   module_assignment, fingerprint
+            FROM data_context 
+            WHERE {clause}
             ORDER BY path
-        ''', (f"{folder_path}%",))
-        
-        for row in cursor.fetchall():
-            context = DataContext(
-                path=row[0],
-                type=row[1],
-                name=row[2],
-                description=row[3],
-                metadata=json.loads(row[4]) if row[4] else {},
-                content_hash=row[5],
-                data_schema=json.loads(row[6]) if row[6] else None,
-                related_docs=json.loads(row[7]) if row[7] else [],
-                web_research=json.loads(row[8]) if row[8] else None,
-                last_updated=row[9],
-                tags=json.loads(row[10]) if row[10] else [],
-                module_assignment=row[11]
-            )
-            contexts.append(context)
+        ''', params)
         
-        conn.close()
-        return contexts
+        for row in cursor:
+            yield self._row_to_context(row)
+    
+    def _row_to_context(self, row: Tuple) -> DataContext:
+        """Rebuild a DataContext from a data_context row."""
+        return DataContext.from_row(row)
     
     def _research_specific_topics(self, contexts: List[DataContext], 
                                  topics: List[str]) -> List[DataContext]:
         """Research specific topics for contexts."""
         
-        for context in contexts:
-            for topic in topics:
-                query = f"{context.name} {topic}"
-                result = self._web_research(query)
-                
-                if result:
-                    if context.web_research is None:
-                        context.web_research = {}
-                    context.web_research[query] = asdict(result)
-        
+        self._run_research(contexts, lambda context: [f"{context.name} {topic}" for topic in topics])
         return contexts
     
-    def query_context(self, query: str) -> Dict:
-        """Query stored contexts."""
+    def query_context(self, query: str, context_type: Optional[str] = None,
+                      module: Optional[str] = None, data_type: Optional[str] = None,
+                      min_size: Optional[int] = None, max_size: Optional[int] = None,
+                      limit: int = 20, offset: int = 0,
+                      include_facets: bool = False) -> Dict:
+        """Query stored contexts.
+        
+        Terms are matched as prefixes against name, description and tags
+        through the FTS5 index and ranked by BM25. Facet filters narrow by
+        context type, module, data type and size range; limit/offset page
+        through the results.
+        """
         
         print(f"🔎 Searching for: {query}")
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Search in multiple fields
-        cursor.execute('''
-            SELECT path, name, description, tags, module_assignment
-            FROM data_context
-            WHERE name LIKE ? OR description LIKE ? OR tags LIKE ?
-            ORDER BY name
-            LIMIT 20
-        ''', (f"%{query}%", f"%{query}%", f"%{query}%"))
+        filters = []
+        params: List[Any] = []
+        for expr, value in (('c.type', context_type), ('c.module_assignment', module),
+                            (self.DATA_TYPE_EXPR.replace('metadata', 'c.metadata'), data_type)):
+            if value is not None:
+                filters.append(f"{expr} = ?")
+                params.append(value)
+        size_expr = self.SIZE_EXPR.replace('metadata', 'c.metadata')
+        if min_size is not None:
+            filters.append(f"{size_expr} >= ?")
+            params.append(min_size)
+        if max_size is not None:
+            filters.append(f"{size_expr} <= ?")
+            params.append(max_size)
+        
+        terms = re.findall(r'\w+', query or '')
+        if terms and self.fts_enabled:
+            # CROSS JOIN keeps the FTS match as the outer loop so facet
+            # indexes never drive a per-row MATCH
+            source = "data_context_fts CROSS JOIN data_context c ON c.rowid = data_context_fts.rowid"
+            filters.insert(0, "data_context_fts MATCH ?")
+            params.insert(0, ' '.join(f'"{term}"*' for term in terms))
+            weights = ', '.join(str(w) for w in self.BM25_WEIGHTS)
+            score = f"bm25(data_context_fts, {weights})"
+            order = "score"
+        else:
+            source = "data_context c"
+            score = "0.0"
+            order = "c.name"
+            if terms:
+                pattern = f"%{query}%"
+                filters.insert(0, "(c.name LIKE ? OR c.description LIKE ? OR c.tags LIKE ?)")
+                params[0:0] = [pattern, pattern, pattern]
+        
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        
+        rows = self.store.query(f'''
+            SELECT c.path, c.name, c.description, c.tags, c.module_assignment,
+                   c.type, {self.DATA_TYPE_EXPR.replace('metadata', 'c.metadata')}, {score} AS score
+            FROM {source}
+            {where}
+            ORDER BY {order}
+            LIMIT ? OFFSET ?
+        ''', (*params, limit, offset))
         
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             results.append({
                 'path': row[0],
                 'name': row[1],
                 'description': row[2],
                 'tags': json.loads(row[3]) if row[3] else [],
-                'module': row[4]
+                'module': row[4],
+                'type': row[5],
+                'data_type': row[6],
+                'score': row[7]
             })
         
-        conn.close()
+        total = self.store.query(f"SELECT COUNT(*) FROM {source} {where}", tuple(params))[0][0]
         
-        return {
+        result = {
             'query': query,
             'results': results,
-            'count': len(results)
+            'count': len(results),
+            'total': total,
+            'limit': limit,
+            'offset': offset
         }
+        
+        if include_facets:
+            result['facets'] = {}
+            for facet, expr in (('type', 'c.type'), ('module', 'c.module_assignment'),
+                                ('data_type', self.DATA_TYPE_EXPR.replace('metadata', 'c.metadata'))):
+                result['facets'][facet] = dict(self.store.query(f'''
+                    SELECT {expr}, COUNT(*) FROM {source} {where}
+                    GROUP BY {expr} ORDER BY COUNT(*) DESC
+                ''', tuple(params)))
+        
+        return result
 
 def main():
     """Main entry point."""
@@ -983,21 +3453,77 @@ def main():
         description='Generate and manage engineering data context'
     )
     
-    parser.add_argument('command', choices=['generate', 'enhance', 'query', 'export'])
+    parser.add_argument('command',
+                        choices=['generate', 'enhance', 'query', 'export', 'cache', 'watch'])
     parser.add_argument('--folder', type=str, help='Folder path to process')
     parser.add_argument('--deep-research', action='store_true', 
                        help='Perform deep web research')
     parser.add_argument('--modules', action='store_true',
                        help='Assign contexts to modules')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only re-extract files and folders that changed since the last scan')
+    parser.add_argument('--debounce', type=float, default=1.0,
+                       help='Seconds without events before watch applies a batch')
+    parser.add_argument('--poll-interval', type=float, default=2.0,
+                       help='Seconds between snapshots when watch cannot use inotify')
+    parser.add_argument('--row-count', choices=['exact', 'estimate'], default='exact',
+                       help='Count CSV rows exactly or estimate them for very large files')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes for hashing and schema extraction (0 = all cores)')
+    parser.add_argument('--hash-algorithm', choices=ContentFingerprinter.ALGORITHMS,
+                       default='auto', help='Content hash; auto prefers xxh3, then blake3, then blake2b')
+    parser.add_argument('--hash-strategy', choices=ContentFingerprinter.STRATEGIES,
+                       default='auto', help='Hash whole files, sampled blocks, or sample only large files')
+    parser.add_argument('--hash-stride-mb', type=float, default=16.0,
+                       help='Distance between sampled 1 MB blocks when sampling')
     parser.add_argument('--research-topics', nargs='+',
                        help='Specific topics to research')
+    parser.add_argument('--research-backend', choices=['web', 'local'], default='web',
+                       help='Research backend; "local" is an offline stand-in for benchmarking')
+    parser.add_argument('--research-rate', type=float, default=5.0,
+                       help='Maximum research requests per second')
+    parser.add_argument('--research-concurrency', type=int, default=8,
+                       help='Contexts researched concurrently')
+    parser.add_argument('--cache-ttl-days', type=float, default=30.0,
+                       help='Days before a cached research result expires (0 = never)')
+    parser.add_argument('--cache-max-entries', type=int, default=10000,
+                       help='Maximum cached research results (0 = unbounded)')
+    parser.add_argument('--cache-policy', choices=['lru', 'lfu'], default='lru',
+                       help='Eviction policy when the research cache is full')
+    parser.add_argument('--cache-action', choices=['stats', 'compact', 'clear'], default='stats',
+                       help='Research cache action for the cache command')
+    parser.add_argument('--vacuum', action='store_true',
+                       help='Reclaim database space after compacting the research cache')
     parser.add_argument('--context', type=str, help='Context query string')
+    parser.add_argument('--type', dest='context_type', choices=['file', 'folder'],
+                       help='Only return file or folder contexts')
+    parser.add_argument('--module', type=str, help='Only return contexts assigned to a module')
+    parser.add_argument('--data-type', type=str, help='Only return contexts of a data type')
+    parser.add_argument('--min-size', type=int, help='Minimum size in bytes')
+    parser.add_argument('--max-size', type=int, help='Maximum size in bytes')
+    parser.add_argument('--limit', type=int, default=20, help='Results per page')
+    parser.add_argument('--offset', type=int, default=0, help='Results to skip')
+    parser.add_argument('--facets', action='store_true',
+                       help='Include facet counts for the matched contexts')
     parser.add_argument('--format', choices=['json', 'yaml', 'markdown'],
                        default='json', help='Export format')
     
     args = parser.parse_args()
     
-    generator = EngineeringDataContextGenerator()
+    generator = EngineeringDataContextGenerator(
+        row_count_mode=args.row_count,
+        research_backend=LocalResearchBackend() if args.research_backend == 'local' else None,
+        research_rate=args.research_rate,
+        research_concurrency=args.research_concurrency,
+        cache_ttl_days=args.cache_ttl_days,
+        cache_max_entries=args.cache_max_entries,
+        cache_policy=args.cache_policy,
+        fingerprinter=ContentFingerprinter(
+            algorithm=args.hash_algorithm,
+            strategy=args.hash_strategy,
+            stride=int(args.hash_stride_mb * 1024 * 1024)
+        )
+    )
     
     if args.command == 'generate':
         if not args.folder:
@@ -1008,7 +3534,10 @@ def main():
         result = generator.generate_context(
             folder_path,
             deep_research=args.deep_research,
-            use_modules=args.modules
+            use_modules=args.modules,
+            incremental=args.incremental,
+            workers=args.workers or os.cpu_count() or 1,
+            on_progress=lambda progress: print(f"   ⏱️  {progress.format()}")
         )
         
         if 'error' in result:
@@ -1016,6 +3545,10 @@ def main():
             sys.exit(1)
         
         print(f"\n✅ Successfully generated context for {result['contexts_created']} items")
+        if args.incremental:
+            print(f"   Updated: {result['contexts_updated']}, "
+                  f"unchanged: {result['contexts_unchanged']}, "
+                  f"removed: {result['contexts_removed']}")
         print(f"   Output location: {result['output_location']}")
         
         # Display summary
@@ -1025,6 +3558,27 @@ def main():
         print(f"   Data types: {len(summary['data_types'])} types")
         print(f"   Module assignments: {len(summary.get('module_assignments', {}))} modules")
         
+    elif args.command == 'watch':
+        if not args.folder:
+            print("❌ Error: --folder argument required")
+            sys.exit(1)
+        
+        folder_path = Path(args.folder)
+        # Catch up on changes made while nothing was watching
+        result = generator.generate_context(
+            folder_path,
+            use_modules=args.modules,
+            incremental=True,
+            workers=args.workers or os.cpu_count() or 1
+        )
+        if 'error' in result:
+            print(f"❌ Error: {result['error']}")
+            sys.exit(1)
+        
+        print(f"\n👀 Watching {folder_path} (Ctrl+C to stop)")
+        ContextWatcher(generator, folder_path, debounce=args.debounce,
+                       use_modules=args.modules, poll_interval=args.poll_interval).run()
+        
     elif args.command == 'enhance':
         if not args.folder:
             print("❌ Error: --folder argument required")
@@ -1039,13 +3593,27 @@ def main():
         print(f"\n✅ Enhanced context for {result['contexts_enhanced']} items")
         
     elif args.command == 'query':
-        if not args.context:
-            print("❌ Error: --context argument required")
+        has_filter = any(v is not None for v in (args.context_type, args.module, args.data_type,
+                                                   args.min_size, args.max_size))
+        if not args.context and not has_filter:
+            print("❌ Error: --context or a filter argument required")
             sys.exit(1)
         
-        result = generator.query_context(args.context)
+        result = generator.query_context(
+            args.context or '',
+            context_type=args.context_type,
+            module=args.module,
+            data_type=args.data_type,
+            min_size=args.min_size,
+            max_size=args.max_size,
+            limit=args.limit,
+            offset=args.offset,
+            include_facets=args.facets
+        )
         
-        print(f"\n📋 Found {result['count']} matches:")
+        first = result['offset'] + 1 if result['count'] else 0
+        print(f"\n📋 Found {result['total']} matches "
+              f"(showing {first}-{result['offset'] + result['count']}):")
         for item in result['results']:
             print(f"\n   📄 {item['name']}")
             print(f"      {item['description']}")
@@ -1054,6 +3622,27 @@ def main():
             if item['module']:
                 print(f"      Module: {item['module']}")
             print(f"      Path: {item['path']}")
+        
+        for facet, counts in result.get('facets', {}).items():
+            print(f"\n   {facet}: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+    
+    elif args.command == 'cache':
+        if args.cache_action == 'clear':
+            removed = generator.research_cache.clear()
+            print(f"\n🗑️  Cleared {removed} cached research results")
+        elif args.cache_action == 'compact':
+            result = generator.compact_research_cache(vacuum=args.vacuum)
+            print(f"\n🧹 Compacted research cache: {result['expired_removed']} expired, "
+                  f"{result['evicted']} evicted")
+        
+        stats = generator.research_cache.stats()
+        print(f"\n🗄️  Research cache ({stats['policy'].upper()}, "
+              f"TTL {stats['ttl_days']:g} days, max {stats['max_entries']} entries):")
+        print(f"   Entries: {stats['entries']} ({stats['size_bytes'] / 1024:.1f} KB, "
+              f"{stats['expired_entries']} expired)")
+        print(f"   Hits: {stats['hits']}, misses: {stats['misses']} "
+              f"(hit rate {stats['hit_rate']:.0%})")
+        print(f"   Evicted: {stats['evictions']}, expired removed: {stats['expired_removed']}")
     
     elif args.command == 'export':
         # Export functionality would be implemented here
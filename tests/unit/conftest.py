@@ -0,0 +1,39 @@
+# conftest.py
+#
+# Fixtures for unit tests of the Agent OS commands under .agent-os/commands
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENT_OS_PATH = Path(__file__).resolve().parents[2] / ".agent-os"
+COMMANDS_PATH = AGENT_OS_PATH / "commands"
+
+
+def import_command(name: str):
+    """Import a command module by name from .agent-os/commands."""
+    if str(COMMANDS_PATH) not in sys.path:
+        sys.path.append(str(COMMANDS_PATH))
+    return importlib.import_module(name)
+
+
+@pytest.fixture(scope="session")
+def engineering_data_context():
+    """The engineering_data_context command module (skipped without requests)."""
+    pytest.importorskip("requests")
+    return import_command("engineering_data_context")
+
+
+@pytest.fixture(scope="session")
+def create_module_agent():
+    """The create_module_agent command module."""
+    return import_command("create_module_agent")
+
+
+@pytest.fixture
+def generator(engineering_data_context, tmp_path, monkeypatch):
+    """A generator storing its context under tmp_path, run from tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return engineering_data_context.EngineeringDataContextGenerator(base_path=tmp_path)
@@ -0,0 +1,114 @@
+"""
+Unit tests for the schema extractor registry and header-only binary readers.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "data"
+
+
+@pytest.fixture(params=["numpy", "no numpy"])
+def npy_reader(request, monkeypatch):
+    """Run header tests with numpy.lib.format and with the pure-Python parser."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        for name in ("numpy", "numpy.lib", "numpy.lib.format"):
+            monkeypatch.setitem(sys.modules, name, None)
+    return request.param
+
+
+class TestParquetFooter:
+    """Columns, types and row counts come from the Thrift footer."""
+
+    def test_footer_schema(self, generator):
+        schema = generator._extract_parquet_schema(FIXTURES / "columns.parquet")
+
+        assert schema["columns"] == ["id", "load", "name", "measured", "sensor.a", "sensor.b", "flag"]
+        assert schema["dtypes"] == {
+            "id": "int64", "load": "double", "name": "string", "measured": "timestamp_millis",
+            "sensor.a": "int32", "sensor.b": "string", "flag": "boolean"
+        }
+        assert schema["row_count"] == 5
+        assert schema["row_groups"] == 3
+        assert schema["created_by"].startswith("parquet-cpp-arrow")
+
+    def test_rejects_other_files(self, generator):
+        with pytest.raises(ValueError):
+            generator._extract_parquet_schema(FIXTURES / "classic.nc")
+
+
+class TestNetcdfHeader:
+    """Classic and 64-bit-offset headers give dimensions and variables."""
+
+    @pytest.mark.parametrize("name", ["classic.nc", "offset64.nc"])
+    def test_header_schema(self, generator, name):
+        schema = generator._extract_netcdf_schema(FIXTURES / name)
+
+        assert schema == {
+            "format": "netcdf3",
+            "record_count": 2,
+            "dimensions": {"time": None, "x": 3},
+            "variables": {
+                "time": {"dimensions": ["time"], "dtype": "double"},
+                "temp": {"dimensions": ["time", "x"], "dtype": "float"},
+                "depth": {"dimensions": ["x"], "dtype": "short"},
+            }
+        }
+
+    def test_netcdf4_goes_to_hdf5_extractor(self, generator, tmp_path):
+        path = tmp_path / "v4.nc"
+        path.write_bytes(b"\x89HDF\r\n\x1a\n" + bytes(64))
+
+        assert generator._extract_netcdf_schema(path)["format"] == "netcdf4"
+
+
+class TestNpyHeaders:
+    """dtype and shape come from the .npy header only."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("array.npy", {"dtype": "<f8", "shape": [3, 4], "fortran_order": False}),
+        ("fortran.npy", {"dtype": ">i4", "shape": [2, 3], "fortran_order": True}),
+        ("structured.npy", {"dtype": "[('t', '<f8'), ('id', '<i2')]", "shape": [4],
+                            "fortran_order": False}),
+    ])
+    def test_npy(self, generator, npy_reader, name, expected):
+        assert generator._extract_npy_schema(FIXTURES / name) == expected
+
+    def test_npz_members(self, generator, npy_reader):
+        assert generator._extract_npz_schema(FIXTURES / "arrays.npz") == {"arrays": {
+            "load": {"dtype": "<f8", "shape": [5, 2], "fortran_order": False},
+            "ids": {"dtype": "<i4", "shape": [3], "fortran_order": False},
+        }}
+
+    def test_rejects_other_files(self, generator, npy_reader):
+        with pytest.raises(ValueError):
+            generator._extract_npy_schema(FIXTURES / "columns.parquet")
+
+
+class TestSchemaExtractorRegistry:
+    """Extractors are looked up by extension and can be replaced."""
+
+    def test_registry_drives_extraction_and_description(self, generator):
+        path = FIXTURES / "array.npy"
+        schema = generator._extract_data_schema(path, "numpy_array")
+
+        assert schema["shape"] == [3, 4]
+        assert "with shape (3, 4)" in generator._generate_description(path, "numpy_array", schema)
+
+    def test_register_replaces_extractor(self, generator, tmp_path):
+        path = tmp_path / "mesh.STL"
+        path.write_bytes(b"solid x")
+        generator.register_schema_extractor(".Stl", lambda p: {"format": "stl", "size": p.stat().st_size})
+
+        assert generator._extract_data_schema(path, "mesh_model") == {"format": "stl", "size": 7}
+
+    def test_failing_extractor_is_reported(self, generator, tmp_path, capsys):
+        path = tmp_path / "broken.parquet"
+        path.write_bytes(b"not parquet at all")
+
+        assert generator._extract_data_schema(path, "columnar_data") is None
+        assert "Could not extract schema from broken.parquet" in capsys.readouterr().out
@@ -0,0 +1,163 @@
+"""
+Unit tests for the content-addressed chunk store in create_module_agent.
+"""
+
+import hashlib
+import random
+
+import pytest
+
+
+BOILERPLATE = " ".join(f"clause{i % 97} applies to load case {i} of this standard."
+                       for i in range(60))
+
+
+@pytest.fixture
+def store(create_module_agent, tmp_path):
+    return create_module_agent.ChunkStore(tmp_path / "store" / "chunks.db")
+
+
+def chunks(*texts):
+    return [{"text": text, "start": 0, "end": len(text)} for text in texts]
+
+
+def bitwise_simhash(store, text):
+    """SimHash summed one bit at a time, as a reference for the lane arithmetic."""
+    words = store.WORD.findall(text.lower())
+    size = min(store.SHINGLE, len(words))
+    weights = [0] * 64
+    for i in range(len(words) - size + 1):
+        shingle = " ".join(words[i:i + size]).encode()
+        value = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def unrelated(seed):
+    rng = random.Random(seed)
+    return " ".join(f"term{rng.randrange(5000)}" for _ in range(200))
+
+
+class TestChunkStore:
+    """Chunks are stored once and referenced per agent and document."""
+
+    def test_identical_chunks_are_stored_once(self, store):
+        first = store.put_document("riser", "a.md", chunks(BOILERPLATE, "Riser notes"))
+        second = store.put_document("mooring", "b.md", chunks(BOILERPLATE, "Mooring notes"))
+
+        assert first == {"chunks": 2, "new": 2, "duplicate": 0, "near_duplicate": 0}
+        assert second == {"chunks": 2, "new": 1, "duplicate": 1, "near_duplicate": 0}
+        stats = store.stats()
+        assert (stats["chunks"], stats["references"]) == (3, 4)
+        assert stats["dedup_ratio"] > 1.0
+
+    def test_refcounts_and_garbage_collection(self, store):
+        store.put_document("riser", "a.md", chunks(BOILERPLATE, "Riser notes"))
+        store.put_document("mooring", "b.md", chunks(BOILERPLATE))
+        boilerplate_hash = store.document_chunks("mooring", "b.md")[0]["hash"]
+        assert store.refcount(boilerplate_hash) == 2
+
+        store.remove_document("riser", "a.md")
+        assert store.collect_garbage() == 1
+        assert store.refcount(boilerplate_hash) == 1
+
+        store.remove_document("mooring")
+        assert store.collect_garbage() == 1
+        assert store.stats()["chunks"] == 0
+
+    def test_reingesting_replaces_references(self, store):
+        store.put_document("riser", "a.md", chunks("old text", "kept text"))
+        store.put_document("riser", "a.md", chunks("kept text", "new text"))
+
+        assert [c["text"] for c in store.document_chunks("riser", "a.md")] == \
+            ["kept text", "new text"]
+        assert store.collect_garbage() == 1
+
+    def test_near_duplicates_are_detected(self, store):
+        variant = BOILERPLATE.replace("load case 30 ", "load case 30b ")
+        store.put_document("riser", "a.md", chunks(BOILERPLATE))
+
+        stats = store.put_document("mooring", "b.md", chunks(variant, unrelated(1)))
+
+        assert stats["near_duplicate"] == 1 and stats["new"] == 1
+        assert store.stats()["near_duplicates"] == 1
+
+    def test_merged_near_duplicates_share_one_chunk(self, create_module_agent, tmp_path):
+        store = create_module_agent.ChunkStore(tmp_path / "chunks.db", merge_near=True)
+        variant = BOILERPLATE.replace("load case 30 ", "load case 30b ")
+        store.put_document("riser", "a.md", chunks(BOILERPLATE))
+
+        store.put_document("mooring", "b.md", chunks(variant))
+
+        assert store.stats()["chunks"] == 1
+        assert store.document_chunks("mooring", "b.md")[0]["text"] == BOILERPLATE
+
+    def test_unrelated_text_is_not_near(self, store):
+        distances = [bin(store.simhash(unrelated(0)) ^ store.simhash(unrelated(seed))).count("1")
+                     for seed in range(1, 20)]
+
+        assert min(distances) > store.near_distance
+
+    @pytest.mark.parametrize("text", ["", "...", "Riser", "riser tension", BOILERPLATE,
+                                      BOILERPLATE * 3, unrelated(7)])
+    def test_simhash_matches_bitwise_sum(self, store, text):
+        assert store.simhash(text) == bitwise_simhash(store, text)
+
+
+class TestIngestDocuments:
+
+    def test_agents_share_boilerplate_chunks(self, create_module_agent, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        Manager = create_module_agent.EnhancedDocumentationManager
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for name in ["riser", "mooring"]:
+            (docs / f"{name}.md").write_text(BOILERPLATE + "\n\n" + f"{name} specific notes\n")
+        riser, mooring = Manager(tmp_path / "agents" / "riser"), Manager(tmp_path / "agents" / "mooring")
+
+        first = riser.ingest_documents([docs / "riser.md"], max_tokens=10000)
+        second = mooring.ingest_documents([docs / "mooring.md", docs / "missing.md"],
+                                          max_tokens=10000)
+
+        assert first["new"] == 1
+        assert second["documents"] == 1
+        assert riser.chunk_store.db_path == mooring.chunk_store.db_path
+        assert mooring.registry["chunks"][str(docs / "mooring.md")]["chunks"] == 1
+
+    def test_token_budget_chunks_are_deduplicated(self, create_module_agent, tmp_path,
+                                                  monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = create_module_agent.EnhancedDocumentationManager(tmp_path / "agents" / "riser")
+        doc = tmp_path / "standard.md"
+        doc.write_text((BOILERPLATE + "\n") * 4)
+
+        totals = manager.ingest_documents([doc], max_tokens=manager.tokenizer.count(BOILERPLATE))
+
+        assert (totals["chunks"], totals["new"], totals["duplicate"]) == (4, 1, 3)
+        manager.remove_document_chunks(doc)
+        assert manager.chunk_store.stats()["chunks"] == 0
+
+    def test_resume_skips_unchanged_documents(self, create_module_agent, tmp_path,
+                                              monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = create_module_agent.EnhancedDocumentationManager(tmp_path / "agents" / "riser")
+        docs = [tmp_path / f"spec_{i}.md" for i in range(3)]
+        for i, doc in enumerate(docs):
+            doc.write_text(f"{BOILERPLATE}\nspec {i}\n")
+        manager.ingest_documents(docs, max_tokens=50)
+        docs[1].write_text("riser spec rewritten\n")
+        put = manager.chunk_store.put_document
+        ingested = []
+        monkeypatch.setattr(manager.chunk_store, "put_document",
+                            lambda owner, document, chunks: ingested.append(document)
+                            or put(owner, document, chunks))
+
+        totals = manager.ingest_documents(docs, max_tokens=50, resume=True)
+
+        assert ingested == [str(docs[1])]
+        assert (totals["documents"], totals["unchanged"]) == (1, 2)
+        manager.ingest_documents(docs, max_tokens=60, resume=True)
+        assert len(ingested) == 4
+        manager.ingest_documents(docs, max_tokens=60)
+        assert len(ingested) == 7
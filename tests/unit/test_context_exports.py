@@ -0,0 +1,93 @@
+"""
+Unit tests for the streaming, sharded exports in engineering_data_context.
+"""
+
+import json
+
+import pytest
+import yaml
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    root = tmp_path / "data"
+    (root / "runs" / "deep").mkdir(parents=True)
+    (root / "logs").mkdir()
+    (root / "a.csv").write_text("x,y\n1,2\n")
+    (root / "runs" / "b.csv").write_text("x\n1\n")
+    (root / "runs" / "deep" / "c.json").write_text('{"x": 1}')
+    (root / "logs" / "d.csv").write_text("x\n1\n")
+    return root
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestShardedExports:
+    """Contexts are streamed to combined exports and per-folder shards."""
+
+    def test_manifest_lists_folder_shards(self, generator, data_folder):
+        result = generator.generate_context(data_folder)
+        out = generator._export_dir(data_folder)
+
+        manifest = json.loads((out / "manifest.json").read_text())
+        shards = {(s["kind"], s["key"]): s for s in manifest["shards"]}
+        assert manifest["total_items"] == result["contexts_created"] == 8
+        assert set(shards) == {("folder", "_root"), ("folder", "runs"), ("folder", "logs")}
+
+        runs = read_jsonl(out / shards[("folder", "runs")]["jsonl"])
+        assert {r["name"] for r in runs} == {"runs", "deep", "b.csv", "c.json"}
+        assert shards[("folder", "runs")]["count"] == 4
+        root = {r["name"] for r in read_jsonl(out / shards[("folder", "_root")]["jsonl"])}
+        assert root == {"data", "a.csv"}
+        assert "**b.csv**" in (out / shards[("folder", "runs")]["markdown"]).read_text()
+
+    def test_combined_exports_hold_every_context(self, generator, data_folder):
+        generator.generate_context(data_folder)
+        out = generator._export_dir(data_folder)
+
+        as_json = json.loads((out / "context.json").read_text())
+        as_yaml = yaml.safe_load((out / "context.yaml").read_text())
+        as_jsonl = read_jsonl(out / "context.jsonl")
+        assert len(as_json) == len(as_yaml) == len(as_jsonl) == 8
+        assert as_json == as_jsonl
+        assert "8 data items" in (out / "README.md").read_text()
+
+    def test_module_shards_and_stale_shards(self, generator, data_folder, tmp_path):
+        (tmp_path / "specs" / "modules" / "runs").mkdir(parents=True)
+        generator.generate_context(data_folder, use_modules=True)
+        out = generator._export_dir(data_folder)
+
+        manifest = json.loads((out / "manifest.json").read_text())
+        module = next(s for s in manifest["shards"] if s["kind"] == "module")
+        assert module["key"] == "runs"
+        assert {r["module_assignment"] for r in read_jsonl(out / module["jsonl"])} == {"runs"}
+
+        # A later export without modules drops the old module shards
+        generator.generate_context(data_folder)
+        assert not (out / module["jsonl"]).exists()
+
+    def test_empty_export_is_valid(self, engineering_data_context, tmp_path):
+        exporter = engineering_data_context.ContextExporter(tmp_path / "out", tmp_path)
+        manifest = exporter.close()
+
+        assert manifest["shards"] == []
+        assert json.loads((tmp_path / "out" / "context.json").read_text()) == []
+
+    def test_evicted_shards_are_appended(self, engineering_data_context, tmp_path, monkeypatch):
+        monkeypatch.setattr(engineering_data_context.ContextExporter, "MAX_OPEN_SHARDS", 1)
+        exporter = engineering_data_context.ContextExporter(tmp_path / "out", tmp_path)
+        DataContext = engineering_data_context.DataContext
+        for i in range(6):
+            folder = "a" if i % 2 else "b"
+            exporter.add(DataContext(path=str(tmp_path / folder / f"{i}.csv"), type="file",
+                                     name=f"{i}.csv", description="", metadata={},
+                                     content_hash="", data_schema=None, related_docs=[],
+                                     web_research=None, last_updated="", tags=[],
+                                     module_assignment=None))
+        manifest = exporter.close()
+
+        for shard in manifest["shards"]:
+            assert len(read_jsonl(tmp_path / "out" / shard["jsonl"])) == shard["count"] == 3
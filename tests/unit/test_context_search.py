@@ -0,0 +1,101 @@
+"""
+Unit tests for FTS5-backed context search in engineering_data_context.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def generator(generator):
+    if not generator.fts_enabled:
+        pytest.skip("SQLite built without FTS5")
+    return generator
+
+
+def make_context(engineering_data_context, path, name, description="", tags=(),
+                 data_type="tabular_data", size=100, context_type="file", module=None):
+    return engineering_data_context.DataContext(
+        path=path, type=context_type, name=name, description=description,
+        metadata={"data_type": data_type, "size_bytes": size}, content_hash="h",
+        data_schema=None, related_docs=[], web_research=None, last_updated="2026-01-01",
+        tags=list(tags), module_assignment=module
+    )
+
+
+@pytest.fixture
+def stored(generator, engineering_data_context):
+    contexts = [
+        make_context(engineering_data_context, "/d/riser_fatigue.csv", "riser_fatigue.csv",
+                     "Fatigue damage per hotspot", ["tabular_data"], size=500, module="fatigue"),
+        make_context(engineering_data_context, "/d/mooring.json", "mooring.json",
+                     "Mooring line tension for the riser hang-off", ["structured_data"],
+                     data_type="structured_data", size=50),
+        make_context(engineering_data_context, "/d/risers", "risers", "Folder of riser data",
+                     ["tabular_data"], data_type=None, size=None, context_type="folder"),
+        make_context(engineering_data_context, "/d/waves.csv", "waves.csv", "Wave scatter",
+                     ["tabular_data"], size=5000, module="metocean"),
+    ]
+    generator._save_contexts(contexts)
+    return contexts
+
+
+def paths(result):
+    return [r["path"] for r in result["results"]]
+
+
+class TestQueryContext:
+    """Prefix search ranked by BM25 with facet filters and paging."""
+
+    def test_prefix_terms_rank_name_matches_first(self, generator, stored):
+        result = generator.query_context("rise")
+
+        assert set(paths(result)) == {"/d/riser_fatigue.csv", "/d/mooring.json", "/d/risers"}
+        assert paths(result)[-1] == "/d/mooring.json"  # description-only match
+        assert result["total"] == 3
+
+    def test_all_terms_must_match(self, generator, stored):
+        assert paths(generator.query_context("riser tension")) == ["/d/mooring.json"]
+
+    def test_facet_filters(self, generator, stored):
+        assert paths(generator.query_context("", context_type="folder")) == ["/d/risers"]
+        assert paths(generator.query_context("", module="metocean")) == ["/d/waves.csv"]
+        assert set(paths(generator.query_context("", data_type="tabular_data"))) == \
+            {"/d/riser_fatigue.csv", "/d/waves.csv"}
+        assert paths(generator.query_context("riser", min_size=100, max_size=1000)) == \
+            ["/d/riser_fatigue.csv"]
+
+    def test_paging_reports_the_total(self, generator, stored):
+        first = generator.query_context("", limit=3)
+        second = generator.query_context("", limit=3, offset=3)
+
+        assert first["total"] == second["total"] == 4
+        assert (first["count"], second["count"]) == (3, 1)
+        assert not set(paths(first)) & set(paths(second))
+
+    def test_facet_counts(self, generator, stored):
+        facets = generator.query_context("", include_facets=True)["facets"]
+
+        assert facets["type"] == {"file": 3, "folder": 1}
+        assert facets["data_type"]["tabular_data"] == 2
+
+    def test_upserts_and_deletes_keep_the_index_in_sync(self, generator, engineering_data_context,
+                                                        stored):
+        generator._save_contexts([make_context(engineering_data_context, "/d/waves.csv",
+                                               "waves.csv", "Swell spectra")])
+        generator._prune_contexts(["/d/mooring.json"])
+
+        assert paths(generator.query_context("swell")) == ["/d/waves.csv"]
+        assert paths(generator.query_context("scatter")) == []
+        assert paths(generator.query_context("tension")) == []
+
+    def test_missing_index_is_rebuilt_on_open(self, generator, engineering_data_context,
+                                              stored, tmp_path):
+        generator.store.execute("DROP TABLE data_context_fts")
+        reopened = engineering_data_context.EngineeringDataContextGenerator(base_path=tmp_path)
+
+        assert paths(reopened.query_context("hotspot")) == ["/d/riser_fatigue.csv"]
+
+    def test_like_fallback_without_fts(self, generator, stored):
+        generator.fts_enabled = False
+
+        assert paths(generator.query_context("hang-off")) == ["/d/mooring.json"]
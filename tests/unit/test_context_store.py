@@ -0,0 +1,88 @@
+"""
+Unit tests for the pooled WAL-mode ContextStore in engineering_data_context.
+"""
+
+import pickle
+import sqlite3
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def store(engineering_data_context, tmp_path):
+    store = engineering_data_context.ContextStore(tmp_path / "context.db", chunk_size=3)
+    store.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)")
+    yield store
+    store.close()
+
+
+def in_thread(function):
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=function()))
+    thread.start()
+    thread.join()
+    return result["value"]
+
+
+class TestContextStore:
+    """One tuned connection per thread, chunked bulk writes."""
+
+    def test_connection_is_tuned_and_reused(self, store):
+        conn = store.connection()
+
+        assert store.connection() is conn
+        assert store.query("PRAGMA journal_mode") == [("wal",)]
+        assert store.query("PRAGMA synchronous") == [(1,)]
+
+    def test_each_thread_has_its_own_connection(self, store):
+        other = in_thread(store.connection)
+
+        assert other is not store.connection()
+
+    def test_executemany_commits_per_chunk(self, store):
+        rows = [(i, str(i)) for i in range(7)] + [(0, "duplicate")]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.executemany("INSERT INTO items VALUES (?, ?)", iter(rows))
+        # The first two chunks of three committed; the failing chunk rolled back
+        assert store.query("SELECT COUNT(*) FROM items") == [(6,)]
+
+    def test_executemany_returns_row_count(self, store):
+        assert store.executemany("INSERT INTO items VALUES (?, ?)",
+                                 ((i, str(i)) for i in range(10))) == 10
+
+    def test_readers_are_not_blocked_by_a_writer(self, store):
+        store.execute("INSERT INTO items VALUES (1, 'committed')")
+        with store.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES (2, 'pending')")
+            seen = in_thread(lambda: store.query("SELECT value FROM items ORDER BY id"))
+
+        assert seen == [("committed",)]
+        assert store.query("SELECT COUNT(*) FROM items") == [(2,)]
+
+    def test_pickling_drops_connections(self, engineering_data_context, store):
+        store.connection()
+        copy = pickle.loads(pickle.dumps(store))
+
+        assert getattr(copy._local, "conn", None) is None
+        assert copy.query("SELECT COUNT(*) FROM items") == [(0,)]
+        copy.close()
+
+
+class TestGeneratorStorage:
+    """Contexts round-trip through the store."""
+
+    def test_save_load_and_prune(self, engineering_data_context, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        generator = engineering_data_context.EngineeringDataContextGenerator(base_path=tmp_path)
+        root = tmp_path / "data"
+        root.mkdir()
+        for i in range(5):
+            (root / f"run{i}.csv").write_text(f"t,v\n{i},{i}\n")
+        generator.generate_context(root)
+
+        paths = [c.path for c in generator._load_contexts(root)]
+        assert len(paths) == 6
+        assert generator._prune_contexts(paths[:2]) == 2
+        assert [c.path for c in generator._load_contexts(root)] == paths[2:]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the streaming iter_context API in engineering_data_context.
+"""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    root = tmp_path / "data"
+    root.mkdir()
+    for i in range(10):
+        (root / f"run_{i}.csv").write_text("x,y\n1,2\n")
+    return root
+
+
+class TestIterContext:
+    """Contexts are yielded, saved and exported in micro-batches."""
+
+    def test_yields_every_context(self, generator, data_folder):
+        contexts = list(generator.iter_context(data_folder))
+
+        assert len(contexts) == 11
+        assert {c.path for c in contexts} == {c.path for c in generator._load_contexts(data_folder)}
+
+    def test_completed_batches_survive_an_abandoned_scan(self, generator, data_folder,
+                                                         monkeypatch):
+        monkeypatch.setattr(type(generator), "BATCH_SIZE", 3)
+        stream = generator.iter_context(data_folder)
+        first = [next(stream) for _ in range(4)]
+        stream.close()
+
+        stored = {c.path for c in generator._load_contexts(data_folder)}
+        assert {c.path for c in first} <= stored
+        assert len(stored) < 11
+
+    def test_abandoned_scan_keeps_the_previous_export(self, generator, data_folder,
+                                                      monkeypatch):
+        generator.generate_context(data_folder)
+        out = generator._export_dir(data_folder)
+        exported = (out / "context.json").read_text()
+        (data_folder / "run_10.csv").write_text("x,y\n1,2\n")
+        monkeypatch.setattr(type(generator), "BATCH_SIZE", 3)
+
+        for i, _ in enumerate(generator.iter_context(data_folder)):
+            if i == 4:
+                break
+
+        assert (out / "context.json").read_text() == exported
+        assert len(json.loads(exported)) == 11
+        manifest = json.loads((out / "manifest.json").read_text())
+        assert all((out / shard["jsonl"]).exists() for shard in manifest["shards"])
+        assert [p.name for p in out.parent.iterdir()] == [out.name]
+
+    def test_failed_scan_discards_the_partial_export(self, generator, data_folder,
+                                                     monkeypatch):
+        def failing(contexts):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(generator, "_save_contexts", failing)
+        with pytest.raises(OSError):
+            list(generator.iter_context(data_folder))
+
+        exports = generator._export_dir(data_folder).parent
+        assert not exports.exists() or list(exports.iterdir()) == []
+
+    def test_missing_folder_raises(self, generator, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            list(generator.iter_context(tmp_path / "missing"))
+
+    def test_progress_events(self, generator, data_folder, monkeypatch):
+        monkeypatch.setattr(type(generator), "PROGRESS_INTERVAL", 0.0)
+        events = []
+        generator.generate_context(data_folder, on_progress=lambda p: events.append(
+            (p.files, p.folders, p.bytes_hashed, p.done)))
+
+        assert events[-1] == (10, 1, 10 * len("x,y\n1,2\n"), True)
+        assert all(not done for *_, done in events[:-1])
+
+    def test_eta_uses_previous_scan(self, generator, data_folder, monkeypatch):
+        monkeypatch.setattr(type(generator), "PROGRESS_INTERVAL", 0.0)
+        generator.generate_context(data_folder)
+        events = []
+        generator.generate_context(data_folder, on_progress=events.append)
+
+        assert events[0].expected_items == 11
+        assert events[-1].eta == 0.0
+
+
+class TestScanProgress:
+
+    def test_eta_unknown_without_previous_scan(self, engineering_data_context):
+        progress = engineering_data_context.ScanProgress(files=5, elapsed=1.0)
+
+        assert progress.eta is None
+        assert progress.files_per_sec == 5.0
+        assert "ETA unknown" in progress.format()
+
+    def test_eta_scales_with_remaining_items(self, engineering_data_context):
+        progress = engineering_data_context.ScanProgress(files=10, elapsed=2.0, expected_items=40)
+
+        assert progress.eta == pytest.approx(6.0)
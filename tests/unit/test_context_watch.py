@@ -0,0 +1,201 @@
+"""
+Unit tests for watch mode (refresh_paths, event sources, debouncing) in engineering_data_context.
+"""
+
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def make_generator(module, base):
+    base.mkdir(exist_ok=True)
+    return module.EngineeringDataContextGenerator(base_path=base)
+
+
+@pytest.fixture
+def generator(engineering_data_context, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return make_generator(engineering_data_context, tmp_path / "watched")
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    root = tmp_path / "data"
+    (root / "runs" / "deep").mkdir(parents=True)
+    (root / "logs").mkdir()
+    (root / ".cache").mkdir()
+    (root / "a.csv").write_text("x,y\n1,2\n")
+    (root / "runs" / "b.csv").write_text("x\n1\n")
+    (root / "runs" / "deep" / "c.json").write_text('{"x": 1}')
+    (root / "logs" / "d.csv").write_text("x\n1\n")
+    return root
+
+
+def stored(generator, folder):
+    """Stored contexts by path, without the timestamp that always differs."""
+    return {c.path: (c.type, c.description, c.metadata, c.content_hash, c.data_schema,
+                     sorted(c.tags), c.fingerprint)
+            for c in generator._load_contexts(folder)}
+
+
+def full_scan(engineering_data_context, tmp_path, folder):
+    reference = make_generator(engineering_data_context, tmp_path / "reference")
+    reference.generate_context(folder)
+    return stored(reference, folder)
+
+
+class TestRefreshPaths:
+    """Refreshing changed paths leaves the store as a full rescan would."""
+
+    def test_modified_added_and_deleted_files(self, engineering_data_context, generator,
+                                              data_folder, tmp_path):
+        generator.generate_context(data_folder)
+        (data_folder / "runs" / "deep" / "c.json").write_text('{"x": 1, "y": [1, 2]}')
+        (data_folder / "logs" / "e.csv").write_text("a,b,c\n1,2,3\n")
+        (data_folder / "a.csv").unlink()
+        (data_folder / "logs" / "notes.txt").write_text("not data")
+
+        result = generator.refresh_paths(data_folder, [
+            data_folder / "runs" / "deep" / "c.json", data_folder / "logs" / "e.csv",
+            data_folder / "a.csv", data_folder / "logs" / "notes.txt"])
+
+        assert result == {"updated": 2, "folders": 4, "removed": 1}
+        assert stored(generator, data_folder) == full_scan(engineering_data_context, tmp_path,
+                                                           data_folder)
+
+    def test_new_and_deleted_directories(self, engineering_data_context, generator,
+                                         data_folder, tmp_path):
+        generator.generate_context(data_folder)
+        (data_folder / "new" / "inner").mkdir(parents=True)
+        (data_folder / "new" / "inner" / "f.csv").write_text("x\n1\n")
+        shutil.rmtree(data_folder / "runs")
+
+        generator.refresh_paths(data_folder, [data_folder / "new", data_folder / "runs"])
+
+        assert stored(generator, data_folder) == full_scan(engineering_data_context, tmp_path,
+                                                           data_folder)
+        assert not any("runs" in path for path in stored(generator, data_folder))
+
+    def test_hidden_and_outside_paths_are_ignored(self, generator, data_folder, tmp_path):
+        generator.generate_context(data_folder)
+        (data_folder / ".cache" / "x.csv").write_text("x\n1\n")
+        outside = tmp_path / "elsewhere.csv"
+        outside.write_text("x\n1\n")
+
+        result = generator.refresh_paths(data_folder, [data_folder / ".cache" / "x.csv", outside])
+
+        assert result == {"updated": 0, "folders": 0, "removed": 0}
+
+    def test_relative_folder_updates_the_scanned_rows(self, engineering_data_context,
+                                                      generator, data_folder, tmp_path):
+        relative = Path("data")
+        generator.generate_context(relative)
+        rows = set(stored(generator, data_folder))
+        (data_folder / "a.csv").write_text("x,y,z\n1,2,3\n")
+        (data_folder / "runs" / "b.csv").unlink()
+
+        generator.refresh_paths(relative, [relative / "a.csv", relative / "runs" / "b.csv"])
+
+        assert set(stored(generator, data_folder)) == rows - {str(data_folder / "runs" / "b.csv")}
+        assert stored(generator, data_folder) == full_scan(engineering_data_context, tmp_path,
+                                                           data_folder)
+
+
+class FakeSource:
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.closed = False
+
+    def poll(self, timeout):
+        return self.batches.pop(0) if self.batches else set()
+
+    def close(self):
+        self.closed = True
+
+
+class TestContextWatcher:
+
+    def test_bursts_are_debounced_into_one_batch(self, engineering_data_context, generator,
+                                                 data_folder):
+        generator.generate_context(data_folder)
+        applied = []
+        source = FakeSource([{data_folder / "a.csv"}, {data_folder / "logs" / "d.csv"}])
+        watcher = engineering_data_context.ContextWatcher(generator, data_folder, source=source,
+                                                          debounce=0.0)
+        watcher.apply = lambda paths: (applied.append(set(paths)),
+                                       setattr(watcher, "batches", watcher.batches + 1))
+
+        watcher.run(max_batches=1)
+
+        assert applied == [{data_folder / "a.csv"}]
+        assert source.closed
+
+    def test_stop_flushes_pending_changes(self, engineering_data_context, generator,
+                                          data_folder):
+        generator.generate_context(data_folder)
+        (data_folder / "a.csv").write_text("x,y,z\n1,2,3\n")
+        stop = threading.Event()
+
+        class StoppingSource(FakeSource):
+            def poll(self, timeout):
+                stop.set()
+                return {data_folder / "a.csv"}
+
+        watcher = engineering_data_context.ContextWatcher(
+            generator, data_folder, source=StoppingSource([]), debounce=60.0)
+        watcher.run(stop=stop)
+
+        context = next(c for c in generator._load_contexts(data_folder) if c.name == "a.csv")
+        assert context.data_schema["columns"] == ["x", "y", "z"]
+
+
+class TestEventSources:
+
+    def test_polling_source_reports_changes(self, engineering_data_context, data_folder):
+        source = engineering_data_context.PollingEventSource(data_folder, interval=0.0)
+        (data_folder / "logs" / "d.csv").write_text("x\n1\n2\n")
+        (data_folder / "new").mkdir()
+        (data_folder / "a.csv").unlink()
+
+        changed = source.poll(0.0)
+
+        assert changed == {data_folder / "logs" / "d.csv", data_folder / "new",
+                           data_folder / "a.csv"}
+        assert source.poll(0.0) == set()
+
+    def test_relative_watch_refreshes_stored_rows(self, engineering_data_context, generator,
+                                                  data_folder):
+        relative = Path("data")
+        generator.generate_context(relative, incremental=True)
+        rows = set(stored(generator, data_folder))
+        source = engineering_data_context.PollingEventSource(relative, interval=0.0)
+        watcher = engineering_data_context.ContextWatcher(generator, relative, source=source,
+                                                          debounce=0.0)
+        (data_folder / "logs" / "d.csv").write_text("x,y\n1,2\n")
+
+        watcher.apply(source.poll(0.0))
+
+        assert set(stored(generator, data_folder)) == rows
+        context = next(c for c in generator._load_contexts(relative) if c.name == "d.csv")
+        assert context.data_schema["columns"] == ["x", "y"]
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_source_reports_changes(self, engineering_data_context, data_folder):
+        try:
+            source = engineering_data_context.InotifyEventSource(data_folder)
+        except OSError as e:
+            pytest.skip(f"inotify unavailable: {e}")
+        try:
+            (data_folder / "runs" / "deep" / "c.json").write_text('{"y": 2}')
+            (data_folder / "fresh").mkdir()
+            changed = source.poll(1.0)
+            (data_folder / "fresh" / "g.csv").write_text("x\n1\n")
+            changed |= source.poll(1.0)
+        finally:
+            source.close()
+
+        assert {data_folder / "runs" / "deep" / "c.json", data_folder / "fresh",
+                data_folder / "fresh" / "g.csv"} <= changed
@@ -0,0 +1,95 @@
+"""
+Unit tests for single-pass CSV schema extraction in engineering_data_context.
+"""
+
+import sys
+
+import pytest
+
+CSV = (
+    'i,f,na,date,thousands,quoted,flag,flag_na,text,underscored,all_na,signed,padded\n'
+    '1,1.5,1,2024-01-01,"1,234","12",True,True,x,1_000,,-3, 4\n'
+    '2,2,,2024-01-02,"2,000","13",False,,y,2_000,NA,+4, 5\n'
+    '3,NaN,NA,2024-01-03,"3,000","14",true,False,z,3,null,5,6\n'
+)
+
+# The dtypes pandas.read_csv reports for CSV (string columns as object)
+PANDAS_DTYPES = {
+    'i': 'int64', 'f': 'float64', 'na': 'float64', 'date': 'object', 'thousands': 'object',
+    'quoted': 'int64', 'flag': 'bool', 'flag_na': 'object', 'text': 'object',
+    'underscored': 'object', 'all_na': 'float64', 'signed': 'int64', 'padded': 'int64'
+}
+
+
+@pytest.fixture
+def without_pandas(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pandas", None)
+
+
+class TestCsvDtypes:
+    """Columns and dtypes match what pandas reports."""
+
+    def test_fallback_matches_pandas_dtypes(self, generator, tmp_path, without_pandas):
+        path = tmp_path / "table.csv"
+        path.write_text(CSV)
+        schema = generator._extract_csv_schema(path)
+
+        assert schema["columns"] == list(PANDAS_DTYPES)
+        assert schema["dtypes"] == PANDAS_DTYPES
+        assert schema["row_count"] == 3
+
+    def test_short_rows_count_as_missing(self, generator, without_pandas):
+        schema = generator._sniff_csv_header(b"a,b\n1,2\n3\n")
+
+        assert schema["dtypes"] == {"a": "int64", "b": "float64"}
+
+    def test_delimiter_is_sniffed(self, generator, without_pandas):
+        schema = generator._sniff_csv_header(b"time;load\n0;1.5\n1;2.5\n")
+
+        assert schema["delimiter"] == ";"
+        assert schema["dtypes"] == {"time": "int64", "load": "float64"}
+
+    def test_pandas_is_used_when_installed(self, generator, tmp_path):
+        pd = pytest.importorskip("pandas")
+        path = tmp_path / "table.csv"
+        path.write_text(CSV)
+        expected = {col: str(dtype) for col, dtype in pd.read_csv(path, nrows=5).dtypes.items()}
+
+        assert generator._extract_csv_schema(path)["dtypes"] == expected
+        assert {col: "object" if dtype == "str" else dtype for col, dtype in expected.items()} == \
+            PANDAS_DTYPES
+
+
+class TestCsvRowCount:
+    """Rows are counted from the same binary handle as the header."""
+
+    @pytest.mark.parametrize("content,rows", [
+        ("a,b\n1,2\n3,4\n", 2),
+        ("a,b\n1,2\n3,4", 2),
+        ("a,b\n", 0),
+        ("", 0),
+    ])
+    def test_exact_count(self, generator, tmp_path, content, rows):
+        path = tmp_path / "table.csv"
+        path.write_text(content)
+
+        assert generator._extract_csv_schema(path)["row_count"] == rows
+
+    def test_count_spans_read_buffers(self, generator, tmp_path):
+        path = tmp_path / "table.csv"
+        path.write_text("a,b\n" + "12345,67890\n" * 200_000)
+
+        schema = generator._extract_csv_schema(path)
+        assert schema["row_count"] == 200_000
+        assert "row_count_estimated" not in schema
+
+    def test_estimate_mode_samples_large_files(self, engineering_data_context, tmp_path):
+        generator = engineering_data_context.EngineeringDataContextGenerator(
+            base_path=tmp_path, row_count_mode="estimate", row_estimate_threshold=1024
+        )
+        path = tmp_path / "table.csv"
+        path.write_text("a,b\n" + "12345,67890\n" * 200_000)
+
+        schema = generator._extract_csv_schema(path)
+        assert schema["row_count_estimated"] is True
+        assert abs(schema["row_count"] - 200_000) < 200
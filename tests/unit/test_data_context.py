@@ -0,0 +1,82 @@
+"""
+Unit tests for the compact DataContext representation in engineering_data_context.
+"""
+
+import json
+import pickle
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def make_context(engineering_data_context):
+    def make(**overrides):
+        values = dict(path="/data/a.csv", type="file", name="a.csv", description="A",
+                      metadata={"size_bytes": 3}, content_hash="h", data_schema=None,
+                      related_docs=[], web_research=None, last_updated="t",
+                      tags=["data", "tabular_data"], module_assignment=None, fingerprint="f")
+        values.update(overrides)
+        return engineering_data_context.DataContext(**values)
+    return make
+
+
+def stored_row(metadata='{"size_bytes": 3}', tags='["tabular_data"]'):
+    return ("/data/a.csv", "file", "a.csv", "A", metadata, "h", None, "[]", None, "t", tags,
+            "pipeline", "f")
+
+
+class TestDataContext:
+    """Contexts are slotted, intern repeated strings and decode JSON lazily."""
+
+    def test_has_no_instance_dict(self, make_context):
+        context = make_context()
+
+        assert not hasattr(context, "__dict__")
+        with pytest.raises(AttributeError):
+            context.unknown = 1
+
+    def test_repeated_strings_are_interned(self, make_context):
+        tag = "".join(["tabular", "_data"])
+        first, second = make_context(tags=[tag]), make_context(tags=["tabular_data"])
+
+        assert first.tags[0] is second.tags[0] is sys.intern("tabular_data")
+
+    def test_rows_decode_json_on_first_access(self, engineering_data_context):
+        context = engineering_data_context.DataContext.from_row(stored_row())
+
+        assert set(context._raw) == {"metadata", "data_schema", "related_docs",
+                                     "web_research", "tags"}
+        assert context.metadata == {"size_bytes": 3}
+        assert "metadata" not in context._raw
+        assert context.data_schema is None
+        assert context.web_research is None
+        assert context.tags == ["tabular_data"]
+        assert context.module_assignment == "pipeline"
+
+    def test_unchanged_columns_are_not_reencoded(self, engineering_data_context):
+        metadata = '{"size_bytes":3}'  # not json.dumps formatting
+        context = engineering_data_context.DataContext.from_row(stored_row(metadata=metadata))
+
+        assert context.json_column("metadata") is metadata
+        context.metadata["size_bytes"] = 4
+        assert json.loads(context.json_column("metadata")) == {"size_bytes": 4}
+
+    def test_row_round_trip(self, engineering_data_context, make_context):
+        DataContext = engineering_data_context.DataContext
+        context = make_context(data_schema={"columns": ["x"]}, module_assignment="pipeline")
+        row = (context.path, context.type, context.name, context.description,
+               context.json_column("metadata"), context.content_hash,
+               context.json_column("data_schema"), context.json_column("related_docs"),
+               context.json_column("web_research"), context.last_updated,
+               context.json_column("tags"), context.module_assignment, context.fingerprint)
+
+        assert DataContext.from_row(row) == context
+
+    def test_pickles_with_undecoded_columns(self, engineering_data_context):
+        context = engineering_data_context.DataContext.from_row(stored_row())
+
+        restored = pickle.loads(pickle.dumps(context))
+
+        assert restored == context
+        assert restored.tags == ["tabular_data"]
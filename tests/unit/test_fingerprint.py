@@ -0,0 +1,117 @@
+"""
+Unit tests for content fingerprinting in engineering_data_context.
+"""
+
+import hashlib
+import pickle
+import sys
+
+import pytest
+
+BLOCK = 1024
+
+
+@pytest.fixture
+def fingerprint(engineering_data_context):
+    def make(**options):
+        return engineering_data_context.ContentFingerprinter(**options)
+    return make
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    path = tmp_path / "results.op2"
+    path.write_bytes(bytes(range(256)) * 64)  # 16 KiB
+    return path
+
+
+def flip(path, offset):
+    data = bytearray(path.read_bytes())
+    data[offset] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+
+class TestContentFingerprinter:
+
+    def test_full_strategy_matches_hashlib(self, fingerprint, big_file):
+        fp = fingerprint(algorithm="md5", strategy="full", block_size=BLOCK, stride=BLOCK)
+
+        assert fp.hash_file(big_file) == hashlib.md5(big_file.read_bytes()).hexdigest()
+
+    def test_blake2b_digest(self, fingerprint, big_file):
+        fp = fingerprint(algorithm="blake2b", strategy="full")
+        expected = hashlib.blake2b(big_file.read_bytes(), digest_size=16).hexdigest()
+
+        assert fp.hash_file(big_file) == expected
+
+    def test_sampled_strategy_reads_only_strided_blocks(self, fingerprint, big_file):
+        fp = fingerprint(algorithm="blake2b", strategy="sampled", block_size=BLOCK,
+                         stride=4 * BLOCK)
+        before = fp.hash_file(big_file)
+
+        flip(big_file, 2 * BLOCK)  # between sampled blocks
+        assert fp.hash_file(big_file) == before
+
+        flip(big_file, 4 * BLOCK + 10)  # inside a sampled block
+        assert fp.hash_file(big_file) != before
+
+    def test_sampled_strategy_covers_last_block_and_size(self, fingerprint, big_file):
+        fp = fingerprint(algorithm="blake2b", strategy="sampled", block_size=BLOCK,
+                         stride=4 * BLOCK)
+        before = fp.hash_file(big_file)
+
+        flip(big_file, 16 * BLOCK - 1)
+        changed = fp.hash_file(big_file)
+        assert changed != before
+
+        with open(big_file, "ab") as f:
+            f.write(b"\0")
+        assert fp.hash_file(big_file) != changed
+
+    def test_auto_strategy_samples_above_threshold(self, fingerprint, big_file):
+        small = fingerprint(algorithm="blake2b", block_size=BLOCK, stride=4 * BLOCK,
+                            full_threshold=32 * BLOCK)
+        large = fingerprint(algorithm="blake2b", block_size=BLOCK, stride=4 * BLOCK,
+                            full_threshold=8 * BLOCK)
+
+        assert small.hash_file(big_file) == fingerprint(algorithm="blake2b").hash_file(big_file)
+        flip(big_file, 2 * BLOCK)
+        assert small.hash_file(big_file) != large.hash_file(big_file)
+
+    def test_auto_algorithm_falls_back_to_blake2b(self, fingerprint, monkeypatch):
+        monkeypatch.setitem(sys.modules, "xxhash", None)
+        monkeypatch.setitem(sys.modules, "blake3", None)
+
+        assert fingerprint().algorithm == "blake2b"
+        with pytest.raises(ImportError):
+            fingerprint(algorithm="xxh3")
+
+    def test_invalid_options(self, fingerprint):
+        with pytest.raises(ValueError):
+            fingerprint(algorithm="sha1")
+        with pytest.raises(ValueError):
+            fingerprint(strategy="edges")
+        with pytest.raises(ValueError):
+            fingerprint(block_size=4096, stride=1024)
+
+    def test_pickles_for_worker_processes(self, fingerprint, big_file):
+        fp = fingerprint(algorithm="blake2b", strategy="sampled", block_size=BLOCK,
+                         stride=2 * BLOCK)
+
+        restored = pickle.loads(pickle.dumps(fp))
+
+        assert restored.hash_file(big_file) == fp.hash_file(big_file)
+
+
+class TestGeneratorHashing:
+
+    def test_generator_uses_configured_fingerprinter(self, engineering_data_context, tmp_path,
+                                                     monkeypatch, big_file):
+        monkeypatch.chdir(tmp_path)
+        fp = engineering_data_context.ContentFingerprinter(algorithm="md5", strategy="full")
+        generator = engineering_data_context.EngineeringDataContextGenerator(
+            base_path=tmp_path, fingerprinter=fp)
+
+        assert generator._generate_file_hash(big_file) == hashlib.md5(
+            big_file.read_bytes()).hexdigest()
+        assert len(generator._generate_folder_hash([("a", 1, 2)], [])) == 32
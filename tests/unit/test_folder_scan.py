@@ -0,0 +1,67 @@
+"""
+Unit tests for the single-pass bottom-up folder scan in engineering_data_context.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "data"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / ".hidden").mkdir()
+    (root / "top.csv").write_text("x\n1\n")
+    (root / "a" / "mid.json").write_text('{"k": 1}')
+    (root / "a" / "b" / "deep.csv").write_text("y\n2\n3\n")
+    (root / ".hidden" / "skip.csv").write_text("z\n")
+    return root
+
+
+def scan(generator, root):
+    return list(generator._scan_tree(root))
+
+
+class TestScanTree:
+    """Files are listed once and folders roll up after their subtrees."""
+
+    def test_folders_follow_their_subtrees(self, generator, tree):
+        order = [path for kind, path, _ in scan(generator, tree) if kind == "folder"]
+
+        assert order == [tree / "a" / "b", tree / "a", tree]
+
+    def test_each_file_is_yielded_once_and_hidden_folders_are_skipped(self, generator, tree):
+        files = [path for kind, path, _ in scan(generator, tree) if kind == "file"]
+
+        assert sorted(files) == sorted([tree / "top.csv", tree / "a" / "mid.json",
+                                        tree / "a" / "b" / "deep.csv"])
+
+    def test_sizes_roll_up_to_parents(self, generator, tree):
+        folders = {path: info for kind, path, info in scan(generator, tree) if kind == "folder"}
+        sizes = {name: (tree / name).stat().st_size
+                 for name in ("top.csv", "a/mid.json", "a/b/deep.csv")}
+
+        assert folders[tree / "a" / "b"].total_size_bytes == sizes["a/b/deep.csv"]
+        assert folders[tree / "a"].total_size_bytes == sizes["a/mid.json"] + sizes["a/b/deep.csv"]
+        assert folders[tree].total_size_bytes == sum(sizes.values())
+        assert folders[tree].item_count == 3
+        assert sorted(folders[tree].subdirectories) == [".hidden", "a"]
+        assert folders[tree].data_types == ["tabular_data"]
+
+    def test_nested_change_propagates_to_every_ancestor_hash(self, generator, tree):
+        before = {path: info.content_hash for kind, path, info in scan(generator, tree)
+                  if kind == "folder"}
+        (tree / "a" / "b" / "deep.csv").write_text("y\n2\n3\n4\n")
+        after = {path: info.content_hash for kind, path, info in scan(generator, tree)
+                 if kind == "folder"}
+
+        assert all(before[path] != after[path] for path in before)
+
+    def test_sibling_change_leaves_other_subtree_hash(self, generator, tree):
+        before = {path: info.content_hash for kind, path, info in scan(generator, tree)
+                  if kind == "folder"}
+        (tree / "top.csv").write_text("x\n1\n2\n")
+        after = {path: info.content_hash for kind, path, info in scan(generator, tree)
+                 if kind == "folder"}
+
+        assert after[tree / "a"] == before[tree / "a"]
+        assert after[tree] != before[tree]
@@ -0,0 +1,84 @@
+"""
+Unit tests for incremental rescans in engineering_data_context.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    root = tmp_path / "data"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.csv").write_text("x,y\n1,2\n")
+    (root / "sub" / "b.json").write_text('{"x": 1}')
+    (root / "notes.txt").write_text("not engineering data")
+    return root
+
+
+def counts(result):
+    return (result["contexts_updated"], result["contexts_unchanged"], result["contexts_removed"])
+
+
+class TestIncrementalRescan:
+    """Only changed files and folders are re-extracted."""
+
+    def test_unchanged_tree_is_skipped(self, generator, data_folder):
+        first = generator.generate_context(data_folder, incremental=True)
+        assert counts(first) == (4, 0, 0)
+
+        second = generator.generate_context(data_folder, incremental=True)
+        assert counts(second) == (0, 4, 0)
+        # Summaries still cover the whole folder
+        assert second["contexts_created"] == first["contexts_created"] == 4
+
+    def test_changed_file_and_its_folder_are_updated(self, generator, data_folder):
+        generator.generate_context(data_folder, incremental=True)
+        (data_folder / "sub" / "b.json").write_text('{"x": 1, "y": 2}')
+
+        result = generator.generate_context(data_folder, incremental=True)
+        # b.json, sub/ and data/ changed; a.csv did not
+        assert counts(result) == (3, 1, 0)
+
+    def test_deleted_paths_are_pruned(self, generator, data_folder):
+        generator.generate_context(data_folder)
+        (data_folder / "sub" / "b.json").unlink()
+
+        result = generator.generate_context(data_folder, incremental=True)
+        assert result["contexts_removed"] == 1
+        paths = {c.path for c in generator._load_contexts(data_folder)}
+        assert str(data_folder / "sub" / "b.json") not in paths
+        assert str(data_folder / "a.csv") in paths
+
+    def test_fingerprint_column_is_migrated(self, engineering_data_context, tmp_path):
+        db_dir = tmp_path / ".agent-os" / "data-context"
+        db_dir.mkdir(parents=True)
+        conn = sqlite3.connect(db_dir / "context.db")
+        conn.execute("CREATE TABLE data_context (path TEXT PRIMARY KEY, type TEXT, name TEXT, "
+                     "description TEXT, metadata TEXT, content_hash TEXT, data_schema TEXT, "
+                     "related_docs TEXT, web_research TEXT, last_updated TEXT, tags TEXT, "
+                     "module_assignment TEXT)")
+        conn.commit()
+        conn.close()
+
+        engineering_data_context.EngineeringDataContextGenerator(base_path=tmp_path)
+        conn = sqlite3.connect(db_dir / "context.db")
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(data_context)")}
+        conn.close()
+        assert "fingerprint" in columns
+
+    def test_relative_folder_matches_earlier_scans(self, generator, data_folder,
+                                                   monkeypatch):
+        monkeypatch.chdir(data_folder)
+        generator.generate_context(Path("."), incremental=True)
+        (data_folder / "sub" / "b.json").unlink()
+
+        result = generator.generate_context(Path("."), incremental=True)
+
+        # a.csv is unchanged; b.json is pruned and sub/ and data/ re-aggregated
+        assert counts(result) == (2, 1, 1)
+        paths = {c.path for c in generator._load_contexts(Path("."))}
+        assert paths == {str(data_folder), str(data_folder / "a.csv"), str(data_folder / "sub")}
+        assert counts(generator.generate_context(data_folder, incremental=True)) == (0, 3, 0)
@@ -0,0 +1,102 @@
+"""
+Unit tests for the single-pass entity and relationship extraction in create_module_agent.
+"""
+
+import re
+from collections import Counter
+
+import pytest
+
+
+TEXT = (
+    "The Riser is Steel. Riser has Tension and the riser has Tension again.\n"
+    "A Vessel contains Hull plates; Vessel CONTAINS Hull.\n"
+    "Mooring is Taut is Good. Line is is Slack.\n"
+    "McDonald had Riser0 while Anchor Has Chain.\n"
+)
+
+
+def reference(content):
+    """Entities and relations as the per-pattern findall extraction found them."""
+    entities = set(re.findall(r'\b[A-Z][a-z]+\b', content))
+    relations = []
+    for verb in ("is", "has", "contains"):
+        for source, target in re.findall(rf'(\w+)\s+{verb}\s+(\w+)', content, re.IGNORECASE):
+            relations.append((source, verb, target))
+    return entities, Counter(relations)
+
+
+def summarize(extracted):
+    entities = {e["name"]: e["count"] for e in extracted["entities"]}
+    relations = Counter({(r["source"], r["predicate"], r["target"]): r["count"]
+                         for r in extracted["relationships"]})
+    return entities, relations
+
+
+@pytest.fixture
+def processor(create_module_agent, tmp_path):
+    return create_module_agent.PhasedDocumentProcessor(tmp_path / "agent")
+
+
+class TestExtractKnowledge:
+    """One scan finds what the separate entity and relation patterns found."""
+
+    def test_matches_separate_patterns(self, processor, tmp_path):
+        doc = tmp_path / "spec.md"
+        doc.write_text(TEXT)
+
+        entities, relations = summarize(processor._extract_knowledge(doc))
+
+        expected_entities, expected_relations = reference(TEXT)
+        assert set(entities) == expected_entities
+        assert relations == expected_relations
+        assert ("Taut", "is", "Good") not in relations
+        assert ("Line", "is", "is") in relations
+
+    def test_repeats_are_counted_once(self, processor, tmp_path):
+        doc = tmp_path / "spec.md"
+        doc.write_text(TEXT * 3)
+
+        extracted = processor._extract_knowledge(doc)
+
+        names = [e["name"] for e in extracted["entities"]]
+        assert len(names) == len(set(names))
+        assert names[:3] == ["The", "Riser", "Steel"]
+        entities, relations = summarize(extracted)
+        assert entities["Riser"] == 3 * TEXT.count("Riser ")
+        assert relations[("Riser", "has", "Tension")] == 3
+        assert relations[("Vessel", "contains", "Hull")] == 6
+        assert all(e["source"] == str(doc) and e["confidence"] == 0.7
+                   for e in extracted["entities"])
+        assert all(r["type"] == "related" and r["confidence"] == 0.6
+                   for r in extracted["relationships"])
+
+    @pytest.mark.parametrize("block_size", [1, 7, 64, 4096])
+    def test_block_boundaries_do_not_change_results(self, processor, tmp_path, monkeypatch,
+                                                    block_size):
+        content = (TEXT + "Über is Größe. ") * 40
+        doc = tmp_path / "spec.md"
+        doc.write_text(content, encoding="utf-8")
+        monkeypatch.setattr(processor, "TEXT_BLOCK_SIZE", block_size)
+
+        entities, relations = summarize(processor._extract_knowledge(doc))
+
+        expected_entities, expected_relations = reference(content)
+        assert set(entities) == expected_entities
+        assert relations == expected_relations
+        assert entities["Riser"] == len(re.findall(r'\bRiser\b', content))
+
+    def test_mapped_blocks_match_read_blocks(self, processor, tmp_path, monkeypatch):
+        doc = tmp_path / "spec.md"
+        doc.write_text(("Größe is Über. " + TEXT) * 20, encoding="utf-8")
+        read = processor._extract_knowledge(doc)
+        monkeypatch.setattr(processor, "MMAP_THRESHOLD", 1)
+        monkeypatch.setattr(processor, "TEXT_BLOCK_SIZE", 5)
+
+        assert processor._extract_knowledge(doc) == read
+
+    def test_unreadable_document_yields_nothing(self, processor, tmp_path, capsys):
+        extracted = processor._extract_knowledge(tmp_path / "missing.md")
+
+        assert extracted == {"entities": [], "relationships": []}
+        assert "Error extracting" in capsys.readouterr().out
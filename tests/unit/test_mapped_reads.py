@@ -0,0 +1,74 @@
+"""
+Unit tests for mmap-backed reads in engineering_data_context and create_module_agent.
+"""
+
+import pytest
+
+
+class TestMappedView:
+
+    def test_view_exposes_file_contents(self, engineering_data_context, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789")
+
+        with engineering_data_context.mapped_view(path) as view:
+            assert view.readonly
+            assert view[2:5].tobytes() == b"234"
+
+    def test_small_and_empty_files_are_not_mapped(self, engineering_data_context, tmp_path):
+        small, empty = tmp_path / "small.bin", tmp_path / "empty.bin"
+        small.write_bytes(b"abc")
+        empty.write_bytes(b"")
+
+        with engineering_data_context.mapped_view(small, min_size=4) as view:
+            assert view is None
+        with engineering_data_context.mapped_view(empty) as view:
+            assert view is None
+
+
+class TestMappedHashing:
+
+    @pytest.mark.parametrize("strategy", ["full", "sampled"])
+    def test_mapped_and_buffered_hashes_match(self, engineering_data_context, tmp_path,
+                                              strategy):
+        path = tmp_path / "results.op2"
+        path.write_bytes(bytes(range(256)) * 300)
+        options = dict(algorithm="blake2b", strategy=strategy, block_size=1024, stride=4096)
+        Fingerprinter = engineering_data_context.ContentFingerprinter
+
+        mapped = Fingerprinter(mmap_threshold=0, **options).hash_file(path)
+        buffered = Fingerprinter(mmap_threshold=1 << 40, **options).hash_file(path)
+
+        assert mapped == buffered
+
+    def test_mapped_csv_estimate_matches_buffered(self, generator, tmp_path, monkeypatch):
+        path = tmp_path / "big.csv"
+        path.write_text("a,b\n" + "".join(f"{i},{i * 2}\n" for i in range(50000)))
+        generator.row_count_mode = "estimate"
+        generator.row_estimate_threshold = 0
+
+        monkeypatch.setattr(generator, "MMAP_THRESHOLD", 1 << 40)
+        buffered = generator._extract_csv_schema(path)
+        monkeypatch.setattr(generator, "MMAP_THRESHOLD", 0)
+        mapped = generator._extract_csv_schema(path)
+
+        assert mapped == buffered
+        assert mapped["row_count_estimated"]
+
+
+class TestMappedKnowledgeExtraction:
+
+    def test_mapped_read_matches_text_read(self, create_module_agent, tmp_path, monkeypatch):
+        doc = tmp_path / "guide.md"
+        doc.write_bytes("Riser has Tension\r\nThe Mooring is Taut. Café contains Bar\n"
+                        .encode("utf-8") + b"\xff")
+        processor = create_module_agent.PhasedDocumentProcessor(tmp_path / "agent")
+
+        expected = processor._extract_knowledge(doc)
+        monkeypatch.setattr(processor, "MMAP_THRESHOLD", 0)
+        mapped = processor._extract_knowledge(doc)
+
+        key = lambda e: e["name"]
+        assert sorted(mapped["entities"], key=key) == sorted(expected["entities"], key=key)
+        assert mapped["relationships"] == expected["relationships"]
+        assert {e["name"] for e in mapped["entities"]} >= {"Riser", "Tension", "Mooring"}
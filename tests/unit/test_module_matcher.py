@@ -0,0 +1,120 @@
+"""
+Unit tests for precompiled module assignment in engineering_data_context.
+"""
+
+import os
+import random
+
+import pytest
+
+MODULES = ["pipeline", "subsea_pipelines", "catalog", "Mooring", "riser", "data", "log"]
+
+
+def reference_module(modules, path, name, tags):
+    """The per-context substring loop the matcher replaces, over modules in order."""
+    for module in modules:
+        if module in path:
+            return module
+    best_score, best_module = 0, None
+    for module in modules:
+        score = 3 if module.lower() in name.lower() else 0
+        score += sum(1 for tag in tags if tag.lower() in module.lower())
+        if score > best_score:
+            best_score, best_module = score, module
+    return best_module
+
+
+@pytest.fixture
+def matcher(engineering_data_context):
+    return engineering_data_context.ModuleMatcher(MODULES)
+
+
+class TestModuleMatcher:
+    """Assignments keep the substring semantics of the original loop."""
+
+    @pytest.mark.parametrize("path,name,tags,expected", [
+        # Module names match anywhere inside a path component
+        ("/repo/subsea_pipelines/a.csv", "a.csv", [], "pipeline"),
+        ("/repo/x/my_riser_runs/b.csv", "b.csv", [], "riser"),
+        ("/repo/x/Mooring/c.csv", "c.csv", [], "Mooring"),
+        # Names contain the module name, case-insensitively
+        ("/x/y/z.csv", "Subsea_Pipelines_2024.csv", [], "pipeline"),
+        ("/x/y/z.csv", "mooring_lines.csv", [], "Mooring"),
+        # Tags contained in a module name add one point each
+        ("/x/y/z.csv", "z.csv", ["LOG"], "catalog"),
+        ("/x/y/z.csv", "z.csv", ["pipe", "sub"], "subsea_pipelines"),
+        ("/x/y/z.csv", "z.csv", ["unrelated"], None),
+    ])
+    def test_substring_matches(self, matcher, path, name, tags, expected):
+        module = matcher.module_for_path(path) or matcher.best_module(name, tags)
+
+        assert module == expected
+
+    def test_matches_reference_loop(self, matcher):
+        rng = random.Random(0)
+        words = ["pipe", "line", "subsea", "_", "s", "cat", "alog", "Mooring", "riser", "data",
+                 "lo", "g", "x", "Log"]
+
+        def word():
+            return "".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+
+        modules = sorted(MODULES)
+        for _ in range(2000):
+            path = os.sep + os.sep.join(word() for _ in range(rng.randint(1, 4)))
+            name = word()
+            tags = [word() for _ in range(rng.randint(0, 3))]
+            expected = reference_module(modules, path, name, tags)
+            assert (matcher.module_for_path(path) or matcher.best_module(name, tags)) == expected
+
+    @pytest.mark.parametrize("count", [10, 100, 1000])
+    def test_many_modules_match_reference_loop(self, engineering_data_context, count):
+        rng = random.Random(count)
+        modules = sorted({f"mod{rng.randrange(10 * count)}_{rng.choice('abc')}"
+                          for _ in range(count)})
+        matcher = engineering_data_context.ModuleMatcher(modules)
+        for i in range(200):
+            path = f"/repo/runs_{rng.choice(modules)}/file{i}.csv" if i % 3 else f"/r/f{i}.csv"
+            name, tags = f"Mod{i}_B.csv", [rng.choice(["mod1", "_c", "od2", "x"])]
+            expected = reference_module(modules, path, name, tags)
+            assert (matcher.module_for_path(path) or matcher.best_module(name, tags)) == expected
+
+    def test_comparisons_are_sublinear_in_modules(self, engineering_data_context):
+        def comparisons(count):
+            modules = [f"module_{i:05d}" for i in range(count)]
+            matcher = engineering_data_context.ModuleMatcher(modules)
+            for i in range(500):
+                matcher.module_for_path(f"/repo/runs/file{i}.csv")
+                matcher.best_module(f"file{i}.csv", ["tabular_data", "module_00007"])
+            return matcher.comparisons
+
+        small, large = comparisons(100), comparisons(10000)
+
+        # 100x the modules costs no more comparisons, and all 1000 lookups
+        # together examine fewer candidates than one pass over the modules
+        assert large < 2 * small
+        assert large < 10000
+
+
+class TestAssignToModules:
+    """Generators cache the matcher until module folders change."""
+
+    def test_assigns_and_rebuilds_after_module_changes(self, engineering_data_context, tmp_path,
+                                                       monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "specs" / "modules" / "pipeline").mkdir(parents=True)
+        generator = engineering_data_context.EngineeringDataContextGenerator(base_path=tmp_path)
+        data = tmp_path / "data"
+        data.mkdir()
+        (data / "subsea_pipelines.csv").write_text("x\n1\n")
+        (data / "riser.csv").write_text("x\n1\n")
+
+        result = generator.generate_context(data, use_modules=True)
+        assigned = {c.name: c.module_assignment for c in generator._load_contexts(data)}
+        assert assigned["subsea_pipelines.csv"] == "pipeline"
+        assert assigned["riser.csv"] is None
+        assert result["status"] == "success"
+
+        matcher = generator._module_matcher()
+        assert generator._module_matcher() is matcher
+        (tmp_path / "specs" / "modules" / "riser").mkdir()
+        assert generator._module_matcher().modules == ["pipeline", "riser"]
@@ -0,0 +1,78 @@
+"""
+Unit tests for process-pool extraction and the batched context writer.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    root = tmp_path / "data"
+    for i in range(12):
+        folder = root / f"set{i % 3}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"run{i}.csv").write_text("t,load\n" + "".join(f"{j},{j * i}\n" for j in range(i + 1)))
+        (folder / f"meta{i}.json").write_text(f'{{"run": {i}, "tags": ["a", "b"]}}')
+    return root
+
+
+def stored(generator, folder):
+    return {c.path: (c.type, c.content_hash, c.data_schema, c.metadata, c.fingerprint)
+            for c in generator._load_contexts(folder)}
+
+
+class TestParallelExtraction:
+    """A worker pool produces the same contexts as in-process extraction."""
+
+    def test_workers_match_single_process(self, generator, data_folder):
+        single = generator.generate_context(data_folder, workers=1)
+        expected = stored(generator, data_folder)
+        generator._prune_contexts(list(expected))
+
+        pooled = generator.generate_context(data_folder, workers=2)
+        assert pooled["contexts_created"] == single["contexts_created"] == len(expected)
+        assert stored(generator, data_folder) == expected
+
+    def test_unreadable_file_is_skipped(self, generator, data_folder, monkeypatch, capfd):
+        blocked = data_folder / "set0" / "run0.csv"
+        create = type(generator)._create_file_context
+
+        def create_file_context(self, file_path, stat_result=None):
+            if file_path == blocked:
+                raise PermissionError(13, "Permission denied", str(file_path))
+            return create(self, file_path, stat_result)
+
+        monkeypatch.setattr(type(generator), "_create_file_context", create_file_context)
+        result = generator.generate_context(data_folder, workers=2)
+
+        assert result["status"] == "success"
+        assert str(blocked) not in stored(generator, data_folder)
+        assert str(data_folder / "set0" / "run3.csv") in stored(generator, data_folder)
+        assert f"Warning: Could not read {blocked}" in capfd.readouterr().out
+
+
+class TestContextWriter:
+    """The writer flushes in batches and surfaces save errors."""
+
+    def test_writes_every_context_in_batches(self, engineering_data_context):
+        batches = []
+        writer = engineering_data_context.ContextWriter(lambda batch: batches.append(list(batch)),
+                                                        batch_size=3)
+        writer.start()
+        for i in range(7):
+            writer.put(i)
+        writer.close()
+
+        assert [item for batch in batches for item in batch] == list(range(7))
+        assert all(len(batch) <= 3 for batch in batches)
+        assert writer.written == 7
+
+    def test_save_error_is_raised_on_close(self, engineering_data_context):
+        def fail(batch):
+            raise RuntimeError("disk full")
+
+        writer = engineering_data_context.ContextWriter(fail, batch_size=1)
+        writer.start()
+        writer.put("context")
+        with pytest.raises(RuntimeError, match="disk full"):
+            writer.close()
@@ -0,0 +1,140 @@
+"""
+Unit tests for per-document checkpoints and resumable phases in create_module_agent.
+"""
+
+import pytest
+
+
+def write_docs(folder, start, count):
+    folder.mkdir(exist_ok=True)
+    paths = []
+    for i in range(start, start + count):
+        path = folder / f"spec_{i}.md"
+        path.write_text(f"Riser{i} has Tension{i}. The Mooring is Taut.\n")
+        paths.append(path)
+    return paths
+
+
+class Interrupted(BaseException):
+    """Stands in for Ctrl+C or a killed worker; not caught as an Exception."""
+
+
+@pytest.fixture
+def processor(create_module_agent, tmp_path):
+    return create_module_agent.PhasedDocumentProcessor(tmp_path / "agent")
+
+
+def count_extractions(processor, monkeypatch):
+    calls = []
+    process = processor._process_document
+
+    def counting(doc_path):
+        calls.append(doc_path.name)
+        return process(doc_path)
+
+    monkeypatch.setattr(processor, "_process_document", counting)
+    return calls
+
+
+def knowledge(results):
+    extraction = results["extraction"]
+    return (sorted((e["source"], e["name"]) for e in extraction["extracted_entities"]),
+            results["quality"]["high_priority"], sorted(extraction["knowledge_graph"]))
+
+
+class TestResume:
+    """Resumed runs only extract documents without a checkpoint."""
+
+    def test_only_new_documents_are_extracted(self, processor, tmp_path, monkeypatch):
+        docs = tmp_path / "docs"
+        processor.phases1to3_pipelined(write_docs(docs, 0, 20))
+        paths = write_docs(docs, 0, 25)
+        calls = count_extractions(processor, monkeypatch)
+
+        results = processor.phases1to3_pipelined(paths, resume=True)
+
+        assert sorted(calls) == sorted(f"spec_{i}.md" for i in range(20, 25))
+        assert processor.phase_status["checkpoint"] == {"extracted": 5, "resumed": 20}
+        fresh = type(processor)(tmp_path / "fresh").phases1to3_pipelined(paths)
+        assert knowledge(results) == knowledge(fresh)
+
+    def test_interrupted_run_picks_up_where_it_stopped(self, processor, tmp_path,
+                                                        monkeypatch):
+        paths = write_docs(tmp_path / "docs", 0, 6)
+        process = processor._process_document
+
+        def interrupted(doc_path):
+            if doc_path.name == "spec_3.md":
+                raise Interrupted
+            return process(doc_path)
+
+        monkeypatch.setattr(processor, "_process_document", interrupted)
+        with pytest.raises(Interrupted):
+            processor.phases1to3_pipelined(paths)
+        assert len(processor.load_checkpoints()) == 3
+
+        monkeypatch.undo()
+        calls = count_extractions(processor, monkeypatch)
+        processor.phases1to3_pipelined(paths, resume=True)
+
+        assert calls == ["spec_3.md", "spec_4.md", "spec_5.md"]
+
+    def test_changed_and_moved_documents(self, processor, tmp_path, monkeypatch):
+        paths = write_docs(tmp_path / "docs", 0, 3)
+        processor.phases1to3_pipelined(paths)
+        paths[0].write_text("Anchor has Chain.\n")
+        moved = tmp_path / "docs" / "renamed.md"
+        paths[1].rename(moved)
+        calls = count_extractions(processor, monkeypatch)
+
+        results = processor.phases1to3_pipelined([paths[0], moved, paths[2]], resume=True)
+
+        assert calls == ["spec_0.md"]
+        sources = {e["source"] for e in results["extraction"]["extracted_entities"]}
+        assert sources == {str(paths[0]), str(moved), str(paths[2])}
+
+    def test_without_resume_everything_is_extracted(self, processor, tmp_path, monkeypatch):
+        paths = write_docs(tmp_path / "docs", 0, 4)
+        processor.phases1to3_pipelined(paths)
+        calls = count_extractions(processor, monkeypatch)
+
+        processor.phases1to3_pipelined(paths)
+
+        assert len(calls) == 4
+
+
+class TestCheckpointLog:
+
+    def test_truncated_last_line_is_ignored(self, processor, tmp_path):
+        paths = write_docs(tmp_path / "docs", 0, 2)
+        processor.phases1to3_pipelined(paths)
+        with open(processor.checkpoint_file, "a") as f:
+            f.write('{"hash": "abc", "pa')
+
+        assert len(processor.load_checkpoints()) == 2
+
+    def test_subset_runs_keep_other_checkpoints(self, processor, tmp_path, monkeypatch):
+        paths = write_docs(tmp_path / "docs", 0, 6)
+        processor.phases1to3_pipelined(paths)
+        new = write_docs(tmp_path / "docs", 6, 2)
+        processor.phases1to3_pipelined(new, resume=True)
+        calls = count_extractions(processor, monkeypatch)
+
+        processor.phases1to3_pipelined(paths + new, resume=True)
+
+        assert calls == []
+        assert len(processor.load_checkpoints()) == 8
+
+    def test_log_drops_deleted_and_superseded_entries(self, processor, tmp_path):
+        paths = write_docs(tmp_path / "docs", 0, 4)
+        processor.phases1to3_pipelined(paths)
+        paths[0].write_text("Anchor has Chain.\n")
+        paths[1].unlink()
+
+        processor.phases1to3_pipelined(paths[:1], resume=True)
+
+        entries = processor.load_checkpoints().values()
+        assert sorted(e["path"] for e in entries) == sorted(str(p) for p in
+                                                            (paths[0], paths[2], paths[3]))
+        with open(processor.checkpoint_file) as f:
+            assert len(f.readlines()) == 3
@@ -0,0 +1,76 @@
+"""
+Unit tests for the SQLite phase results store in create_module_agent.
+"""
+
+import pytest
+import yaml
+
+
+@pytest.fixture
+def processor(create_module_agent, tmp_path):
+    return create_module_agent.PhasedDocumentProcessor(tmp_path / "agent")
+
+
+@pytest.fixture
+def phase(create_module_agent):
+    return create_module_agent.ProcessingPhase.EXTRACTION
+
+
+def extraction_results(count):
+    entities = [{"name": f"Entity{i}", "type": "concept", "source": "a.md", "confidence": 0.7}
+                for i in range(count)]
+    return {
+        "extracted_entities": entities,
+        "extracted_relationships": [],
+        "knowledge_graph": {e["name"].lower(): {"entity": e, "connections": []}
+                            for e in entities},
+        "extraction_metrics": {"total_entities": count, "graph_nodes": count},
+        "source_mapping": {"a.md": {"entities": count, "relationships": 0}}
+    }
+
+
+class TestPhaseResultsStore:
+    """Phase results round-trip through SQLite with only a summary in YAML."""
+
+    def test_round_trip(self, processor, phase):
+        results = extraction_results(50)
+
+        processor._save_phase_results(phase, results)
+
+        assert processor._load_phase_results(phase) == results
+        assert processor.results_db.exists()
+        assert not (processor.phases_path / "extraction_results.yaml").exists()
+
+    def test_single_keys_can_be_loaded(self, processor, phase):
+        processor._save_phase_results(phase, extraction_results(5))
+
+        loaded = processor._load_phase_results(phase, keys=["extraction_metrics"])
+
+        assert loaded == {"extraction_metrics": {"total_entities": 5, "graph_nodes": 5}}
+
+    def test_summary_holds_metrics_and_counts(self, processor, phase):
+        processor._save_phase_results(phase, extraction_results(7))
+
+        summary = yaml.safe_load((processor.phases_path / "extraction_summary.yaml").read_text())
+
+        assert summary["metrics"] == {"extraction_metrics": {"total_entities": 7,
+                                                             "graph_nodes": 7}}
+        assert summary["counts"]["extracted_entities"] == 7
+        size = processor.phase_status["phase_metrics"]["extraction"]["result_size"]
+        assert size == summary["result_size"] > 0
+
+    def test_saving_again_replaces_previous_results(self, processor, phase):
+        processor._save_phase_results(phase, extraction_results(9))
+        processor._save_phase_results(phase, {"extraction_metrics": {"total_entities": 0}})
+
+        assert processor._load_phase_results(phase) == {
+            "extraction_metrics": {"total_entities": 0}}
+
+    def test_legacy_yaml_results_are_still_read(self, processor, phase):
+        legacy = extraction_results(3)
+        with open(processor.phases_path / "extraction_results.yaml", "w") as f:
+            yaml.dump(legacy, f)
+
+        assert processor._load_phase_results(phase) == legacy
+        assert processor._load_phase_results(phase, keys=["source_mapping"]) == {
+            "source_mapping": legacy["source_mapping"]}
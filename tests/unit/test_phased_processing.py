@@ -0,0 +1,105 @@
+"""
+Unit tests for the pipelined phases 1-3 in create_module_agent.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def documents(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    paths = []
+    for i in range(6):
+        path = docs / f"guide_{i}.md"
+        path.write_text(f"Riser{i} has Tension. The Mooring is Taut. Vessel contains Hull{i}.\n")
+        paths.append(path)
+    notes = docs / "notes.bin"
+    notes.write_bytes(b"Binary Notes")
+    return paths + [notes, docs / "missing.md"]
+
+
+def without_timestamps(results):
+    """Phase 1-3 results minus the per-run timestamps."""
+    discovery = dict(results["discovery"])
+    discovery["document_inventory"] = [
+        {k: v for k, v in info.items() if k != "discovered_at"}
+        for info in discovery["document_inventory"]
+    ]
+    extraction = dict(results["extraction"])
+    extraction["source_mapping"] = {
+        path: {k: v for k, v in mapping.items() if k != "extraction_time"}
+        for path, mapping in extraction["source_mapping"].items()
+    }
+    entity_key = lambda e: (e["source"], e["name"])
+    extraction["extracted_entities"] = sorted(extraction["extracted_entities"], key=entity_key)
+    extraction["knowledge_graph"] = {
+        key: {"entity": node["entity"]["name"], "connections": node["connections"]}
+        for key, node in extraction["knowledge_graph"].items()
+    }
+    return discovery, results["quality"], extraction
+
+
+def sequential(processor, documents):
+    discovery = processor.phase1_discovery(documents)
+    quality = processor.phase2_quality_assessment(discovery)
+    extraction = processor.phase3_extraction(quality, None)
+    return {"discovery": discovery, "quality": quality, "extraction": extraction}
+
+
+class TestPipelinedPhases:
+    """Pipelined phases 1-3 produce the same results as the sequential phases."""
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_matches_sequential_phases(self, create_module_agent, tmp_path, documents,
+                                       workers):
+        Processor = create_module_agent.PhasedDocumentProcessor
+        expected = sequential(Processor(tmp_path / "sequential"), documents)
+
+        pipelined = Processor(tmp_path / "pipelined").phases1to3_pipelined(documents, workers)
+
+        assert without_timestamps(pipelined) == without_timestamps(expected)
+        assert pipelined["discovery"]["total_documents"] == 8
+        assert len(pipelined["quality"]["filtered_documents"]) == 0
+        assert len(pipelined["extraction"]["source_mapping"]) == 7
+
+    def test_phase_results_and_status_are_saved(self, create_module_agent, tmp_path,
+                                                documents):
+        processor = create_module_agent.PhasedDocumentProcessor(tmp_path / "agent")
+
+        processor.phases1to3_pipelined(documents, workers=2)
+
+        saved = processor._load_phase_results(create_module_agent.ProcessingPhase.EXTRACTION)
+        assert saved["extraction_metrics"]["graph_nodes"] > 0
+        assert processor.phase_status["completed_phases"] == ["discovery", "quality",
+                                                              "extraction"]
+
+    def test_worker_errors_skip_the_document(self, create_module_agent, tmp_path, documents,
+                                             monkeypatch):
+        processor = create_module_agent.PhasedDocumentProcessor(tmp_path / "agent")
+        process = processor._process_document
+
+        def flaky(doc_path):
+            if doc_path.name == "guide_2.md":
+                raise OSError("unreadable")
+            return process(doc_path)
+
+        monkeypatch.setattr(processor, "_process_document", flaky)
+        results = processor.phases1to3_pipelined(documents, workers=1)
+
+        assert str(documents[2]) not in results["quality"]["quality_scores"]
+        assert len(results["extraction"]["source_mapping"]) == 6
+
+
+class TestProcessDocumentsPhased:
+
+    def test_workers_run_all_six_phases(self, create_module_agent, tmp_path, documents,
+                                        monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = create_module_agent.EnhancedDocumentationManager(tmp_path / "agents" / "demo")
+
+        results = manager.process_documents_phased(documents, "demo", workers=2)
+
+        assert list(results) == ["discovery", "quality", "extraction", "synthesis",
+                                 "validation", "integration"]
+        assert results["integration"]["integration_metrics"]["total_integrated"] > 0
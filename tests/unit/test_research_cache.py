@@ -0,0 +1,126 @@
+"""
+Unit tests for the TTL- and size-bounded ResearchCache in engineering_data_context.
+"""
+
+import time
+
+import pytest
+
+
+@pytest.fixture
+def store(engineering_data_context, tmp_path):
+    store = engineering_data_context.ContextStore(tmp_path / "context.db")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def make_cache(engineering_data_context, store):
+    def make(**kwargs):
+        cache = engineering_data_context.ResearchCache(store, **kwargs)
+        cache.init_schema()
+        return cache
+    return make
+
+
+def fill(cache, store, count: int):
+    cache.put([(f"h{i}", f"query {i}", {"summary": i}) for i in range(count)])
+    # Give entries distinct, increasing access times
+    for i in range(count):
+        store.execute("UPDATE research_cache SET accessed_at = ? WHERE query_hash = ?",
+                      (1000.0 + i, f"h{i}"))
+
+
+class TestResearchCache:
+    """Entries expire, are evicted by policy and keep lifetime stats."""
+
+    def test_get_and_put(self, make_cache):
+        cache = make_cache()
+        cache.put([("h", "riser", {"summary": "fatigue"})])
+
+        assert cache.get("h") == {"summary": "fatigue"}
+        assert cache.get("missing") is None
+
+    def test_expired_entries_are_misses_and_compacted(self, make_cache, store):
+        cache = make_cache(ttl_days=1)
+        cache.put([("old", "q", {}), ("new", "q", {})])
+        store.execute("UPDATE research_cache SET created_at = ? WHERE query_hash = 'old'",
+                      (time.time() - 2 * 86400,))
+
+        assert cache.get("old") is None
+        assert cache.get("new") == {}
+        assert cache.compact() == {"expired_removed": 1, "evicted": 0}
+        assert cache.stats()["entries"] == 1
+
+    def test_lru_evicts_least_recently_used(self, make_cache, store):
+        cache = make_cache(max_entries=3, policy="lru")
+        fill(cache, store, 5)
+
+        assert cache.compact()["evicted"] == 2
+        assert [row[0] for row in store.query("SELECT query_hash FROM research_cache "
+                                              "ORDER BY query_hash")] == ["h2", "h3", "h4"]
+
+    def test_lfu_evicts_least_frequently_used(self, make_cache, store):
+        cache = make_cache(max_entries=3, policy="lfu")
+        fill(cache, store, 5)
+        for query_hash in ("h0", "h0", "h1"):
+            cache.get(query_hash)
+        cache.flush()
+
+        cache.compact()
+        assert {row[0] for row in store.query("SELECT query_hash FROM research_cache")} == \
+            {"h0", "h1", "h4"}
+
+    def test_unknown_policy_is_rejected(self, engineering_data_context, store):
+        with pytest.raises(ValueError):
+            engineering_data_context.ResearchCache(store, policy="fifo")
+
+    def test_stats_persist_counters(self, make_cache, store):
+        cache = make_cache(max_entries=1)
+        cache.put([("a", "q", {}), ("b", "q", {})])
+        cache.get("a")
+        cache.get("zzz")
+        cache.compact()
+
+        stats = make_cache(max_entries=1).stats()  # a fresh instance reads persisted counters
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (0, 0, 1)
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+        assert stats["entries"] == 1
+
+    def test_hits_are_written_back_on_flush(self, make_cache, store):
+        cache = make_cache()
+        cache.put([("a", "q", {})])
+        cache.get("a")
+        cache.get("a")
+
+        assert store.query("SELECT hit_count FROM research_cache")[0][0] == 0
+        cache.flush()
+        assert store.query("SELECT hit_count FROM research_cache")[0][0] == 2
+
+    def test_background_compaction(self, make_cache, store):
+        cache = make_cache(max_entries=2)
+        fill(cache, store, 4)
+        cache.compact_in_background()
+        cache.wait()
+
+        assert cache.stats()["entries"] == 2
+
+    def test_clear(self, make_cache):
+        cache = make_cache()
+        cache.put([("a", "q", {}), ("b", "q", {})])
+
+        assert cache.clear() == 2
+        assert cache.get("a") is None
+
+    def test_legacy_cache_is_migrated(self, make_cache, store):
+        store.execute("CREATE TABLE research_cache (query_hash TEXT PRIMARY KEY, query TEXT, "
+                      "results TEXT, timestamp TEXT)")
+        store.execute("INSERT INTO research_cache VALUES ('h', 'q', '{\"a\": 1}', "
+                      "'2020-01-01T00:00:00')")
+
+        cache = make_cache(ttl_days=0)
+        assert cache.get("h") == {"a": 1}
+        created_at, hit_count = store.query("SELECT created_at, hit_count FROM research_cache")[0]
+        assert created_at == 1577836800.0
+        assert hit_count == 0
@@ -0,0 +1,164 @@
+"""
+Unit tests for asyncio research scheduling in engineering_data_context.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+def contexts(count: int):
+    return [SimpleNamespace(name=f"ctx{i}", web_research=None) for i in range(count)]
+
+
+class Backend:
+    """Counting research backend that fails on request."""
+
+    def __init__(self, engineering_data_context, fail=()):
+        self.local = engineering_data_context.LocalResearchBackend()
+        self.fail = set(fail)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, query):
+        with self.lock:
+            self.calls.append(query)
+        if query in self.fail:
+            raise RuntimeError("backend down")
+        return self.local(query)
+
+
+def scheduler(engineering_data_context, backend, cache=None, stored=None, **kwargs):
+    cache = {} if cache is None else cache
+    stored = [] if stored is None else stored
+    kwargs.setdefault("rate", 1000.0)
+    return engineering_data_context.ResearchScheduler(
+        backend, cache_lookup=cache.get, cache_store=lambda batch: stored.append(list(batch)),
+        **kwargs
+    )
+
+
+class TestTokenBucket:
+    """Acquisitions beyond the burst wait for refills."""
+
+    def test_rate_limits_after_the_burst(self, engineering_data_context):
+        async def acquire_all():
+            bucket = engineering_data_context.TokenBucket(rate=50.0, capacity=2)
+            start = time.monotonic()
+            for _ in range(7):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        # Two tokens are available at once, the other five arrive at 50/s
+        assert asyncio.run(acquire_all()) >= 5 / 50 * 0.9
+
+
+class TestResearchScheduler:
+    """Queries are coalesced, cached, checkpointed and isolated on failure."""
+
+    def test_identical_queries_are_fetched_once(self, engineering_data_context):
+        backend = Backend(engineering_data_context)
+        research = scheduler(engineering_data_context, backend, concurrency=4)
+        items = contexts(10)
+        research.run(items, lambda context: ["riser fatigue"])
+
+        assert backend.calls == ["riser fatigue"]
+        assert research.stats["coalesced"] == 9
+        assert all(c.web_research["riser fatigue"]["query"] == "riser fatigue" for c in items)
+
+    def test_cached_queries_skip_the_backend(self, engineering_data_context):
+        backend = Backend(engineering_data_context)
+        cache = {hashlib.md5(b"cached").hexdigest(): {"summary": "from cache"}}
+        research = scheduler(engineering_data_context, backend, cache=cache)
+        items = contexts(1)
+        research.run(items, lambda context: ["cached", "fresh"])
+
+        assert backend.calls == ["fresh"]
+        assert research.stats["cache_hits"] == 1
+        assert items[0].web_research["cached"] == {"summary": "from cache"}
+
+    def test_results_are_checkpointed_in_batches(self, engineering_data_context):
+        stored = []
+        research = scheduler(engineering_data_context, Backend(engineering_data_context),
+                             stored=stored, checkpoint_every=2, concurrency=1)
+        research.run(contexts(5), lambda context: [context.name])
+
+        assert [len(batch) for batch in stored] == [2, 2, 1]
+        assert sorted(query for batch in stored for _, query, _ in batch) == \
+            [f"ctx{i}" for i in range(5)]
+
+    def test_failed_queries_do_not_stop_the_run(self, engineering_data_context, capsys):
+        backend = Backend(engineering_data_context, fail={"ctx1"})
+        research = scheduler(engineering_data_context, backend)
+        items = contexts(3)
+        research.run(items, lambda context: [context.name])
+
+        assert research.stats["failed"] == 1
+        assert items[1].web_research is None
+        assert items[2].web_research is not None
+        assert "Research error for 'ctx1'" in capsys.readouterr().out
+
+    def test_concurrency_bounds_contexts_in_progress(self, engineering_data_context):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow(query):
+            with lock:
+                active.append(query)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(query)
+            return engineering_data_context.LocalResearchBackend()(query)
+
+        research = scheduler(engineering_data_context, slow, concurrency=3)
+        research.run(contexts(12), lambda context: [context.name])
+
+        assert max(peak) <= 3
+        assert research.stats["fetched"] == 12
+
+
+class TestGeneratorResearch:
+    """Deep research persists results to the cache for later runs."""
+
+    def test_second_run_is_served_from_the_cache(self, engineering_data_context, tmp_path,
+                                                 monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        backend = Backend(engineering_data_context)
+        generator = engineering_data_context.EngineeringDataContextGenerator(
+            base_path=tmp_path, research_backend=backend, research_rate=1000.0
+        )
+        first = contexts(2)
+        generator._research_specific_topics(first, ["calibration"])
+        second = contexts(2)
+        generator._research_specific_topics(second, ["calibration"])
+
+        assert sorted(backend.calls) == ["ctx0 calibration", "ctx1 calibration"]
+        assert [c.web_research for c in second] == [c.web_research for c in first]
+
+    def test_cache_is_compacted_once_per_scan(self, engineering_data_context, tmp_path,
+                                              monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        generator = engineering_data_context.EngineeringDataContextGenerator(
+            base_path=tmp_path, research_backend=Backend(engineering_data_context),
+            research_rate=1000.0
+        )
+        monkeypatch.setattr(type(generator), "BATCH_SIZE", 3)
+        data = tmp_path / "data"
+        data.mkdir()
+        for i in range(10):
+            (data / f"run_{i}.csv").write_text("x,y\n1,2\n")
+        compactions = []
+        compact = generator.research_cache.compact_in_background
+        monkeypatch.setattr(generator.research_cache, "compact_in_background",
+                            lambda: compactions.append(1) or compact())
+
+        generator.generate_context(data, deep_research=True)
+
+        assert compactions == [1]
+        assert generator.research_cache.stats()["entries"] > 0
@@ -0,0 +1,124 @@
+"""
+Unit tests for the bounded-memory JSON/YAML schema sampler in engineering_data_context.
+"""
+
+import io
+import json
+import random
+
+import pytest
+import yaml
+
+STRINGS = ["", "plain", 'quo"te', "back\\slash", "trailing\\", "br[ac]{es}", "ünïcode ✓",
+           "line\nbreak", "\\\"", "tab\t", "\u0001"]
+
+
+def reference_schema(data, depth: int = 0):
+    """The in-memory inference the sampler replaces (booleans before numbers)."""
+    if depth > 3:
+        return {"type": "unknown"}
+    if isinstance(data, dict):
+        return {"type": "object",
+                "properties": {k: reference_schema(v, depth + 1) for k, v in list(data.items())[:10]}}
+    if isinstance(data, list):
+        if data:
+            return {"type": "array", "items": reference_schema(data[0], depth + 1)}
+        return {"type": "array"}
+    if isinstance(data, str):
+        return {"type": "string"}
+    if isinstance(data, bool):
+        return {"type": "boolean"}
+    if isinstance(data, (int, float)):
+        return {"type": "number"}
+    return {"type": "null"}
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    kind = rng.choice(["object", "array", "scalar"] if depth < 6 else ["scalar"])
+    if kind == "object":
+        return {f"{rng.choice(STRINGS)}{i}": random_value(rng, depth + 1)
+                for i in range(rng.randint(0, 12 if depth < 2 else 3))}
+    if kind == "array":
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return rng.choice([rng.choice(STRINGS), rng.randint(-10 ** 6, 10 ** 6), rng.random() * 1e6,
+                       -2.5e-8, True, False, None])
+
+
+def sample_json(engineering_data_context, text: str, chunk_size: int):
+    sampler = engineering_data_context.StreamingSchemaSampler(io.StringIO(text))
+    sampler.CHUNK_SIZE = chunk_size
+    return sampler.sample_json()
+
+
+class TestSampleJson:
+    """The streamed schema matches in-memory inference over the same budget."""
+
+    @pytest.mark.parametrize("seed", range(30))
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_matches_in_memory_inference(self, engineering_data_context, seed, chunk_size):
+        rng = random.Random(seed)
+        data = random_value(rng)
+        text = json.dumps(data, indent=rng.choice([None, 2]), ensure_ascii=rng.random() < 0.5)
+
+        assert sample_json(engineering_data_context, text, chunk_size) == reference_schema(data)
+
+    def test_nested_arrays(self, engineering_data_context):
+        text = "[[[[[1]]], [2]], [[3]]]"
+
+        assert sample_json(engineering_data_context, text, 2) == reference_schema(json.loads(text))
+
+    def test_escaped_keys_are_decoded(self, engineering_data_context):
+        text = '{"a\\"b\\u00e9": 1, "c\\\\": "x\\"}"}'
+
+        assert sample_json(engineering_data_context, text, 3)["properties"] == {
+            'a"bé': {"type": "number"}, "c\\": {"type": "string"}
+        }
+
+    def test_stops_reading_once_the_sample_is_complete(self, engineering_data_context):
+        class Stream(io.StringIO):
+            reads = 0
+
+            def read(self, size=-1):
+                Stream.reads += 1
+                return super().read(size)
+
+        text = json.dumps([{"x": 1}] + [{"y": "z" * 100}] * 10_000)
+        sampler = engineering_data_context.StreamingSchemaSampler(Stream(text))
+        sampler.CHUNK_SIZE = 1024
+
+        assert sampler.sample_json() == reference_schema(json.loads(text))
+        assert Stream.reads == 1
+
+    @pytest.mark.parametrize("text", ['{"a": 1, "b": [1, 2', '{"a": "unterminated', '{"a": ', ""])
+    def test_truncated_input_raises(self, engineering_data_context, text):
+        with pytest.raises(ValueError):
+            sample_json(engineering_data_context, text, 4)
+
+    def test_truncation_after_the_sample_is_not_read(self, engineering_data_context):
+        # Only the first element of the outer array is sampled
+        assert sample_json(engineering_data_context, '[{"a": 1}, {"b": ', 4) == \
+            {"type": "array", "items": {"type": "object", "properties": {"a": {"type": "number"}}}}
+
+
+class TestSampleYaml:
+    """YAML is sampled from parser events with the same budget."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_in_memory_inference(self, engineering_data_context, seed):
+        data = random_value(random.Random(seed))
+        text = yaml.safe_dump(data, allow_unicode=True)
+        sampler = engineering_data_context.StreamingSchemaSampler(io.StringIO(text))
+
+        assert sampler.sample_yaml() == reference_schema(yaml.safe_load(text))
+
+    def test_only_the_first_document_is_sampled(self, engineering_data_context):
+        text = "a: 1\nb: [x, y]\n---\nc: true\n"
+        sampler = engineering_data_context.StreamingSchemaSampler(io.StringIO(text))
+
+        assert sampler.sample_yaml() == {"type": "object", "properties": {
+            "a": {"type": "number"}, "b": {"type": "array", "items": {"type": "string"}}
+        }}
+
+    def test_empty_document_is_null(self, engineering_data_context):
+        assert engineering_data_context.StreamingSchemaSampler(io.StringIO("")).sample_yaml() == \
+            {"type": "null"}
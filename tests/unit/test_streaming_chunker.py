@@ -0,0 +1,103 @@
+"""
+Unit tests for the single-pass streaming chunker in create_module_agent.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def manager(create_module_agent, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return create_module_agent.EnhancedDocumentationManager(tmp_path / "agents" / "demo")
+
+
+@pytest.fixture
+def strategy(create_module_agent):
+    return create_module_agent.ChunkingStrategy
+
+
+def words(count, word="stress"):
+    return " ".join(f"{word}{i}" for i in range(count))
+
+
+class TestPhasedChunking:
+    """Sections are chunked whole, by subsection, or through a word window."""
+
+    def test_small_sections_are_phase_one_chunks(self, manager):
+        content = "Intro text\n# Loads\nRiser loads\n## Fatigue\nS-N curves\n"
+
+        chunks = manager.chunk_document(content)
+
+        assert [(c["text"], c["phase"]) for c in chunks] == [
+            ("Intro text", 1), ("Riser loads", 1), ("S-N curves", 1)]
+        assert [c["id"] for c in chunks] == ["phased_0", "phased_1", "phased_2"]
+
+    @pytest.mark.parametrize("header", ["#", "## ", "#\t"])
+    def test_empty_header_keeps_the_next_line(self, manager, strategy, header):
+        content = f"Intro text\n{header}\nRiser loads\n# Fatigue\nS-N curves\n"
+
+        for chunking in (strategy.PHASED, strategy.HYBRID):
+            chunks = manager.chunk_document(content, chunking)
+
+            assert [c["text"] for c in chunks] == ["Intro text", "Riser loads", "S-N curves"]
+
+    def test_large_sections_split_on_subsections(self, manager):
+        body = (words(150) + "\n") * 4
+        content = "# Big\n" + "### A\n" + body + "### B\nshort\n"
+
+        chunks = manager.chunk_document(content)
+
+        phases = [c["phase"] for c in chunks]
+        assert phases[-1] == 2 and set(phases[:-1]) == {3} and len(phases) > 2
+        assert chunks[-1]["text"] == "short"
+
+    def test_word_window_overlaps(self, manager):
+        chunks = manager.chunk_document("# Long\n" + words(800) + "\n")
+
+        assert all(c["phase"] == 3 for c in chunks)
+        assert all(c["size"] >= 1500 for c in chunks[:-1])
+        first, second = chunks[0]["text"].split(), chunks[1]["text"].split()
+        assert first[-50:] == second[:50]
+
+    def test_offsets_point_at_source_text(self, manager):
+        content = "  Preamble here \n# Mooring\n" + words(600, "line") + "\n## End\nLast words\n"
+
+        chunks = manager.chunk_document(content)
+
+        for chunk in chunks:
+            source = content[chunk["start"]:chunk["end"]]
+            assert " ".join(source.split()) == chunk["text"]
+        assert content[chunks[0]["start"]:chunks[0]["end"]] == "Preamble here"
+
+    def test_hybrid_and_unsupported_strategies(self, manager, strategy):
+        content = "# A\n" + words(500) + "\n#### B\nTail\n"
+
+        hybrid = manager.chunk_document(content, strategy.HYBRID)
+
+        assert {c["strategy"] for c in hybrid} == {"hybrid"}
+        assert "phase" not in hybrid[0]
+        assert hybrid[-1]["text"] == "Tail"
+        assert manager.chunk_document(content, strategy.PARAGRAPH) == []
+
+
+class TestStreaming:
+
+    def test_chunks_are_yielded_before_input_is_exhausted(self, manager):
+        consumed = []
+
+        def lines():
+            for i in range(10000):
+                consumed.append(i)
+                yield words(20) + "\n"
+
+        stream = manager.iter_chunks(lines())
+        next(stream)
+
+        assert len(consumed) < 100
+
+    def test_chunk_file_matches_chunk_document(self, manager, tmp_path):
+        content = "Intro\n# Part\n" + (words(40) + "\n") * 200 + "## Notes\nDone\n"
+        doc = tmp_path / "standard.txt"
+        doc.write_text(content)
+
+        assert list(manager.chunk_file(doc)) == manager.chunk_document(content)
@@ -0,0 +1,119 @@
+"""
+Unit tests for token-budget chunking and tokenizers in create_module_agent.
+"""
+
+import pytest
+import yaml
+
+
+@pytest.fixture
+def manager(create_module_agent, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return create_module_agent.EnhancedDocumentationManager(tmp_path / "agents" / "demo")
+
+
+@pytest.fixture
+def strategy(create_module_agent):
+    return create_module_agent.ChunkingStrategy.TOKEN_BUDGET
+
+
+def document(lines):
+    return "".join(f"Line {i}: riser tension {i * 7} kN at station {i}.\n" for i in range(lines))
+
+
+class TestHeuristicTokenizer:
+
+    def test_counts_words_and_punctuation(self, create_module_agent):
+        tokenizer = create_module_agent.HeuristicTokenizer()
+
+        assert tokenizer.count("") == 0
+        assert tokenizer.count("riser") == 2
+        assert tokenizer.count("a, b.") == 4
+
+    def test_counts_add_across_whitespace(self, create_module_agent):
+        tokenizer = create_module_agent.HeuristicTokenizer()
+        first, second = "Mooring line 3: taut.", "Anchor (drag) = 12kN"
+
+        assert tokenizer.count(first + "\n" + second) == \
+            tokenizer.count(first) + tokenizer.count(second)
+
+    def test_base_tokenizer_is_abstract(self, create_module_agent):
+        with pytest.raises(TypeError):
+            create_module_agent.Tokenizer()
+
+
+class TestCachedTokenizer:
+
+    def test_repeated_text_hits_the_cache(self, create_module_agent):
+        calls = []
+
+        class Counting(create_module_agent.Tokenizer):
+            def count(self, text):
+                calls.append(text)
+                return len(text)
+
+        tokenizer = create_module_agent.CachedTokenizer(Counting(), max_entries=2)
+
+        assert [tokenizer.count(t) for t in ["ab", "abc", "ab", "abcd", "abc"]] == [2, 3, 2, 4, 3]
+        assert calls == ["ab", "abc", "abcd", "abc"]
+        assert (tokenizer.hits, tokenizer.misses) == (1, 4)
+
+
+class TestTokenBudgetChunking:
+    """Chunks pack lines up to, but never over, the token budget."""
+
+    def test_chunks_fill_the_budget(self, manager, strategy):
+        chunks = manager.chunk_document(document(200), strategy, max_tokens=100)
+        count = manager.tokenizer.count
+
+        assert all(c["tokens"] <= 100 for c in chunks)
+        assert all(c["tokens"] == count(c["text"]) for c in chunks)
+        line_tokens = count("Line 10: riser tension 70 kN at station 10.")
+        assert all(c["tokens"] > 100 - line_tokens - 2 for c in chunks[:-1])
+        assert sum(c["tokens"] for c in chunks) == count(document(200))
+
+    def test_offsets_and_text(self, manager, strategy):
+        content = document(30)
+
+        chunks = manager.chunk_document(content, strategy, max_tokens=60)
+
+        for chunk in chunks:
+            assert content[chunk["start"]:chunk["end"]] == chunk["text"]
+        assert chunks[0]["start"] == 0 and chunks[-1]["end"] == len(content) - 1
+
+    def test_long_lines_are_split_on_words(self, manager, strategy):
+        content = " ".join(f"word{i}" for i in range(300))
+
+        chunks = manager.chunk_document(content, strategy, max_tokens=50)
+
+        assert len(chunks) > 1
+        assert all(c["tokens"] <= 50 for c in chunks)
+        assert " ".join(c["text"] for c in chunks) == content
+
+    def test_default_budget_follows_agent_context_size(self, manager, strategy):
+        assert manager.chunk_token_budget() == 2000
+        with open(manager.agent_path / "agent.yaml", "w") as f:
+            yaml.dump({"processing_config": {"module_optimization": {"context_size": 4000}}}, f)
+
+        chunks = manager.chunk_document(document(400), strategy)
+
+        assert manager.chunk_token_budget() == 1000
+        assert max(c["tokens"] for c in chunks) <= 1000
+        assert len(chunks) > 1
+
+    def test_custom_tokenizer(self, create_module_agent, tmp_path, strategy):
+        class CharTokenizer(create_module_agent.Tokenizer):
+            name = "chars"
+
+            def count(self, text):
+                return len(text)
+
+        manager = create_module_agent.EnhancedDocumentationManager(tmp_path / "agent",
+                                                                   tokenizer=CharTokenizer())
+        chunks = manager.chunk_document("abcd\nefgh\nijkl\n", strategy, max_tokens=8)
+
+        assert [c["text"] for c in chunks] == ["abcd\nefgh", "ijkl"]
+
+    def test_invalid_budget(self, manager, strategy):
+        with pytest.raises(ValueError):
+            manager.chunk_document("text", strategy, max_tokens=-5)
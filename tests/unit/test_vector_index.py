@@ -0,0 +1,214 @@
+"""
+Unit tests for the local semantic vector index in create_module_agent.
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+TOPICS = {
+    "riser": "riser tension top tensioned riser stroke vortex induced vibration",
+    "mooring": "mooring line anchor chain catenary fairlead pretension",
+    "fatigue": "fatigue damage sn curve stress range cycle counting rainflow",
+    "welding": "weld toe butt weld fillet weld inspection defect porosity",
+}
+
+
+def corpus(count, seed=0):
+    rng = random.Random(seed)
+    filler = [f"word{i}" for i in range(3000)]
+    items = []
+    for i in range(count):
+        topic = list(TOPICS)[i % len(TOPICS)]
+        text = TOPICS[topic] + " " + " ".join(rng.choice(filler) for _ in range(30))
+        items.append((f"{topic}-{i}", text))
+    return items
+
+
+@pytest.fixture
+def embedder(create_module_agent):
+    return create_module_agent.HashingEmbedder(dim=256)
+
+
+class TestHashingEmbedder:
+
+    def test_vectors_are_normalised_and_stable(self, embedder):
+        vectors = embedder.embed(["riser tension", "riser tension", ""])
+
+        assert vectors.shape == (3, 256)
+        assert np.allclose(np.linalg.norm(vectors[:2], axis=1), 1.0)
+        assert np.array_equal(vectors[0], vectors[1])
+        assert not vectors[2].any()
+
+    def test_related_text_scores_higher(self, embedder):
+        query, related, unrelated = embedder.embed([
+            "mooring chain pretension", TOPICS["mooring"], TOPICS["welding"]])
+
+        assert query @ related > query @ unrelated
+
+    def test_base_embedder_is_abstract(self, create_module_agent):
+        with pytest.raises(TypeError):
+            create_module_agent.Embedder()
+
+
+class TestVectorIndex:
+    """Top-k lookups by exhaustive scoring or through the inverted file."""
+
+    def test_flat_search_finds_the_topic(self, create_module_agent, embedder, tmp_path):
+        index = create_module_agent.VectorIndex(tmp_path / "index", embedder)
+        stats = index.build(corpus(40))
+
+        hits = index.search("rainflow cycle counting of stress ranges", k=5)
+
+        assert stats["index"] == "flat" and stats["count"] == 40
+        assert len(hits) == 5
+        assert all(chunk_id.startswith("fatigue-") for chunk_id, _ in hits)
+        assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+
+    def test_ivf_matches_flat_search(self, create_module_agent, embedder, tmp_path):
+        items = corpus(400)
+        flat = create_module_agent.VectorIndex(tmp_path / "flat", embedder)
+        flat.build(items)
+        ivf = create_module_agent.VectorIndex(tmp_path / "ivf", embedder,
+                                              brute_force_limit=100, nprobe=20)
+        stats = ivf.build(items)
+
+        assert stats["index"] == "ivf" and stats["lists"] == 20
+        for query in TOPICS.values():
+            expected = flat.search(query, k=10)
+            hits = ivf.search(query, k=10)
+            assert np.allclose([s for _, s in hits], [s for _, s in expected], atol=1e-5)
+            assert hits[0][0] == expected[0][0]
+
+    def test_ivf_probes_few_lists(self, create_module_agent, embedder, tmp_path):
+        index = create_module_agent.VectorIndex(tmp_path / "ivf", embedder,
+                                                brute_force_limit=100, nprobe=2)
+        index.build(corpus(400))
+
+        hits = index.search(TOPICS["welding"], k=10)
+
+        assert sum(chunk_id.startswith("welding-") for chunk_id, _ in hits) >= 8
+
+    def test_rebuild_only_embeds_new_chunks(self, create_module_agent, embedder, tmp_path):
+        index = create_module_agent.VectorIndex(tmp_path / "index", embedder)
+        index.build(corpus(20))
+        reloaded = create_module_agent.VectorIndex(tmp_path / "index", embedder)
+
+        stats = reloaded.build(corpus(30))
+
+        assert len(reloaded) == 30 and stats["embedded"] == 10
+        assert reloaded.search(TOPICS["riser"], k=1) == index.search(TOPICS["riser"], k=1)
+
+    def test_appended_vectors_join_existing_lists(self, create_module_agent, embedder,
+                                                  tmp_path):
+        index = create_module_agent.VectorIndex(tmp_path / "ivf", embedder,
+                                                brute_force_limit=100, nprobe=2)
+        index.build(corpus(400))
+        centroids = np.array(index.centroids)
+
+        stats = index.build(corpus(440)[20:])
+
+        assert stats["embedded"] == 40 and len(index) == 420
+        assert np.array_equal(index.centroids, centroids)
+        assert index.list_offsets[-1] == 420 and np.all(np.diff(index.list_offsets) >= 0)
+        for chunk_id, _ in corpus(440)[400:]:
+            row = index.ids.index(chunk_id)
+            vector = index.vectors[row]
+            nearest = np.argmax(centroids @ vector)
+            assert index.list_offsets[nearest] <= row < index.list_offsets[nearest + 1]
+        assert index.search(corpus(440)[430][1], k=1)[0][0] == corpus(440)[430][0]
+
+    def test_outgrown_lists_are_reclustered(self, create_module_agent, embedder, tmp_path):
+        index = create_module_agent.VectorIndex(tmp_path / "ivf", embedder,
+                                                brute_force_limit=100)
+        index.build(corpus(400))
+
+        stats = index.build(corpus(2000))
+
+        assert stats["lists"] == len(index.centroids) == 44
+
+    def test_saves_do_not_disturb_mapped_readers(self, create_module_agent, embedder,
+                                                 tmp_path):
+        writer = create_module_agent.VectorIndex(tmp_path / "index", embedder)
+        writer.build(corpus(20))
+        reader = create_module_agent.VectorIndex(tmp_path / "index", embedder)
+        before = np.array(reader.vectors)
+
+        writer.build(corpus(30))
+
+        assert np.array_equal(reader.vectors, before)
+        assert len(create_module_agent.VectorIndex(tmp_path / "index", embedder)) == 30
+        assert len([p for p in (tmp_path / "index").iterdir() if p.is_dir()]) == 1
+
+    def test_interrupted_save_keeps_the_last_index(self, create_module_agent, embedder,
+                                                   tmp_path, monkeypatch):
+        index = create_module_agent.VectorIndex(tmp_path / "index", embedder)
+        index.build(corpus(20))
+
+        def crash(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(create_module_agent.json, "dump", crash)
+        with pytest.raises(OSError):
+            index.build(corpus(30))
+        monkeypatch.undo()
+
+        reloaded = create_module_agent.VectorIndex(tmp_path / "index", embedder)
+        assert len(reloaded) == len(reloaded.vectors) == 20
+
+    def test_other_embedder_starts_empty(self, create_module_agent, embedder, tmp_path):
+        create_module_agent.VectorIndex(tmp_path / "index", embedder).build(corpus(10))
+
+        other = create_module_agent.VectorIndex(tmp_path / "index",
+                                                create_module_agent.HashingEmbedder(dim=64))
+
+        assert len(other) == 0
+        assert other.search("riser", k=3) == []
+
+
+class TestRetrieve:
+
+    def test_agent_loads_only_relevant_chunks(self, create_module_agent, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = create_module_agent.EnhancedDocumentationManager(tmp_path / "agents" / "riser")
+        docs = []
+        for topic, text in TOPICS.items():
+            doc = tmp_path / f"{topic}.md"
+            doc.write_text((text + "\n") * 3)
+            docs.append(doc)
+
+        manager.ingest_documents(docs, max_tokens=20)
+        chunks = manager.retrieve("anchor chain at the fairlead")
+
+        # Repeated lines are one stored chunk, so each topic is indexed once
+        assert manager.registry["embeddings"]["count"] == len(manager.vector_index) == 4
+        assert len(chunks) == manager.CHUNKS_PER_CONTEXT
+        assert "fairlead" in chunks[0]["text"]
+        assert chunks[0]["score"] > chunks[1]["score"]
+
+        manager.remove_document_chunks(tmp_path / "mooring.md")
+        assert all("fairlead" not in c["text"] for c in manager.retrieve("fairlead", k=3))
+
+    def test_index_is_only_rebuilt_when_chunks_change(self, create_module_agent, tmp_path,
+                                                      monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = create_module_agent.EnhancedDocumentationManager(tmp_path / "agents" / "riser")
+        docs = []
+        for topic, text in TOPICS.items():
+            doc = tmp_path / f"{topic}.md"
+            doc.write_text(text + "\n")
+            docs.append(doc)
+        manager.ingest_documents(docs[:2], max_tokens=20)
+        builds = []
+        build = manager.vector_index.build
+        monkeypatch.setattr(manager.vector_index, "build",
+                            lambda items: builds.append(1) or build(items))
+
+        manager.ingest_documents(docs[:2], max_tokens=20)
+        assert builds == []
+
+        manager.ingest_documents(docs, max_tokens=20)
+        assert len(builds) == 1 and len(manager.vector_index) == 4